@@ -0,0 +1,97 @@
+# backend/app/cli/bench_csv_validation.py
+# Mide la validación del CSV del worker de importaciones (clean_file_chunks), serial contra
+# el pool de procesos, sobre un CSV sintético; no toca la base:
+#   python -m app.cli.bench_csv_validation [--rows 200000] [--workers 2 4] [--chunk-size 1000]
+#
+# El CSV trae nombres entre comillas con saltos de línea, phones repetidos e inválidos;
+# cada corrida debe producir los mismos items y rechazos que la serial (si no, sale con 1).
+# La aceleración depende de los núcleos libres: con os.cpu_count() == 1 el pool solo suma
+# el costo de IPC.
+import argparse
+import csv
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple
+
+from app.config.log import configure_logging, get_logger
+from app.core.use_cases.enroll_contacts import EnrollContacts
+from app.core.use_cases.enroll_contacts_csv import EnrollContactsCSV
+
+logger = get_logger(__name__)
+
+def _write_csv(path: str, rows: int, seed: int) -> None:
+    rnd = random.Random(seed)
+    with open(path, "w", encoding="utf-8", newline="") as fh:
+        writer = csv.writer(fh)
+        writer.writerow(["phone", "name", "attributes"])
+        for i in range(rows):
+            phone = f"09{rnd.randint(10_000_000, 99_999_999)}"
+            if i % 97 == 0:
+                phone = "no-es-un-phone"
+            name = f"Contacto {i}\nsegunda línea" if i % 10 == 0 else f"Contacto {i}"
+            writer.writerow([phone, name, json.dumps({"segment": i % 7, "ref": f"r-{i}"})])
+
+def _run(path: str, chunk_size: int, workers: int) -> Tuple[float, int, int, int]:
+    """Devuelve (segundos, items, rechazados, hash del resultado) de una pasada."""
+    uc = EnrollContactsCSV(EnrollContacts(None, "EC"))
+    rejected: List[int] = []
+    phones: List[str] = []
+    executor: Optional[ProcessPoolExecutor] = ProcessPoolExecutor(workers) if workers > 1 else None
+    try:
+        if executor is not None:
+            # Arranca los procesos fuera de la medición
+            list(executor.map(abs, range(workers)))
+        started = time.perf_counter()
+        with open(path, "rb") as fh:
+            chunks = uc.clean_file_chunks(
+                fh, "bench", chunk_size, lambda idx, ex: rejected.append(idx), executor, 2 * workers,
+            )
+            for _, chunk in chunks:
+                phones.extend(c["phone"] for c in chunk)
+        elapsed = time.perf_counter() - started
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    # Los chunks se agrupan distinto (por tramo en el pool): se compara la secuencia
+    return elapsed, len(phones), len(rejected), hash((tuple(phones), tuple(rejected)))
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Validación de CSV: serial vs pool de procesos")
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[2, 4])
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    configure_logging()
+    fd, path = tempfile.mkstemp(suffix=".csv")
+    os.close(fd)
+    try:
+        _write_csv(path, args.rows, args.seed)
+        baseline, items, rejected, expected = _run(path, args.chunk_size, 1)
+        logger.info(
+            "bench.csv_validation", workers=1, cpus=os.cpu_count(), items=items, rejected=rejected,
+            seconds=round(baseline, 3), rows_per_s=round(args.rows / baseline),
+        )
+        status = 0
+        for workers in args.workers:
+            elapsed, _, _, got = _run(path, args.chunk_size, workers)
+            if got != expected:
+                logger.error("bench.csv_validation.mismatch", workers=workers)
+                status = 1
+            logger.info(
+                "bench.csv_validation", workers=workers, cpus=os.cpu_count(),
+                seconds=round(elapsed, 3), rows_per_s=round(args.rows / elapsed),
+                speedup=round(baseline / elapsed, 2),
+            )
+        return status
+    finally:
+        os.remove(path)
+
+if __name__ == "__main__":
+    sys.exit(main())
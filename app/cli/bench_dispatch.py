@@ -0,0 +1,137 @@
+# backend/app/cli/bench_dispatch.py
+# Compara el lease SQL (lease_due) con el scheduler en memoria (DueContactScheduler) sobre
+# una campaña real:
+#   python -m app.cli.bench_dispatch --campaign ID [--batch 50] [--rounds 200] [--workers 1]
+#
+# Cada lease se revierte: la base queda como estaba y los dos caminos ven los mismos
+# contactos. El camino SQL vuelve a competir por los primeros vencidos (SKIP LOCKED entre
+# hilos); el scheduler ya los sacó del heap y avanza, así que la campaña debe estar
+# despachable (Active, en ventana) y tener al menos batch * rounds * workers contactos
+# vencidos. La carga inicial del scheduler se mide aparte, igual que changes_since
+# (la sincronización incremental).
+import argparse
+import sys
+import threading
+import time
+from datetime import timedelta
+from typing import Callable, List
+
+from app.config.log import configure_logging, get_logger
+from app.config.settings import get_settings
+from app.infrastructure.db.models import load_all_models
+from app.infrastructure.db.session import SessionLocal
+from app.infrastructure.dispatch.due_scheduler import DueContactScheduler
+from app.infrastructure.repositories.campaign_contact_repository_sqlalchemy import CampaignContactRepositorySQLAlchemy
+from app.security.auth import now_utc
+
+logger = get_logger(__name__)
+
+def _percentile(samples: List[float], p: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(p * len(ordered)))] if ordered else 0.0
+
+def _run(name: str, lease: Callable[[CampaignContactRepositorySQLAlchemy], int], rounds: int, workers: int) -> int:
+    """
+    `workers` hilos, cada uno con su sesión, corren hasta `rounds` leases (cortan si uno
+    vuelve vacío). Cada lease es una transacción que se revierte en lugar del commit del
+    dialer; la latencia incluye ese cierre. Loguea latencias en ms.
+    """
+    samples: List[float] = []
+    leased: List[int] = []
+    barrier = threading.Barrier(workers)
+
+    def worker() -> None:
+        db = SessionLocal()
+        try:
+            repo = CampaignContactRepositorySQLAlchemy(db)
+            mine: List[float] = []
+            total = 0
+            barrier.wait()
+            for _ in range(rounds):
+                started = time.perf_counter()
+                got = lease(repo)
+                db.rollback()
+                mine.append(time.perf_counter() - started)
+                total += got
+                if not got:
+                    break
+            samples.extend(mine)
+            leased.append(total)
+        finally:
+            db.close()
+
+    threads = [threading.Thread(target=worker) for _ in range(workers)]
+    started = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - started
+    logger.info(
+        "bench.dispatch",
+        path=name, workers=workers, rounds=len(samples), leased=sum(leased),
+        p50_ms=round(_percentile(samples, 0.50) * 1000, 3),
+        p99_ms=round(_percentile(samples, 0.99) * 1000, 3),
+        contacts_per_s=round(sum(leased) / elapsed),
+    )
+    return sum(leased)
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Lease SQL vs scheduler en memoria sobre una campaña")
+    parser.add_argument("--campaign", type=int, required=True, help="campaña despachable con contactos vencidos")
+    parser.add_argument("--batch", type=int, default=50, help="contactos por lease")
+    parser.add_argument("--rounds", type=int, default=200, help="leases por hilo y camino")
+    parser.add_argument("--workers", type=int, default=1, help="dialers concurrentes (una sesión por hilo)")
+    parser.add_argument("--max-attempts", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    configure_logging()
+    load_all_models()
+    settings = get_settings()
+    campaign_id, n = args.campaign, args.batch
+
+    def lease_sql(repo: CampaignContactRepositorySQLAlchemy) -> int:
+        now = now_utc()
+        return len(repo.lease_due(campaign_id, n, args.max_attempts, now, now + timedelta(minutes=5)))
+
+    sql_leased = _run("sql", lease_sql, args.rounds, args.workers)
+
+    # sync_seconds alto: las rondas miden el heap, la sincronización se mide aparte
+    scheduler = DueContactScheduler(settings.DISPATCH_SCHEDULER_PAGE_SIZE, sync_seconds=3600)
+
+    def lease_scheduler(repo: CampaignContactRepositorySQLAlchemy) -> int:
+        now = now_utc()
+        return len(scheduler.lease(repo, campaign_id, n, args.max_attempts, now, now + timedelta(minutes=5)))
+
+    db = SessionLocal()
+    try:
+        repo = CampaignContactRepositorySQLAlchemy(db)
+        started = time.perf_counter()
+        scheduler.reconcile(repo, campaign_id, now_utc())
+        logger.info("bench.dispatch.load", path="scheduler", load_ms=round((time.perf_counter() - started) * 1000, 3))
+        db.rollback()
+        scheduler_leased = _run("scheduler", lease_scheduler, args.rounds, args.workers)
+
+        watermark = repo.change_watermark()
+        samples: List[float] = []
+        for _ in range(20):
+            started = time.perf_counter()
+            changes, _next = repo.changes_since(campaign_id, watermark)
+            samples.append(time.perf_counter() - started)
+        logger.info(
+            "bench.dispatch.sync",
+            changes=len(changes),
+            p50_ms=round(_percentile(samples, 0.50) * 1000, 3),
+            p99_ms=round(_percentile(samples, 0.99) * 1000, 3),
+        )
+        db.rollback()
+    finally:
+        db.close()
+
+    if not sql_leased or not scheduler_leased:
+        logger.warning("bench.dispatch.empty", campaign_id=campaign_id, sql=sql_leased, scheduler=scheduler_leased)
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
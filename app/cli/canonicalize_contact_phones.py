@@ -0,0 +1,63 @@
+# backend/app/cli/canonicalize_contact_phones.py
+# Normaliza a E.164 los phones ya guardados y fusiona los contactos que quedan repetidos:
+#   python -m app.cli.canonicalize_contact_phones [--campaign ID] [--dry-run] [--chunk-size N]
+#
+# Sin --campaign recorre todas las campañas (menos las que están en 'Deleting'). Conviene
+# correrlo con la campaña pausada: un contacto fusionado que estaba en Dialing se borra
+# y el resultado de esa llamada ya no se registra.
+import argparse
+import sys
+
+from app.config.log import configure_logging, get_logger
+from app.core.domain.phone import region_for_campaign
+from app.core.use_cases.canonicalize_contact_phones import CanonicalizeContactPhones
+from app.infrastructure.db.models import load_all_models
+from app.infrastructure.db.session import SessionLocal
+from app.infrastructure.repositories.campaign_contact_repository_sqlalchemy import CampaignContactRepositorySQLAlchemy
+from app.infrastructure.repositories.campaign_repository_sqlalchemy import CampaignRepositorySQLAlchemy
+
+logger = get_logger(__name__)
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Normalizar a E.164 los phones de contactos existentes")
+    parser.add_argument("--campaign", type=int, default=None, help="solo esta campaña (por defecto todas)")
+    parser.add_argument("--dry-run", action="store_true", help="contar sin guardar (una sola transacción, se revierte)")
+    parser.add_argument("--chunk-size", type=int, default=5000, help="contactos por transacción")
+    args = parser.parse_args(argv)
+
+    configure_logging()
+    load_all_models()
+    db = SessionLocal()
+    try:
+        campaign_repo = CampaignRepositorySQLAlchemy(db)
+        if args.campaign is not None:
+            campaign = campaign_repo.get(args.campaign)
+            if campaign is None:
+                logger.error("contacts.canonicalize.not_found", campaign_id=args.campaign)
+                return 1
+            campaigns = [campaign]
+        else:
+            campaigns, after = [], None
+            while page := campaign_repo.list(None, 500, 0, after):
+                campaigns.extend(page)
+                after = page[-1].campaign_id
+
+        # En dry-run nada se confirma: los chunks siguientes ven las fusiones de los anteriores
+        commit = (lambda: None) if args.dry_run else db.commit
+        uc = CanonicalizeContactPhones(CampaignContactRepositorySQLAlchemy(db), commit)
+        renamed = merged = 0
+        for campaign in campaigns:
+            result = uc(campaign.campaign_id, region_for_campaign(campaign.timezone, campaign.config), args.chunk_size)
+            renamed, merged = renamed + result["renamed"], merged + result["merged"]
+        if args.dry_run:
+            db.rollback()
+        logger.info(
+            "contacts.canonicalized",
+            campaigns=len(campaigns), renamed=renamed, merged=merged, applied=not args.dry_run,
+        )
+        return 0
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,140 @@
+# backend/app/cli/explain_hot_paths.py
+# Verifica con EXPLAIN que las consultas calientes de campaign_contacts usan sus índices
+# (migraciones 0002 y 0003). Sale con 1 si alguna no usa el índice esperado:
+#   python -m app.cli.explain_hot_paths --campaign ID [--phone +593...] [--force-index]
+#
+# El SQL no se escribe aquí: se captura de los métodos reales del repositorio (el
+# listener corta la ejecución antes de llegar a la base) y se pasa por EXPLAIN con los
+# mismos parámetros. Con tablas chicas el planner prefiere Seq Scan; --force-index
+# (enable_seqscan = off) comprueba que el índice al menos es aplicable.
+import argparse
+import sys
+from datetime import timedelta
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+from sqlalchemy import event, text
+
+from app.config.log import configure_logging, get_logger
+from app.infrastructure.db.models import load_all_models
+from app.infrastructure.db.session import SessionLocal, engine
+from app.infrastructure.repositories.campaign_contact_repository_sqlalchemy import CampaignContactRepositorySQLAlchemy
+from app.security.auth import now_utc
+
+logger = get_logger(__name__)
+
+_TABLE = "campaign_contacts"
+_DEFAULT_PARTITION = "campaign_contacts_default"
+
+class _Captured(Exception):
+    pass
+
+def _capture(call: Callable[[], Any]) -> Tuple[str, Any]:
+    """Primera sentencia que emite `call`, sin ejecutarla."""
+    captured: List[Tuple[str, Any]] = []
+
+    def before(conn, cursor, statement, parameters, context, executemany):
+        captured.append((statement, parameters))
+        raise _Captured()
+
+    event.listen(engine, "before_cursor_execute", before)
+    try:
+        call()
+    except _Captured:
+        pass
+    finally:
+        event.remove(engine, "before_cursor_execute", before)
+    if not captured:
+        raise RuntimeError("the repository call did not emit SQL")
+    return captured[0]
+
+def _nodes(plan: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    yield plan
+    for child in plan.get("Plans", ()):
+        yield from _nodes(child)
+
+def _explain(statement: str, parameters: Any, force_index: bool) -> Tuple[Dict[str, Any], Dict[str, str]]:
+    """Plan y, para cada índice del plan, el índice de la tabla padre (particiones)."""
+    with engine.connect() as conn:
+        with conn.begin():
+            if force_index:
+                conn.exec_driver_sql("SET LOCAL enable_seqscan = off")
+            plan = conn.exec_driver_sql("EXPLAIN (FORMAT JSON) " + statement, parameters).scalar()[0]["Plan"]
+            names = sorted({n["Index Name"] for n in _nodes(plan) if "Index Name" in n})
+            parents = dict(conn.execute(
+                text(
+                    "SELECT c.relname, coalesce(p.relname, c.relname) FROM pg_class c "
+                    "LEFT JOIN pg_inherits i ON i.inhrelid = c.oid "
+                    "LEFT JOIN pg_class p ON p.oid = i.inhparent "
+                    "WHERE c.relname = ANY(:names)"
+                ),
+                {"names": names},
+            ).all()) if names else {}
+    return plan, parents
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="EXPLAIN de list, get_by_phone y dispatch sobre campaign_contacts")
+    parser.add_argument("--campaign", type=int, required=True, help="campaña con datos representativos")
+    parser.add_argument("--phone", default="+593990000000", help="teléfono para get_by_phone")
+    parser.add_argument("--force-index", action="store_true", help="enable_seqscan = off (bases chicas o vacías)")
+    args = parser.parse_args(argv)
+
+    configure_logging()
+    load_all_models()
+    now = now_utc()
+    campaign_id = args.campaign
+
+    # (nombre, llamada al repositorio, índices aceptados)
+    checks: List[Tuple[str, Callable[[CampaignContactRepositorySQLAlchemy], Any], set]] = [
+        ("contacts.list",
+         lambda r: r.list(campaign_id, None, None, 50, 0),
+         {"ix_campaign_contacts_campaign_id_desc"}),
+        ("contacts.list_keyset",
+         lambda r: r.list(campaign_id, None, None, 50, 0, after=2**31 - 1),
+         {"ix_campaign_contacts_campaign_id_desc"}),
+        ("contacts.list_status",
+         lambda r: r.list(campaign_id, None, "Pending", 50, 0),
+         {"ix_campaign_contacts_campaign_id_desc", "ix_campaign_contacts_campaign_status_next",
+          "ix_campaign_contacts_due"}),
+        ("contacts.get_by_phone",
+         lambda r: r.get_by_phone(campaign_id, args.phone),
+         {"uq_campaign_contacts_campaign_phone"}),
+        ("dispatch.lease_due",
+         lambda r: r.lease_due(campaign_id, 100, 3, now, now + timedelta(minutes=5)),
+         {"ix_campaign_contacts_due"}),
+        # Desde PostgreSQL 18 el planner también puede usar (campaign_id, status, next_attempt_at)
+        # con skip scan sobre campaign_id: igual de acotado que el parcial
+        ("sweeper.release_expired_leases",
+         lambda r: r.release_expired_leases(now, 5000),
+         {"ix_campaign_contacts_dialing_lease", "ix_campaign_contacts_campaign_status_next"}),
+    ]
+
+    failed = 0
+    db = SessionLocal()
+    try:
+        repo = CampaignContactRepositorySQLAlchemy(db)
+        for name, call, expected in checks:
+            statement, parameters = _capture(lambda: call(repo))
+            db.rollback()
+            plan, parents = _explain(statement, parameters, args.force_index)
+            nodes = list(_nodes(plan))
+            # Con CONTACTS_PARTITIONING las relaciones son campaign_contacts_c<id>/_default
+            used = {parents.get(n["Index Name"], n["Index Name"]) for n in nodes if "Index Name" in n}
+            # La partición DEFAULT queda vacía por diseño: su Seq Scan no lee filas
+            seq_scan = any(
+                n["Node Type"] == "Seq Scan" and n.get("Relation Name", "").startswith(_TABLE)
+                and n.get("Relation Name") != _DEFAULT_PARTITION
+                for n in nodes
+            )
+            ok = bool(used & expected) and not seq_scan
+            failed += not ok
+            (logger.info if ok else logger.warning)(
+                "explain.ok" if ok else "explain.missing_index",
+                check=name, indexes=sorted(used), expected=sorted(expected),
+                seq_scan=seq_scan, total_cost=plan.get("Total Cost"),
+            )
+    finally:
+        db.close()
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
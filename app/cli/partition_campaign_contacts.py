@@ -0,0 +1,51 @@
+# backend/app/cli/partition_campaign_contacts.py
+# Convierte callbot.campaign_contacts en particionada por campaña, o la revierte con --revert:
+#   python -m app.cli.partition_campaign_contacts [--revert]
+#
+# Base en head (alembic upgrade head). Toma ACCESS EXCLUSIVE sobre campaign_contacts mientras
+# copia las filas: requiere ventana de mantenimiento con la API y los workers detenidos.
+# Todo corre en una transacción. Al terminar, CONTACTS_PARTITIONING debe coincidir con el
+# nuevo estado (true tras convertir, false tras revertir) antes de volver a levantarlos.
+import argparse
+import sys
+import time
+
+from app.config.log import configure_logging, get_logger
+from app.config.settings import get_settings
+from app.infrastructure.db.partitioning import contacts_partitioned, convert_contacts_table
+from app.infrastructure.db.session import SessionLocal
+
+logger = get_logger(__name__)
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Particionar campaign_contacts por campaña (o revertirlo)")
+    parser.add_argument("--revert", action="store_true", help="volver a una tabla sin particionar")
+    args = parser.parse_args(argv)
+
+    configure_logging()
+    target = not args.revert
+    db = SessionLocal()
+    try:
+        if contacts_partitioned(db) == target:
+            logger.warning("contacts_partitioning.unchanged", partitioned=target)
+            return 0
+        started = time.perf_counter()
+        convert_contacts_table(db, target)
+        db.commit()
+        logger.info(
+            "contacts_partitioning.converted",
+            partitioned=target, seconds=round(time.perf_counter() - started, 1),
+        )
+    except Exception:
+        db.rollback()
+        logger.exception("contacts_partitioning.failed", partitioned=target)
+        return 1
+    finally:
+        db.close()
+
+    if get_settings().CONTACTS_PARTITIONING != target:
+        logger.warning("contacts_partitioning.flag_mismatch", set_to=str(target).lower())
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,40 @@
+# backend/app/cli/reconcile_contact_stats.py
+# Recalcula los contadores callbot.campaign_contact_stats desde campaign_contacts:
+#   python -m app.cli.reconcile_contact_stats [--campaign ID] [--dry-run]
+import argparse
+import sys
+
+from app.config.log import configure_logging, get_logger
+from app.infrastructure.db.models import load_all_models
+from app.infrastructure.db.session import SessionLocal
+from app.infrastructure.repositories.campaign_stats_repository_sqlalchemy import CampaignStatsRepositorySQLAlchemy
+
+logger = get_logger(__name__)
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Reconciliar contadores de contactos por status")
+    parser.add_argument("--campaign", type=int, default=None, help="solo esta campaña (por defecto todas)")
+    parser.add_argument("--dry-run", action="store_true", help="reportar el drift sin corregirlo")
+    args = parser.parse_args(argv)
+
+    configure_logging()
+    load_all_models()
+    db = SessionLocal()
+    try:
+        drift = CampaignStatsRepositorySQLAlchemy(db).reconcile(args.campaign, apply=not args.dry_run)
+        for campaign_id, status, stored, actual in drift:
+            logger.warning(
+                "contact_stats.drift",
+                campaign_id=campaign_id, status=status, stored=stored, actual=actual,
+            )
+        if args.dry_run:
+            db.rollback()
+        else:
+            db.commit()
+        logger.info("contact_stats.reconciled", campaign_id=args.campaign, drift=len(drift), applied=not args.dry_run)
+        return 1 if drift and args.dry_run else 0
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    sys.exit(main())
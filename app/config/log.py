@@ -0,0 +1,95 @@
+# backend/app/config/log.py
+"""
+Logging estructurado para casos de uso y repositorios.
+
+- get_logger(name).info("evento", campo=valor, ...): los campos viajan en el
+  LogRecord y solo se formatean si el nivel está habilitado (sin f-strings).
+- RowSampler: registra 1 de cada N filas en caminos calientes (enrolamiento),
+  según ENROLL_LOG_SAMPLE_RATE; los resúmenes por lote se registran siempre.
+- configure_logging(): nivel y formato (text | json) desde Settings.
+"""
+import json
+import logging
+from typing import Any, Dict, Optional
+from app.config.settings import Settings, get_settings
+
+class StructLogger:
+    def __init__(self, name: str):
+        self._logger = logging.getLogger(name)
+
+    def is_enabled(self, level: int = logging.INFO) -> bool:
+        return self._logger.isEnabledFor(level)
+
+    def debug(self, event: str, **fields: Any) -> None:
+        self._log(logging.DEBUG, event, fields)
+
+    def info(self, event: str, **fields: Any) -> None:
+        self._log(logging.INFO, event, fields)
+
+    def warning(self, event: str, **fields: Any) -> None:
+        self._log(logging.WARNING, event, fields)
+
+    def error(self, event: str, **fields: Any) -> None:
+        self._log(logging.ERROR, event, fields)
+
+    def exception(self, event: str, **fields: Any) -> None:
+        self._log(logging.ERROR, event, fields, exc_info=True)
+
+    def _log(self, level: int, event: str, fields: Dict[str, Any], exc_info: bool = False) -> None:
+        if self._logger.isEnabledFor(level):
+            self._logger.log(level, event, extra={"fields": fields}, exc_info=exc_info, stacklevel=3)
+
+def get_logger(name: str) -> StructLogger:
+    return StructLogger(name)
+
+class RowSampler:
+    """Decide qué filas se registran: rate=0 ninguna, rate=1 todas, rate=0.01 una de cada 100."""
+    def __init__(self, rate: Optional[float] = None):
+        self._rate = rate
+        self._every: Optional[int] = None
+
+    @property
+    def every(self) -> int:
+        if self._every is None:
+            rate = self._rate if self._rate is not None else get_settings().ENROLL_LOG_SAMPLE_RATE
+            self._every = round(1 / rate) if rate > 0 else 0
+        return self._every
+
+    def sampled(self, idx: int) -> bool:
+        every = self.every
+        return every > 0 and idx % every == 0
+
+class _KeyValueFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        line = super().format(record)
+        fields = getattr(record, "fields", None)
+        if fields:
+            line += " " + " ".join(f"{k}={v!r}" for k, v in fields.items())
+        return line
+
+class _JsonFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "ts": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "event": record.getMessage(),
+            **(getattr(record, "fields", None) or {}),
+        }
+        if record.exc_info:
+            payload["exc"] = self.formatException(record.exc_info)
+        return json.dumps(payload, default=str, ensure_ascii=False)
+
+def configure_logging(settings: Optional[Settings] = None) -> None:
+    settings = settings or get_settings()
+    handler = logging.StreamHandler()
+    if settings.LOG_FORMAT == "json":
+        handler.setFormatter(_JsonFormatter())
+    else:
+        handler.setFormatter(_KeyValueFormatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+    # "__main__": workers y CLIs corridos con python -m app.workers.X registran con ese nombre
+    for name in ("app", "__main__"):
+        app_logger = logging.getLogger(name)
+        app_logger.handlers[:] = [handler]
+        app_logger.setLevel(settings.LOG_LEVEL.upper())
+        app_logger.propagate = False
@@ -16,6 +16,57 @@ class Settings:
     REFRESH_TTL = timedelta(days=int(os.getenv("REFRESH_TTL_DAYS", "15")))
     JWT_ISS: str = os.getenv("JWT_ISS", "bk-robot")
     JWT_AUD: str = os.getenv("JWT_AUD", "bk-robot-clients")
+    # Tokens de acceso ya verificados en memoria (por proceso) hasta su exp; 0 desactiva
+    JWT_CACHE_SIZE: int = int(os.getenv("JWT_CACHE_SIZE", "4096"))
+    # Logging: nivel, formato (text | json) y muestreo por fila del enrolamiento (0 = sin logs por fila)
+    LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
+    LOG_FORMAT: str = os.getenv("LOG_FORMAT", "text")
+    ENROLL_LOG_SAMPLE_RATE: float = float(os.getenv("ENROLL_LOG_SAMPLE_RATE", "0"))
+    # Tamaño de lote para el upsert masivo de contactos (filas por sentencia)
+    CONTACTS_UPSERT_CHUNK_SIZE: int = int(os.getenv("CONTACTS_UPSERT_CHUNK_SIZE", "1000"))
+    # A partir de este número de filas un CSV se importa por COPY + tabla temporal (0 = desactivado)
+    CONTACTS_COPY_THRESHOLD: int = int(os.getenv("CONTACTS_COPY_THRESHOLD", "50000"))
+    # Procesos del worker de importaciones que validan el CSV en paralelo (1 = validación serial)
+    IMPORT_VALIDATION_WORKERS: int = max(1, int(os.getenv("IMPORT_VALIDATION_WORKERS", "1")))
+    # Filas por lote al exportar contactos (cursor del lado del servidor)
+    CONTACTS_EXPORT_BATCH_SIZE: int = int(os.getenv("CONTACTS_EXPORT_BATCH_SIZE", "2000"))
+    # Importaciones asíncronas: carpeta compartida API/worker y frecuencia de polling del worker
+    IMPORT_SPOOL_DIR: str = os.getenv("IMPORT_SPOOL_DIR", "/tmp/contact_imports")
+    IMPORT_WORKER_POLL_SECONDS: float = float(os.getenv("IMPORT_WORKER_POLL_SECONDS", "2"))
+    # Presupuesto de SQL por request: sentencias máximas, repeticiones que cuentan como N+1
+    # y modo estricto (tests) que falla al superar el presupuesto en lugar de solo registrarlo
+    SQL_QUERY_BUDGET: int = int(os.getenv("SQL_QUERY_BUDGET", "50"))
+    SQL_N_PLUS_ONE_THRESHOLD: int = int(os.getenv("SQL_N_PLUS_ONE_THRESHOLD", "10"))
+    SQL_BUDGET_STRICT: bool = os.getenv("SQL_BUDGET_STRICT", "false").lower() in ("1", "true", "yes")
+    # Purga de campañas borradas: contactos por transacción y espera del worker sin trabajo
+    CAMPAIGN_PURGE_CHUNK_SIZE: int = int(os.getenv("CAMPAIGN_PURGE_CHUNK_SIZE", "5000"))
+    CAMPAIGN_PURGE_POLL_SECONDS: float = float(os.getenv("CAMPAIGN_PURGE_POLL_SECONDS", "5"))
+    # Filas por (campaña, status) de campaign_contact_stats: cada conexión suma en la suya,
+    # así los leases/outcomes concurrentes de una campaña no se serializan en un solo lock
+    CONTACT_STATS_SHARDS: int = max(1, int(os.getenv("CONTACT_STATS_SHARDS", "16")))
+    # Filas por UPDATE (y por transacción) en POST /campaigns/{id}/contacts/bulk
+    CONTACTS_BULK_CHUNK_SIZE: int = int(os.getenv("CONTACTS_BULK_CHUNK_SIZE", "5000"))
+    # campaign_contacts particionada por campaña (app.cli.partition_campaign_contacts): cada
+    # campaña nueva crea su partición y el purgador la elimina entera. Debe coincidir con el
+    # estado de la base
+    CONTACTS_PARTITIONING: bool = os.getenv("CONTACTS_PARTITIONING", "false").lower() in ("1", "true", "yes")
+    # Duración del lease de /dispatch/lease: si el dialer no reporta antes, el contacto se libera
+    DISPATCH_LEASE_SECONDS: int = int(os.getenv("DISPATCH_LEASE_SECONDS", "300"))
+    # Scheduler en memoria para /dispatch/lease (heap por campaña): carga por páginas,
+    # sincronización incremental y reconciliación periódica contra la base
+    DISPATCH_SCHEDULER_ENABLED: bool = os.getenv("DISPATCH_SCHEDULER_ENABLED", "false").lower() in ("1", "true", "yes")
+    DISPATCH_SCHEDULER_PAGE_SIZE: int = int(os.getenv("DISPATCH_SCHEDULER_PAGE_SIZE", "10000"))
+    DISPATCH_SCHEDULER_SYNC_SECONDS: float = float(os.getenv("DISPATCH_SCHEDULER_SYNC_SECONDS", "2"))
+    DISPATCH_SCHEDULER_RECONCILE_SECONDS: float = float(os.getenv("DISPATCH_SCHEDULER_RECONCILE_SECONDS", "300"))
+    # Límites de despacho (campaign.config max_cps/max_concurrent): "db" comparte el bucket
+    # entre procesos (fila bloqueada por lease); "local" lo guarda en memoria (una réplica)
+    DISPATCH_LIMITER_BACKEND: str = os.getenv("DISPATCH_LIMITER_BACKEND", "db")
+    # Sweeper de ciclo de vida (Scheduled->Active->Finished, leases vencidos). Apagado por
+    # defecto: se corre como proceso aparte (python -m app.workers.campaign_sweeper) o, con
+    # true, como hilo de la API; con varias réplicas solo uno trabaja por pasada (advisory lock)
+    CAMPAIGN_SWEEPER_ENABLED: bool = os.getenv("CAMPAIGN_SWEEPER_ENABLED", "false").lower() in ("1", "true", "yes")
+    CAMPAIGN_SWEEPER_INTERVAL_SECONDS: float = float(os.getenv("CAMPAIGN_SWEEPER_INTERVAL_SECONDS", "30"))
+    CAMPAIGN_SWEEPER_BATCH_SIZE: int = int(os.getenv("CAMPAIGN_SWEEPER_BATCH_SIZE", "5000"))
 
 @lru_cache
 def get_settings() -> Settings:
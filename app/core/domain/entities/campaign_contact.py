@@ -3,6 +3,8 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional, Dict, Any
 
+CONTACT_STATUSES = ("Pending", "Dialing", "Finished", "Error", "Excluded")
+
 @dataclass(frozen=True)
 class CampaignContact:
     campaign_contact_id: int
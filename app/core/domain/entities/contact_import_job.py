@@ -0,0 +1,27 @@
+# backend/app/core/domain/entities/contact_import_job.py
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+@dataclass(frozen=True)
+class ContactImportJob:
+    job_id: int                 # también se usa como source_batch_id de los contactos importados
+    campaign_id: int
+    status: str                 # 'Queued' | 'Running' | 'Done' | 'Failed'
+    file_path: str
+    rows_processed: int
+    inserted: int
+    updated: int
+    rejected: int
+    error: Optional[str]
+    created_by: str
+    created_at: datetime
+    started_at: Optional[datetime]
+    finished_at: Optional[datetime]
+
+    def rows_per_second(self, now: datetime) -> Optional[float]:
+        """Throughput del job: filas procesadas por segundo desde que arrancó."""
+        if not self.started_at:
+            return None
+        elapsed = ((self.finished_at or now) - self.started_at).total_seconds()
+        return round(self.rows_processed / elapsed, 1) if elapsed > 0 else None
@@ -0,0 +1,83 @@
+# backend/app/core/domain/pacing.py
+"""
+Límites de despacho por campaña, configurados en campaign.config:
+
+    {"max_cps": 2.5, "max_burst": 5, "max_concurrent": 30}
+
+- max_cps: llamadas nuevas por segundo (token bucket; max_burst = capacidad, por
+  defecto max(1, max_cps)).
+- max_concurrent: contactos en Dialing a la vez (semáforo sobre el contador de status).
+
+El DispatchLimiter decide cuántos contactos puede entregar un lease. El permiso se
+mantiene durante todo el lease para que llamadas concurrentes no superen los límites.
+"""
+import math
+from abc import ABC, abstractmethod
+from contextlib import AbstractContextManager
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from app.core.domain.errors import ValidationError
+
+@dataclass(frozen=True)
+class PacingPolicy:
+    max_cps: Optional[float] = None
+    max_burst: Optional[float] = None
+    max_concurrent: Optional[int] = None
+
+    @property
+    def limited(self) -> bool:
+        return self.max_cps is not None or self.max_concurrent is not None
+
+    @property
+    def burst(self) -> float:
+        return self.max_burst if self.max_burst is not None else max(1.0, self.max_cps or 0.0)
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]]) -> "PacingPolicy":
+        config = config or {}
+        try:
+            max_cps = _positive(config.get("max_cps"), float)
+            max_burst = _positive(config.get("max_burst"), float)
+            max_concurrent = _positive(config.get("max_concurrent"), int)
+        except (TypeError, ValueError):
+            raise ValidationError("config.max_cps, max_burst and max_concurrent must be positive numbers")
+        return cls(max_cps, max_burst, max_concurrent)
+
+    def grant(self, requested: int, tokens: Optional[float], dialing: int) -> int:
+        """Contactos que se pueden entregar con `tokens` disponibles y `dialing` en curso."""
+        granted = requested
+        if self.max_cps is not None and tokens is not None:
+            granted = min(granted, math.floor(tokens))
+        if self.max_concurrent is not None:
+            granted = min(granted, self.max_concurrent - dialing)
+        return max(granted, 0)
+
+def _positive(value: Any, kind: type):
+    if value is None:
+        return None
+    value = kind(value)
+    if value <= 0:
+        raise ValueError(value)
+    return value
+
+class DispatchPermit(ABC):
+    granted: int
+
+    @abstractmethod
+    def consume(self, used: int) -> None:
+        """Descuenta del bucket los contactos efectivamente entregados (<= granted)."""
+        ...
+
+class DispatchLimiter(ABC):
+    @abstractmethod
+    def permit(
+        self, campaign_id: int, requested: int, policy: PacingPolicy, now: datetime
+    ) -> AbstractContextManager[DispatchPermit]:
+        """
+        Context manager que reserva el cupo de la campaña mientras dura el lease
+        (las llamadas concurrentes de la misma campaña esperan) y devuelve el permiso.
+        El lease y consume() deben confirmarse (commit) antes de salir del bloque.
+        """
+        ...
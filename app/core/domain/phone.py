@@ -0,0 +1,167 @@
+# backend/app/core/domain/phone.py
+"""
+Normalización de teléfonos a E.164 (+<código país><número nacional>).
+
+- La región por defecto sale de la campaña: config["default_region"] o su timezone.
+- Los códigos de país y los prefijos móviles se resuelven con tablas precalculadas
+  para todos los prefijos posibles (el caché de enriquecimiento está completo desde
+  el import del módulo).
+- normalize_phone no se memoiza por número: en una importación casi todos los
+  números son distintos y un LRU costaba más en cada fallo de lo que ahorraba.
+"""
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, NamedTuple, Optional, Tuple
+
+# NamedTuple y no dataclass(frozen=True): se construye una por llamada y el
+# __init__ de una dataclass congelada cuesta varias veces más
+class PhoneNumber(NamedTuple):
+    e164: str                   # '+593991234567'
+    region: Optional[str]       # ISO 3166-1 alpha-2, None si el código no está en la tabla
+    line_type: str              # 'mobile' | 'fixed' | 'fixed_or_mobile' | 'unknown'
+
+@dataclass(frozen=True)
+class _Country:
+    code: str                               # código de país (calling code)
+    trunk: str                              # prefijo troncal nacional ('0' en EC)
+    lengths: FrozenSet[int]                 # longitudes válidas del número nacional
+    mobile: Tuple[str, ...] = ()            # prefijos nacionales móviles
+    fixed: Tuple[str, ...] = ()             # prefijos nacionales fijos (si se distinguen)
+
+_COUNTRIES: Dict[str, _Country] = {
+    "EC": _Country("593", "0", frozenset({8, 9}), mobile=("9",), fixed=("2", "3", "4", "5", "6", "7")),
+    "CO": _Country("57", "0", frozenset({10}), mobile=("3",), fixed=("60",)),
+    "PE": _Country("51", "0", frozenset({8, 9}), mobile=("9",), fixed=("1", "4", "5", "6", "7", "8")),
+    "MX": _Country("52", "", frozenset({10})),
+    "US": _Country("1", "1", frozenset({10})),
+    "CA": _Country("1", "1", frozenset({10})),
+    "AR": _Country("54", "0", frozenset({10, 11}), mobile=("9",), fixed=("1", "2", "3")),
+    "CL": _Country("56", "", frozenset({9}), mobile=("9",), fixed=("2", "3", "4", "5", "6", "7")),
+    "VE": _Country("58", "0", frozenset({10}), mobile=("4",), fixed=("2",)),
+    "BO": _Country("591", "0", frozenset({8}), mobile=("6", "7"), fixed=("2", "3", "4")),
+    "PY": _Country("595", "0", frozenset({9}), mobile=("9",), fixed=("2", "3", "4", "5", "6", "7")),
+    "UY": _Country("598", "0", frozenset({8}), mobile=("9",), fixed=("2", "4")),
+    "BR": _Country("55", "0", frozenset({10, 11})),
+    "ES": _Country("34", "", frozenset({9}), mobile=("6", "7"), fixed=("8", "9")),
+    "GB": _Country("44", "0", frozenset({10}), mobile=("7",), fixed=("1", "2")),
+    "FR": _Country("33", "0", frozenset({9}), mobile=("6", "7"), fixed=("1", "2", "3", "4", "5")),
+    "IT": _Country("39", "", frozenset(range(6, 12)), mobile=("3",), fixed=("0",)),
+    "DE": _Country("49", "0", frozenset(range(6, 14)), mobile=("15", "16", "17")),
+}
+
+# Región principal por código de país (el '1' es compartido por el plan NANP)
+_REGION_BY_CODE: Dict[str, str] = {}
+for _region, _c in _COUNTRIES.items():
+    _REGION_BY_CODE.setdefault(_c.code, _region)
+
+_REGION_BY_TIMEZONE: Dict[str, str] = {
+    "America/Guayaquil": "EC",
+    "Pacific/Galapagos": "EC",
+    "America/Bogota": "CO",
+    "America/Lima": "PE",
+    "America/Mexico_City": "MX",
+    "America/Monterrey": "MX",
+    "America/Cancun": "MX",
+    "America/Tijuana": "MX",
+    "America/New_York": "US",
+    "America/Chicago": "US",
+    "America/Denver": "US",
+    "America/Los_Angeles": "US",
+    "America/Phoenix": "US",
+    "America/Toronto": "CA",
+    "America/Vancouver": "CA",
+    "America/Argentina/Buenos_Aires": "AR",
+    "America/Buenos_Aires": "AR",
+    "America/Santiago": "CL",
+    "America/Caracas": "VE",
+    "America/La_Paz": "BO",
+    "America/Asuncion": "PY",
+    "America/Montevideo": "UY",
+    "America/Sao_Paulo": "BR",
+    "Europe/Madrid": "ES",
+    "Europe/London": "GB",
+    "Europe/Paris": "FR",
+    "Europe/Rome": "IT",
+    "Europe/Berlin": "DE",
+}
+
+# ---------- Tablas de prefijos ----------
+# Los prefijos son cortos (códigos de 1 a 3 dígitos, prefijos de línea de 1 a 2), así
+# que el longest-match se resuelve al importar el módulo para todas las combinaciones
+# de 3 (o 2) dígitos: en caliente queda un slice y un lookup de dict por número.
+
+def _expand(entries: Dict[str, str], width: int) -> Dict[str, Tuple[str, int]]:
+    """Para cada cadena de `width` dígitos, (valor, largo) del prefijo más largo en `entries`."""
+    table: Dict[str, Tuple[str, int]] = {}
+    for n in range(10 ** width):
+        key = str(n).zfill(width)
+        for size in range(width, 0, -1):
+            if key[:size] in entries:
+                table[key] = (entries[key[:size]], size)
+                break
+    return table
+
+_CODE_TABLE = _expand({code: code for code in _REGION_BY_CODE}, 3)
+
+def _line_type_table(c: _Country) -> Dict[str, str]:
+    if not c.mobile and not c.fixed:
+        return {str(n).zfill(2): "fixed_or_mobile" for n in range(100)}
+    entries = {p: "fixed" for p in c.fixed}
+    entries.update({p: "mobile" for p in c.mobile})
+    return {key: kind for key, (kind, _) in _expand(entries, 2).items()}
+
+# región -> {2 primeros dígitos del número nacional -> tipo de línea}
+_LINE_TYPES: Dict[str, Dict[str, str]] = {region: _line_type_table(c) for region, c in _COUNTRIES.items()}
+
+# región -> (prefijo troncal, '+código', longitudes nacionales, tipos de línea)
+_LOCAL: Dict[str, Tuple[str, str, FrozenSet[int], Dict[str, str]]] = {
+    region: (c.trunk, "+" + c.code, c.lengths, _LINE_TYPES[region]) for region, c in _COUNTRIES.items()
+}
+
+_new_number = tuple.__new__  # construye PhoneNumber sin pasar por su __new__ en Python
+
+def _from_international(digits: str) -> Optional[PhoneNumber]:
+    match = _CODE_TABLE.get(digits[:3])
+    if match is None:
+        # Código fuera de la tabla: se conserva tal cual si cabe en E.164
+        return _new_number(PhoneNumber, ("+" + digits, None, "unknown")) if 8 <= len(digits) <= 15 else None
+    code, size = match
+    region = _REGION_BY_CODE[code]
+    national = digits[size:]
+    if len(national) not in _COUNTRIES[region].lengths:
+        return None
+    return _new_number(PhoneNumber, ("+" + digits, region, _LINE_TYPES[region].get(national[:2], "unknown")))
+
+# ---------- API ----------
+
+def region_for_campaign(timezone: Optional[str], config: Optional[dict] = None) -> Optional[str]:
+    """Región por defecto de una campaña: config['default_region'] o la del timezone."""
+    region = (config or {}).get("default_region")
+    if isinstance(region, str) and region.upper() in _COUNTRIES:
+        return region.upper()
+    return _REGION_BY_TIMEZONE.get(timezone or "")
+
+def normalize_phone(phone: str, default_region: Optional[str] = None) -> Optional[PhoneNumber]:
+    """
+    Convierte `phone` a E.164. Los números sin '+' (o '00') se interpretan como
+    nacionales de `default_region`. Devuelve None si no se puede determinar.
+    """
+    phone = phone.strip()
+    if phone[:1] == "+":
+        digits = phone[1:]
+        return _from_international(digits) if digits.isdigit() else None
+    if not phone.isdigit():
+        return None
+    if phone[:2] == "00":
+        return _from_international(phone[2:])
+
+    local = _LOCAL.get(default_region)
+    if local is None:
+        return None
+    trunk, plus_code, lengths, line_types = local
+    national = phone[len(trunk):] if trunk and phone.startswith(trunk) else phone
+    if len(national) in lengths:
+        return _new_number(PhoneNumber, (plus_code + national, default_region, line_types.get(national[:2], "unknown")))
+    # Número con código de país pero sin '+' (p.ej. '593991234567')
+    if phone.startswith(plus_code[1:]) and len(phone) - len(plus_code) + 1 in lengths:
+        return _from_international(phone)
+    return None
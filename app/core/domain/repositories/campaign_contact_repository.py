@@ -1,8 +1,16 @@
 # backend/app/core/domain/repositories/campaign_contact_repository.py
 from abc import ABC, abstractmethod
-from typing import Optional, List, Dict, Any, Tuple
+from datetime import datetime
+from typing import Callable, Optional, List, Dict, Any, Tuple, Iterable, Iterator
 from app.core.domain.entities.campaign_contact import CampaignContact
 
+# Columnas (y orden) de las filas que produce iter_rows
+EXPORT_FIELDS = (
+    "campaign_contact_id", "phone", "name", "attributes", "status", "attempt_count",
+    "next_attempt_at", "last_disposition", "last_error", "notes", "source_batch_id",
+    "created_at", "updated_at", "created_by",
+)
+
 class CampaignContactRepository(ABC):
     """Repositorio de contactos de campañas."""
 
@@ -13,6 +21,11 @@ class CampaignContactRepository(ABC):
     @abstractmethod
     def get_by_phone(self, campaign_id: int, phone: str) -> Optional[CampaignContact]: ...
     
+    @abstractmethod
+    def existing_phones(self, campaign_id: int, phones: List[str]) -> set[str]:
+        """Subconjunto de `phones` que ya existe en la campaña (una consulta por llamada)."""
+        ...
+
     @abstractmethod
     def list(
         self,
@@ -20,8 +33,25 @@ class CampaignContactRepository(ABC):
         q: Optional[str],
         status: Optional[str],
         limit: int,
-        offset: int
-    ) -> List[CampaignContact]: ...
+        offset: int,
+        after: Optional[int] = None,
+    ) -> List[CampaignContact]:
+        """Orden campaign_contact_id DESC. after: paginación keyset (ids menores a `after`)."""
+        ...
+
+    @abstractmethod
+    def iter_rows(
+        self,
+        campaign_id: int,
+        q: Optional[str],
+        status: Optional[str],
+        batch_size: int = 1000,
+    ) -> Iterator[tuple]:
+        """
+        Recorre los contactos de la campaña (mismos filtros que list, orden por id)
+        como tuplas en el orden de EXPORT_FIELDS, sin materializar el resultado.
+        """
+        ...
 
     # Escritura
     @abstractmethod
@@ -47,7 +77,141 @@ class CampaignContactRepository(ABC):
         items: [{"phone": "...", "name": "...", "attributes": {...}}, ...]
         """
         ...
+
+    def bulk_import(self, campaign_id: int, items: Iterable[Dict[str, Any]]) -> Tuple[int, int]:
+        """
+        Importación para volúmenes muy grandes (items ya validados, se consumen en streaming).
+        Devuelve (inserted, updated).
+        Por defecto delega en bulk_upsert; las implementaciones pueden ofrecer una vía más rápida.
+        """
+        return self.bulk_upsert(campaign_id, list(items))
     
+    @abstractmethod
+    def bulk_update(
+        self,
+        campaign_id: int,
+        criteria: Dict[str, Any],
+        changes: Dict[str, Any],
+        after: int,
+        limit: int,
+    ) -> Tuple[int, int, Optional[int]]:
+        """
+        Aplica `changes` con un UPDATE set-based a los contactos que cumplen `criteria`
+        con campaign_contact_id > after, recorriendo hasta `limit` filas (orden por id).
+        criteria: status (lista), attempt_count_min/max, attributes (contiene), phones.
+        changes: status, reset_attempts, next_attempt_at, merge_attributes.
+        Devuelve (filas actualizadas, filas recorridas, último id recorrido o None si no hubo
+        filas). Una fila recorrida que otra transacción dejó fuera de criteria mientras se
+        esperaba su lock no se actualiza; quedan más filas solo si se recorrieron `limit`.
+        """
+        ...
+
+    @abstractmethod
+    def canonicalize_phones(
+        self,
+        campaign_id: int,
+        canonical: Callable[[str], Optional[str]],
+        after: int,
+        limit: int,
+    ) -> Tuple[int, int, Optional[int]]:
+        """
+        Reescribe a canonical(phone) los phones de hasta `limit` contactos con
+        campaign_contact_id > after (orden por id). Si el phone canónico ya existe en la
+        campaña (o lo comparten varios del chunk) se fusionan: sobrevive el contacto ya
+        canónico o, si no hay, el de menor id, que conserva su estado de llamadas; de los
+        demás toma attributes que no tenga y name si le falta, y se borran.
+        canonical devuelve None si el phone no se puede normalizar (queda como está).
+        Devuelve (renombrados, fusionados, último id procesado o None si no hubo filas).
+        """
+        ...
+
+    @abstractmethod
+    def lease_due(
+        self,
+        campaign_id: int,
+        n: int,
+        max_attempts: int,
+        now: datetime,
+        lease_until: datetime,
+    ) -> List[CampaignContact]:
+        """
+        Reclama atómicamente hasta n contactos vencidos (Pending, next_attempt_at <= now
+        o nulo, attempt_count < max_attempts) y los pasa a Dialing con next_attempt_at =
+        lease_until. Los que otro dialer tiene bloqueados se saltan (SKIP LOCKED).
+        """
+        ...
+
+    @abstractmethod
+    def lease_ids(
+        self,
+        campaign_id: int,
+        ids: List[int],
+        max_attempts: int,
+        now: datetime,
+        lease_until: datetime,
+    ) -> List[CampaignContact]:
+        """Como lease_due, pero solo entre `ids` (candidatos del scheduler en memoria)."""
+        ...
+
+    @abstractmethod
+    def due_page(self, campaign_id: int, after: int, limit: int) -> List[Tuple[int, Optional[datetime]]]:
+        """Página (por id) de contactos Pending: [(campaign_contact_id, next_attempt_at)]."""
+        ...
+
+    @abstractmethod
+    def pending_among(self, campaign_id: int, ids: List[int], max_attempts: int) -> List[Tuple[int, Optional[datetime]]]:
+        """
+        De `ids`, los que siguen Pending con intentos disponibles, con su next_attempt_at
+        (versión confirmada, sin bloquear): [(campaign_contact_id, next_attempt_at)].
+        """
+        ...
+
+    @abstractmethod
+    def change_watermark(self) -> int:
+        """
+        Marca de cambios de la base (xmin del snapshot actual): toda transacción con un
+        id menor ya terminó. Punto de partida de changes_since.
+        """
+        ...
+
+    @abstractmethod
+    def changes_since(self, campaign_id: int, since: int) -> Tuple[List[Tuple[int, str, Optional[datetime]]], int]:
+        """
+        Contactos escritos por transacciones con id >= `since` (marca de change_watermark):
+        [(id, status, next_attempt_at)], junto con la marca para la siguiente llamada.
+        Puede repetir filas ya vistas; no pierde las que confirmaron tarde.
+        """
+        ...
+
+    @abstractmethod
+    def apply_outcomes(
+        self,
+        campaign_id: int,
+        outcomes: List[Dict[str, Any]],
+        max_attempts: int,
+        retry_at: datetime,
+        now: datetime,
+    ) -> Dict[int, str]:
+        """
+        Registra resultados de llamadas en una sola sentencia, solo sobre contactos en
+        Dialing con el mismo lease que se reporta (next_attempt_at == lease_expires_at:
+        un lease vencido y reasignado no se pisa).
+        outcomes: [{campaign_contact_id, lease_expires_at, disposition, error, final}].
+        Suma el intento; con final o al llegar a max_attempts el contacto termina
+        (Finished, o Error si el resultado trae error); si no, vuelve a Pending con
+        next_attempt_at = retry_at. Devuelve {campaign_contact_id: nuevo status}.
+        """
+        ...
+
+    @abstractmethod
+    def release_expired_leases(self, now: datetime, limit: int) -> Dict[int, int]:
+        """
+        Devuelve a Pending (vencidos ya) hasta `limit` contactos en Dialing cuyo lease
+        expiró (next_attempt_at < now), de cualquier campaña. El intento no se cuenta:
+        el dialer nunca reportó. Devuelve {campaign_id: contactos liberados}.
+        """
+        ...
+
     @abstractmethod
     def update(self, campaign_contact_id: int, changes: Dict[str, Any]) -> CampaignContact: ...
     
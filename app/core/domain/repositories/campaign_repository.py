@@ -1,5 +1,6 @@
 # backend/app/core/domain/repositories/campaign_repository.py
 from abc import ABC, abstractmethod
+from datetime import datetime
 from typing import Optional, List
 from app.core.domain.entities.campaign import Campaign
 
@@ -9,10 +10,37 @@ class CampaignRepository(ABC):
     @abstractmethod
     def get(self, campaign_id: int) -> Optional[Campaign]: ...
     @abstractmethod
+    def get_for_write(self, campaign_id: int) -> Optional[Campaign]:
+        """Como get, pero bloquea la fila (FOR SHARE) hasta el commit: mientras tanto no puede pasar a 'Deleting'."""
+        ...
+    @abstractmethod
     def get_by_name(self, name: str) -> Optional[Campaign]: ...
     @abstractmethod
-    def list(self, q: Optional[str], limit: int, offset: int) -> List[Campaign]: ...
+    def list(self, q: Optional[str], limit: int, offset: int, after: Optional[int] = None) -> List[Campaign]: ...
     @abstractmethod
     def update(self, campaign_id: int, data: dict) -> Campaign: ...
     @abstractmethod
     def delete(self, campaign_id: int) -> None: ...
+    @abstractmethod
+    def mark_deleting(self, campaign_id: int) -> None:
+        """Pasa la campaña a 'Deleting': deja de listarse y queda a cargo del purgador."""
+        ...
+    @abstractmethod
+    def claim_deleting(self) -> Optional[int]:
+        """Bloquea (SKIP LOCKED) una campaña en 'Deleting' hasta el commit y devuelve su id."""
+        ...
+    @abstractmethod
+    def purge_contacts(self, campaign_id: int, limit: int) -> int:
+        """Borra hasta `limit` contactos de la campaña; devuelve cuántos borró."""
+        ...
+    @abstractmethod
+    def activate_started(self, now: datetime) -> List[int]:
+        """Scheduled -> Active para las campañas cuyo start_at ya pasó (y end_at no). Devuelve los ids."""
+        ...
+    @abstractmethod
+    def finish_completed(self, now: datetime) -> List[int]:
+        """
+        -> Finished para las campañas cuyo end_at ya pasó (Scheduled/Active/Paused) y las
+        Active con contactos pero ninguno en Pending/Dialing. Devuelve los ids.
+        """
+        ...
@@ -0,0 +1,20 @@
+# backend/app/core/domain/repositories/campaign_stats_repository.py
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Tuple
+
+class CampaignStatsRepository(ABC):
+    """Contadores de contactos por status de cada campaña."""
+
+    @abstractmethod
+    def get_counts(self, campaign_id: int) -> Dict[str, int]:
+        """{status: contactos} leído de los contadores (O(1) respecto al número de contactos)."""
+        ...
+
+    @abstractmethod
+    def reconcile(self, campaign_id: Optional[int] = None, apply: bool = True) -> List[Tuple[int, str, int, int]]:
+        """
+        Recalcula los contadores desde campaign_contacts (una campaña o todas).
+        Devuelve el drift como (campaign_id, status, contador, real) y, con apply,
+        deja los contadores iguales al valor real.
+        """
+        ...
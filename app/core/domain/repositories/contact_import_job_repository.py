@@ -0,0 +1,29 @@
+# backend/app/core/domain/repositories/contact_import_job_repository.py
+from abc import ABC, abstractmethod
+from typing import Optional, Dict, Any
+from app.core.domain.entities.contact_import_job import ContactImportJob
+
+class ContactImportJobRepository(ABC):
+    """Repositorio de jobs de importación de contactos (cola + progreso)."""
+
+    @abstractmethod
+    def create(self, campaign_id: int, data: Dict[str, Any]) -> ContactImportJob:
+        """data: {file_path (req), created_by (req)}. El job nace en estado 'Queued'."""
+        ...
+
+    @abstractmethod
+    def get(self, job_id: int) -> Optional[ContactImportJob]: ...
+
+    @abstractmethod
+    def claim_next(self) -> Optional[ContactImportJob]:
+        """
+        Toma el job 'Queued' más antiguo y lo pasa a 'Running'.
+        Debe ser seguro con varios workers concurrentes (un job lo toma uno solo).
+        """
+        ...
+
+    @abstractmethod
+    def update_progress(self, job_id: int, rows_processed: int, inserted: int, updated: int, rejected: int) -> None: ...
+
+    @abstractmethod
+    def finish(self, job_id: int, status: str, error: Optional[str] = None) -> None: ...
@@ -0,0 +1,116 @@
+# backend/app/core/domain/schedule.py
+"""
+Franja de llamadas compilada por campaña.
+
+CampaignSchedule precalcula, para los próximos `days` días, los intervalos UTC en
+los que la campaña puede llamar (window_start/window_end en su timezone, con DST,
+recortados a start_at/end_at). Se guardan como una lista plana de bordes
+[abre, cierra, abre, cierra, ...] en epoch seconds, así que:
+
+- is_open(t): bisect sobre los bordes, O(log n); abierto si el índice es impar.
+- next_open(t): el siguiente borde de apertura, O(log n).
+- open_mask(ts): lote de instantes en una sola pasada ordenada.
+
+schedule_for(campaign, now) cachea el compilado por campaign_id; se recompila si
+cambian los campos de la franja (huella) o si `now` se acerca al final del horizonte.
+UpdateCampaign llama a invalidate_schedule al modificar esos campos.
+"""
+import threading
+from bisect import bisect_right
+from datetime import datetime, date, time, timedelta, timezone
+from typing import Dict, List, Optional, Sequence, Tuple
+from zoneinfo import ZoneInfo
+
+from app.core.domain.entities.campaign import Campaign
+
+SCHEDULE_FIELDS = ("start_at", "end_at", "window_start", "window_end", "timezone")
+
+_HORIZON_DAYS = 14
+
+class CampaignSchedule:
+    def __init__(self, bounds: List[float], horizon: float):
+        self._bounds = bounds       # bordes ordenados: índices pares abren, impares cierran
+        self.horizon = horizon      # epoch hasta donde se compiló
+
+    @classmethod
+    def compile(cls, campaign: Campaign, start: datetime, days: int = _HORIZON_DAYS) -> "CampaignSchedule":
+        tz = ZoneInfo(campaign.timezone)
+        lo = campaign.start_at.timestamp()
+        hi = campaign.end_at.timestamp() if campaign.end_at else float("inf")
+        horizon = (start + timedelta(days=days)).timestamp()
+
+        intervals: List[Tuple[float, float]] = []
+        if campaign.window_start is None or campaign.window_end is None:
+            intervals.append((lo, hi))
+        else:
+            # Desde el día local anterior: una franja nocturna de ayer puede seguir abierta
+            first = start.astimezone(tz).date() - timedelta(days=1)
+            overnight = campaign.window_start > campaign.window_end
+            for i in range(days + 2):
+                day = first + timedelta(days=i)
+                opens = _local_ts(day, campaign.window_start, tz)
+                closes = _local_ts(day + timedelta(days=1) if overnight else day, campaign.window_end, tz)
+                intervals.append((max(opens, lo), min(closes, hi)))
+
+        bounds: List[float] = []
+        for opens, closes in sorted(intervals):
+            if closes <= opens:
+                continue
+            if bounds and opens <= bounds[-1]:
+                bounds[-1] = max(bounds[-1], closes)    # intervalos contiguos o solapados
+            else:
+                bounds += [opens, closes]
+        return cls(bounds, horizon)
+
+    def is_open(self, t: datetime) -> bool:
+        return bisect_right(self._bounds, t.timestamp()) % 2 == 1
+
+    def next_open(self, t: datetime) -> Optional[datetime]:
+        """`t` si está abierto; si no, el próximo instante de apertura (None si no hay en el horizonte)."""
+        ts = t.timestamp()
+        i = bisect_right(self._bounds, ts)
+        if i % 2 == 1:
+            return t
+        if i < len(self._bounds):
+            return datetime.fromtimestamp(self._bounds[i], tz=timezone.utc)
+        return None
+
+    def open_mask(self, times: Sequence[datetime]) -> List[bool]:
+        """is_open para un lote: se ordena una vez y se recorren los bordes en paralelo."""
+        bounds, n = self._bounds, len(self._bounds)
+        order = sorted(range(len(times)), key=lambda k: times[k])
+        out = [False] * len(times)
+        i = 0
+        for k in order:
+            ts = times[k].timestamp()
+            while i < n and bounds[i] <= ts:
+                i += 1
+            out[k] = i % 2 == 1
+        return out
+
+def _local_ts(day: date, at: time, tz: ZoneInfo) -> float:
+    # Hora local -> epoch; en el salto de DST (hora inexistente) zoneinfo aplica el offset previo
+    return datetime.combine(day, at, tzinfo=tz).timestamp()
+
+# ---------- Caché por campaña ----------
+
+_cache: Dict[int, Tuple[tuple, CampaignSchedule]] = {}
+_lock = threading.Lock()
+
+def _fingerprint(campaign: Campaign) -> tuple:
+    return (campaign.start_at, campaign.end_at, campaign.window_start, campaign.window_end, campaign.timezone)
+
+def schedule_for(campaign: Campaign, now: datetime) -> CampaignSchedule:
+    key = _fingerprint(campaign)
+    hit = _cache.get(campaign.campaign_id)     # lectura de dict atómica; el lock solo protege escrituras
+    # Se recompila con un día de margen antes del fin del horizonte
+    if hit is not None and hit[0] == key and now.timestamp() < hit[1].horizon - 86400:
+        return hit[1]
+    schedule = CampaignSchedule.compile(campaign, now)
+    with _lock:
+        _cache[campaign.campaign_id] = (key, schedule)
+    return schedule
+
+def invalidate_schedule(campaign_id: int) -> None:
+    with _lock:
+        _cache.pop(campaign_id, None)
@@ -0,0 +1,68 @@
+# app/core/use_cases/bulk_update_contacts.py
+from typing import Any, Callable, Dict, Optional
+from app.core.domain.entities.campaign_contact import CONTACT_STATUSES
+from app.core.domain.errors import ValidationError
+from app.core.domain.repositories.campaign_contact_repository import CampaignContactRepository
+from app.config.log import get_logger
+
+logger = get_logger(__name__)
+
+_CRITERIA = ("status", "attempt_count_min", "attempt_count_max", "attributes", "phones")
+_CHANGES = ("status", "reset_attempts", "next_attempt_at", "merge_attributes")
+
+class BulkUpdateContacts:
+    """
+    Operación masiva por filtro (excluir, reintentar, reprogramar, etiquetar):
+    - Un UPDATE set-based por chunk de `chunk_size` filas, recorriendo por id (keyset);
+      termina cuando un tramo recorre menos de `chunk_size` filas.
+    - Cada chunk se confirma por separado (commit inyectado): los locks de filas
+      duran lo que dura un chunk aunque el filtro abarque millones de contactos.
+    - Los contadores por status se ajustan dentro de cada chunk.
+    - ensure_writable (opcional, EnsureCampaignWritable): se vuelve a verificar la
+      campaña después de cada commit; si pasó a 'Deleting' se detiene con ConflictError.
+    """
+    def __init__(
+        self,
+        repo: CampaignContactRepository,
+        commit: Callable[[], None],
+        ensure_writable: Optional[Callable[[int], Any]] = None,
+    ):
+        self.repo = repo
+        self.commit = commit
+        self.ensure_writable = ensure_writable
+
+    def __call__(self, campaign_id: int, criteria: Dict[str, Any], changes: Dict[str, Any], chunk_size: int = 5000) -> Dict[str, int]:
+        criteria = {k: v for k, v in criteria.items() if k in _CRITERIA and v not in (None, [], {})}
+        changes = {k: v for k, v in changes.items() if k in _CHANGES and v not in (None, False, {})}
+        if not criteria:
+            raise ValidationError("filter requires at least one criterion")
+        if not changes:
+            raise ValidationError("action requires at least one change")
+        bad = set(criteria.get("status") or ()) - set(CONTACT_STATUSES)
+        if bad or changes.get("status", "Pending") not in CONTACT_STATUSES:
+            raise ValidationError(f"invalid status; expected one of {', '.join(CONTACT_STATUSES)}")
+        lo, hi = criteria.get("attempt_count_min"), criteria.get("attempt_count_max")
+        if lo is not None and hi is not None and lo > hi:
+            raise ValidationError("attempt_count_min must be <= attempt_count_max")
+
+        updated = chunks = 0
+        after = 0
+        while True:
+            n, scanned, last_id = self.repo.bulk_update(campaign_id, criteria, changes, after, chunk_size)
+            if n:
+                self.commit()
+                updated, chunks = updated + n, chunks + 1
+                logger.debug("contacts.bulk_update.chunk", campaign_id=campaign_id, chunk=chunks, rows=n)
+            # n < scanned si otra transacción cambió filas del tramo: el recorrido sigue igual
+            if scanned < chunk_size:
+                break
+            if self.ensure_writable is not None:
+                self.ensure_writable(campaign_id)
+            after = last_id
+
+        logger.info(
+            "contacts.bulk_update",
+            campaign_id=campaign_id, updated=updated, chunks=chunks,
+            criteria=sorted(criteria), changes=sorted(changes),
+        )
+        return {"updated": updated, "chunks": chunks}
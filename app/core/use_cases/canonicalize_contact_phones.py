@@ -0,0 +1,45 @@
+# app/core/use_cases/canonicalize_contact_phones.py
+from typing import Callable, Dict, Optional
+from app.core.domain.phone import normalize_phone
+from app.core.domain.repositories.campaign_contact_repository import CampaignContactRepository
+from app.config.log import get_logger
+
+logger = get_logger(__name__)
+
+class CanonicalizeContactPhones:
+    """
+    Lleva a E.164 los phones guardados antes de la normalización ('0991234567' ->
+    '+593991234567'), con la región por defecto de la campaña, como EnrollContacts.
+    - Recorre la campaña por id (keyset) en chunks de `chunk_size` y confirma cada
+      chunk por separado (commit inyectado), como BulkUpdateContacts.
+    - Los contactos que quedan con el mismo phone se fusionan en uno (ver
+      CampaignContactRepository.canonicalize_phones); los contadores por status
+      se ajustan en el mismo chunk.
+    - Los phones que no se pueden normalizar quedan como están.
+    """
+    def __init__(self, repo: CampaignContactRepository, commit: Callable[[], None]):
+        self.repo = repo
+        self.commit = commit
+
+    def __call__(self, campaign_id: int, default_region: Optional[str], chunk_size: int = 5000) -> Dict[str, int]:
+        def canonical(phone: str) -> Optional[str]:
+            info = normalize_phone(phone, default_region)
+            return info.e164 if info else None
+
+        renamed = merged = chunks = 0
+        after = 0
+        while True:
+            r, m, last_id = self.repo.canonicalize_phones(campaign_id, canonical, after, chunk_size)
+            if last_id is None:
+                break
+            self.commit()
+            renamed, merged, chunks = renamed + r, merged + m, chunks + 1
+            if r or m:
+                logger.debug("contacts.canonicalize.chunk", campaign_id=campaign_id, chunk=chunks, renamed=r, merged=m)
+            after = last_id
+
+        logger.info(
+            "contacts.canonicalize",
+            campaign_id=campaign_id, region=default_region, renamed=renamed, merged=merged, chunks=chunks,
+        )
+        return {"renamed": renamed, "merged": merged, "chunks": chunks}
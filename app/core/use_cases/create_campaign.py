@@ -2,6 +2,7 @@ from typing import Any, Dict
 from datetime import datetime, time
 from app.core.domain.repositories.campaign_repository import CampaignRepository
 from app.core.domain.errors import ValidationError, ConflictError
+from app.core.domain.pacing import PacingPolicy
 
 class CreateCampaign:
     def __init__(self, repo: CampaignRepository):
@@ -30,5 +31,8 @@ class CreateCampaign:
         if end is not None and end < start:
             raise ValidationError("end_at must be >= start_at")
 
+        # Límites de despacho en config (max_cps / max_burst / max_concurrent)
+        PacingPolicy.from_config(data.get("config"))
+
         # Persistir
         return self.repo.create(data)
@@ -16,5 +16,7 @@ class DeleteCampaign:
         if not force and current.status in {"Active", "Paused"}:
             raise ConflictError(f"Cannot delete campaign in status {current.status}")
 
-        # 3) Persistencia
-        self.repo.delete(campaign_id)
+        # 3) Persistencia: solo se marca; los contactos los borra el purgador por chunks
+        #    (app.workers.campaign_purger) y al final la fila de la campaña.
+        if current.status != "Deleting":
+            self.repo.mark_deleting(campaign_id)
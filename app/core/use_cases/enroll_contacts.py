@@ -1,9 +1,14 @@
 # app/core/use_cases/enroll_contacts.py
-from typing import List, Dict, Tuple, Any
+from typing import Callable, Iterable, Iterator, List, Dict, Tuple, Any, Optional
 from app.core.domain.repositories.campaign_contact_repository import CampaignContactRepository
 from app.core.domain.errors import ValidationError
+from app.core.domain.phone import normalize_phone
+from app.config.log import get_logger, RowSampler
 import re
 
+logger = get_logger(__name__)
+_row_sampler = RowSampler()  # logs por fila solo según ENROLL_LOG_SAMPLE_RATE
+
 class EnrollContacts:
     """
     Alta/actualización masiva de contactos por campaña con validaciones previas.
@@ -11,87 +16,312 @@ class EnrollContacts:
     - Deduplica por phone dentro del mismo lote.
     - 'attributes' debe ser dict (se fuerza {} si None).
     - Opcional: recorta longitudes de 'name'.
+    - Normaliza 'phone' a E.164 (región por defecto de la campaña) y etiqueta
+      país y tipo de línea en attributes; si no se puede, conserva el valor validado.
     """
     _PHONE_RE = re.compile(r"\+?\d{7,25}")  # simple: + y de 7 a 25 dígitos
 
-    def __init__(self, repo: CampaignContactRepository):
+    def __init__(self, repo: CampaignContactRepository, default_region: Optional[str] = None):
         self.repo = repo
+        self.default_region = default_region
 
     def __call__(self, campaign_id: int, contacts: List[Dict[str, Any]], created_by: str = "system") -> Tuple[int, int]:
-        import logging
-        logger = logging.getLogger(__name__)
-        logger.setLevel(logging.INFO)
-        
         if not isinstance(contacts, list) or not contacts:
             raise ValidationError("No contacts provided")
 
-        logger.info(f"🔍 EnrollContacts received {len(contacts)} contacts")
-        for i, contact in enumerate(contacts):
-            logger.info(f"📥 Input contact {i+1}: {contact}")
-            logger.info(f"📥 Input attributes: {contact.get('attributes')} (type: {type(contact.get('attributes'))})")
-
         cleaned: List[Dict[str, Any]] = []
         seen_phones: set[str] = set()
 
         for idx, raw in enumerate(contacts, start=1):
-            if not isinstance(raw, dict):
-                raise ValidationError(f"Item {idx} must be an object")
+            item = self._clean_item(idx, raw, seen_phones, created_by, self.default_region)
+            if item is not None:
+                cleaned.append(item)
+
+        if not cleaned:
+            raise ValidationError("No valid contacts to enroll")
+
+        logger.info(
+            "enroll_contacts.batch",
+            campaign_id=campaign_id, received=len(contacts), cleaned=len(cleaned),
+            skipped=len(contacts) - len(cleaned),
+        )
+
+        # delega al repo (ya validado y deduplicado)
+        # bulk_upsert debe devolver (inserted, existing) y no lanzar ConflictError
+        return self.repo.bulk_upsert(campaign_id, cleaned)
+
+    def enroll_stream(
+        self,
+        campaign_id: int,
+        contacts: Iterable[Dict[str, Any]],
+        created_by: str = "system",
+        chunk_size: int = 1000,
+    ) -> Tuple[int, int]:
+        """
+        Variante por lotes para entradas grandes (p.ej. un CSV leído de forma incremental):
+        valida y envía al repositorio de a `chunk_size` filas, sin materializar la entrada.
+        Deduplica sobre toda la entrada como __call__ y diff (gana la primera aparición).
+        """
+        inserted = existing = received = 0
+        for received, chunk in self.clean_chunks(contacts, created_by, chunk_size):
+            if chunk:
+                ins, ex = self.repo.bulk_upsert(campaign_id, chunk)
+                inserted, existing = inserted + ins, existing + ex
+
+        if not received:
+            raise ValidationError("No contacts provided")
+        if not inserted and not existing:
+            raise ValidationError("No valid contacts to enroll")
+        logger.info(
+            "enroll_contacts.stream",
+            campaign_id=campaign_id, received=received, inserted=inserted, existing=existing,
+        )
+        return inserted, existing
+
+    def diff(
+        self,
+        campaign_id: int,
+        contacts: Iterable[Dict[str, Any]],
+        created_by: str = "system",
+        chunk_size: int = 1000,
+        max_errors: int = 20,
+    ) -> Dict[str, Any]:
+        """
+        Dry-run: valida como una importación real y calcula, sin escribir nada,
+        cuántas filas se insertarían, actualizarían, deduplicarían u omitirían
+        (sin phone) y cuántas se rechazarían (con los primeros `max_errors` errores).
+        Deduplica sobre toda la entrada, igual que clean_chunks/enroll_stream.
+        Consulta los existentes con una búsqueda set-based por chunk.
+        """
+        result: Dict[str, Any] = {
+            "received": 0, "inserted": 0, "updated": 0,
+            "deduplicated": 0, "skipped": 0, "rejected": 0, "errors": [],
+        }
+        seen_phones: set[str] = set()
+        pending: List[str] = []
+
+        def _flush() -> None:
+            found = self.repo.existing_phones(campaign_id, pending)
+            result["updated"] += len(found)
+            result["inserted"] += len(pending) - len(found)
+            pending.clear()
+
+        for idx, raw in enumerate(contacts, start=1):
+            result["received"] = idx
+            try:
+                phone = self._clean_phone(idx, raw, self.default_region)
+                if phone is None:
+                    result["skipped"] += 1
+                    continue
+                if phone in seen_phones:
+                    result["deduplicated"] += 1
+                    continue
+                seen_phones.add(phone)
+                self._clean_fields(idx, raw, phone, created_by)
+            except ValidationError as ex:
+                result["rejected"] += 1
+                if len(result["errors"]) < max_errors:
+                    result["errors"].append(str(ex))
+                continue
+            pending.append(phone)
+            if len(pending) >= chunk_size:
+                _flush()
 
-            phone = raw.get("phone")
-            # normaliza a string y trim
+        if pending:
+            _flush()
+        logger.info("enroll_contacts.dry_run", campaign_id=campaign_id, **{k: v for k, v in result.items() if k != "errors"})
+        return result
+
+    def clean_chunks(
+        self,
+        contacts: Iterable[Dict[str, Any]],
+        created_by: str = "system",
+        chunk_size: int = 1000,
+        on_reject: Optional[Callable[[int, ValidationError], None]] = None,
+    ) -> Iterator[Tuple[int, List[Dict[str, Any]]]]:
+        """
+        Valida en streaming y agrupa en chunks de hasta `chunk_size` items limpios.
+        Produce (filas leídas hasta ahora, chunk). Sin on_reject el primer item inválido
+        aborta con ValidationError; con on_reject se notifica y se continúa.
+        La deduplicación abarca toda la entrada, no solo el chunk: el mismo phone en
+        dos chunks no se envía dos veces (y diff lo cuenta igual, como deduplicado).
+        """
+        read = 0
+        chunk: List[Dict[str, Any]] = []
+        seen_phones: set[str] = set()
+
+        for idx, raw in enumerate(contacts, start=1):
+            read = idx
+            try:
+                item = self._clean_item(idx, raw, seen_phones, created_by, self.default_region)
+            except ValidationError as ex:
+                if on_reject is None:
+                    raise
+                on_reject(idx, ex)
+                continue
+            if item is not None:
+                chunk.append(item)
+            if len(chunk) >= chunk_size:
+                yield read, chunk
+                chunk = []
+
+        yield read, chunk
+
+    def enroll_import(
+        self,
+        campaign_id: int,
+        contacts: Iterable[Dict[str, Any]],
+        created_by: str = "system",
+    ) -> Tuple[int, int]:
+        """
+        Variante para listas muy grandes: valida en streaming y delega en repo.bulk_import
+        (COPY + merge en una sola sentencia). La deduplicación la resuelve el repositorio
+        (gana la primera aparición), así no se mantiene un set de phones en memoria.
+        Devuelve (inserted, updated).
+        """
+        cleaned = (
+            item
+            for idx, raw in enumerate(contacts, start=1)
+            if (item := self._clean_item(idx, raw, None, created_by, self.default_region)) is not None
+        )
+        inserted, updated = self.repo.bulk_import(campaign_id, cleaned)
+        if not inserted and not updated:
+            raise ValidationError("No valid contacts to enroll")
+        logger.info("enroll_contacts.import", campaign_id=campaign_id, inserted=inserted, updated=updated)
+        return inserted, updated
+
+    # ---------- Validación en paralelo (worker de importaciones) ----------
+    # prevalidate corre en procesos worker (sin repo ni estado) sobre un tramo de filas;
+    # merge_prevalidated aplica luego, en orden de entrada, la deduplicación y los
+    # rechazos con la misma semántica y mensajes que clean_chunks.
+
+    @classmethod
+    def prevalidate(
+        cls,
+        contacts: Iterable[Dict[str, Any]],
+        created_by: str = "system",
+        default_region: Optional[str] = None,
+        start: int = 0,
+    ) -> List[tuple]:
+        """
+        Valida un tramo de la entrada sin deduplicar; `start` son las filas previas al tramo.
+        Devuelve una entrada por fila con phone o con error:
+        (idx global, phone | None, item limpio | None, mensaje de error | None).
+        """
+        entries: List[tuple] = []
+        for idx, raw in enumerate(contacts, start=start + 1):
+            try:
+                phone = cls._clean_phone(idx, raw, default_region)
+            except ValidationError as ex:
+                entries.append((idx, None, None, str(ex)))
+                continue
             if phone is None:
-                # lo ignoramos silenciosamente o puedes levantar error explícito:
-                # raise ValidationError(f"Item {idx}: 'phone' is required")
                 continue
-            if not isinstance(phone, str):
-                phone = str(phone)
-            phone = phone.strip()
-            if not phone:
+            try:
+                entries.append((idx, phone, cls._clean_fields(idx, raw, phone, created_by), None))
+            except ValidationError as ex:
+                entries.append((idx, phone, None, str(ex)))
+        return entries
+
+    @staticmethod
+    def merge_prevalidated(
+        entries: Iterable[tuple],
+        seen_phones: set[str],
+        on_reject: Optional[Callable[[int, ValidationError], None]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Produce los items de un tramo de prevalidate deduplicando contra seen_phones, que se
+        comparte entre tramos (en orden) como el set de clean_chunks. Sin on_reject el primer
+        error aborta con ValidationError.
+        """
+        for idx, phone, item, error in entries:
+            if phone is not None:
+                if phone in seen_phones:
+                    continue
+                seen_phones.add(phone)
+            if error is not None:
+                if on_reject is None:
+                    raise ValidationError(error)
+                on_reject(idx, ValidationError(error))
                 continue
+            yield item
 
-            # valida formato básico de teléfono
-            if not self._PHONE_RE.fullmatch(phone):
-                raise ValidationError(f"Item {idx}: invalid phone format '{phone}'")
+    @classmethod
+    def _clean_item(
+        cls,
+        idx: int,
+        raw: Any,
+        seen_phones: Optional[set[str]],
+        created_by: str,
+        default_region: Optional[str] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Valida y normaliza un item. Devuelve None si debe omitirse (sin phone o duplicado).
+        Con seen_phones=None no deduplica (lo hace quien persiste).
+        """
+        phone = cls._clean_phone(idx, raw, default_region)
+        if phone is None:
+            return None
 
-            # dedupe dentro del mismo lote
+        # dedupe dentro del mismo lote
+        if seen_phones is not None:
             if phone in seen_phones:
-                continue
+                return None
             seen_phones.add(phone)
 
-            # attributes debe ser dict
-            attributes = raw.get("attributes")
-            logger.info(f"🔄 Processing item {idx} attributes: {attributes} (type: {type(attributes)})")
-            
-            if attributes is None:
-                attributes = {}
-                logger.warning(f"⚠️ Item {idx}: attributes was None, setting to empty dict")
-            elif not isinstance(attributes, dict):
-                logger.error(f"❌ Item {idx}: attributes is not a dict: {type(attributes)}")
-                raise ValidationError(f"Item {idx}: 'attributes' must be an object")
-
-            name = raw.get("name") or None
-            if isinstance(name, str):
-                name = name.strip() or None
-                if name and len(name) > 120:
-                    name = name[:120]
-
-            cleaned_item = {
-                "phone": phone,
-                "name": name,
-                "attributes": attributes,
-                "created_by": created_by
-            }
-            logger.info(f"✅ Cleaned item {idx}: {cleaned_item}")
-            logger.info(f"✅ Cleaned attributes: {cleaned_item['attributes']} (type: {type(cleaned_item['attributes'])})")
-            cleaned.append(cleaned_item)
+        return cls._clean_fields(idx, raw, phone, created_by)
 
-        if not cleaned:
-            raise ValidationError("No valid contacts to enroll")
+    @classmethod
+    def _clean_phone(cls, idx: int, raw: Any, default_region: Optional[str] = None) -> Optional[str]:
+        if not isinstance(raw, dict):
+            raise ValidationError(f"Item {idx} must be an object")
 
-        logger.info(f"📤 Sending {len(cleaned)} cleaned contacts to repository")
-        for i, contact in enumerate(cleaned):
-            logger.info(f"📤 Final contact {i+1}: {contact}")
+        phone = raw.get("phone")
+        # normaliza a string y trim
+        if phone is None:
+            # lo ignoramos silenciosamente o puedes levantar error explícito:
+            # raise ValidationError(f"Item {idx}: 'phone' is required")
+            return None
+        if not isinstance(phone, str):
+            phone = str(phone)
+        phone = phone.strip()
+        if not phone:
+            return None
 
-        # delega al repo (ya validado y deduplicado)
-        # bulk_upsert debe devolver (inserted, existing) y no lanzar ConflictError
-        return self.repo.bulk_upsert(campaign_id, cleaned)
+        # valida formato básico de teléfono
+        if not cls._PHONE_RE.fullmatch(phone):
+            raise ValidationError(f"Item {idx}: invalid phone format '{phone}'")
+
+        # canónico E.164 para que '0991234567' y '+593991234567' sean el mismo contacto
+        info = normalize_phone(phone, default_region)
+        return info.e164 if info else phone
+
+    @classmethod
+    def _clean_fields(cls, idx: int, raw: Dict[str, Any], phone: str, created_by: str) -> Dict[str, Any]:
+        # attributes debe ser dict
+        attributes = raw.get("attributes")
+        if attributes is None:
+            attributes = {}
+        elif not isinstance(attributes, dict):
+            raise ValidationError(f"Item {idx}: 'attributes' must be an object")
+
+        info = normalize_phone(phone) if phone.startswith("+") else None
+        if info is not None and info.region:
+            # los valores que ya traiga el contacto tienen prioridad
+            attributes = {"phone_country": info.region, "phone_line_type": info.line_type, **attributes}
+
+        name = raw.get("name") or None
+        if isinstance(name, str):
+            name = name.strip() or None
+            if name and len(name) > 120:
+                name = name[:120]
+
+        cleaned_item = {
+            "phone": phone,
+            "name": name,
+            "attributes": attributes,
+            "created_by": created_by
+        }
+        if _row_sampler.sampled(idx):
+            logger.info("enroll_contacts.row", idx=idx, item=cleaned_item)
+        return cleaned_item
@@ -1,7 +1,12 @@
 import base64
 import csv
+import io
+import itertools
+from collections import deque
+from concurrent.futures import Executor
+import json
 from io import StringIO
-from typing import List, Dict, Any, Tuple
+from typing import BinaryIO, Callable, Iterable, Iterator, List, Dict, Any, Optional, Tuple
 from app.core.domain.errors import ValidationError
 from app.core.use_cases.enroll_contacts import EnrollContacts
 
@@ -9,35 +14,150 @@ class EnrollContactsCSV:
     """
     Caso de uso para enrolar contactos desde un archivo CSV en base64.
     El CSV debe tener columnas: phone, name, attributes
+    Si se indica copy_threshold y el archivo alcanza ese número de filas,
+    se usa la vía de importación masiva (repo.bulk_import).
     """
-    def __init__(self, enroll_contacts_uc: EnrollContacts):
+    def __init__(self, enroll_contacts_uc: EnrollContacts, copy_threshold: Optional[int] = None):
         self.enroll_contacts_uc = enroll_contacts_uc
+        self.copy_threshold = copy_threshold
 
     def __call__(self, campaign_id: int, csv_base64: str, created_by: str = "system") -> Tuple[int, int]:
-        try:
-            csv_bytes = base64.b64decode(csv_base64)
-            csv_str = csv_bytes.decode("utf-8")
-        except Exception:
-            raise ValidationError("Invalid base64 or encoding for CSV")
+        _, csv_str = _decode_base64(csv_base64)
 
         reader = csv.DictReader(StringIO(csv_str))
-        contacts: List[Dict[str, Any]] = []
-        import json
-        
-        for row in reader:
-            # Convierte attributes de string JSON a dict si corresponde
-            attributes = row.get("attributes")
-            if isinstance(attributes, str):
-                try:
-                    attributes = json.loads(attributes)
-                except Exception:
-                    attributes = {}
-            contacts.append({
-                "phone": row.get("phone"),
-                "name": row.get("name"),
-                "attributes": attributes,
-                "created_by": created_by
-            })
+        contacts: List[Dict[str, Any]] = list(_rows_to_contacts(reader, created_by))
         if not contacts:
             raise ValidationError("CSV file is empty or invalid format")
-        return self.enroll_contacts_uc(campaign_id, contacts, created_by)
\ No newline at end of file
+        if self.copy_threshold and len(contacts) >= self.copy_threshold:
+            return self.enroll_contacts_uc.enroll_import(campaign_id, contacts, created_by)
+        return self.enroll_contacts_uc(campaign_id, contacts, created_by)
+
+    def from_file(
+        self,
+        campaign_id: int,
+        file: BinaryIO,
+        created_by: str = "system",
+        chunk_size: int = 1000,
+    ) -> Tuple[int, int]:
+        """
+        Enrola desde un archivo binario (p.ej. UploadFile.file) leyéndolo de forma
+        incremental: decodifica, valida y hace upsert por chunks, con memoria acotada
+        al tamaño del chunk independientemente del tamaño del archivo.
+        """
+        contacts = self.read_file(file, created_by)
+        # Se leen como máximo copy_threshold filas para decidir la vía sin materializar el resto
+        head = list(itertools.islice(contacts, self.copy_threshold or 1))
+        if not head:
+            raise ValidationError("CSV file is empty or invalid format")
+        if self.copy_threshold and len(head) >= self.copy_threshold:
+            return self.enroll_contacts_uc.enroll_import(
+                campaign_id, itertools.chain(head, contacts), created_by
+            )
+        return self.enroll_contacts_uc.enroll_stream(
+            campaign_id, itertools.chain(head, contacts), created_by, chunk_size
+        )
+
+    def diff(self, campaign_id: int, csv_base64: str, created_by: str = "system") -> Dict[str, Any]:
+        """Dry-run del CSV en base64 (ver EnrollContacts.diff)."""
+        _, csv_str = _decode_base64(csv_base64)
+        contacts = _rows_to_contacts(csv.DictReader(StringIO(csv_str)), created_by)
+        return self.enroll_contacts_uc.diff(campaign_id, contacts, created_by)
+
+    def diff_file(self, campaign_id: int, file: BinaryIO, created_by: str = "system", chunk_size: int = 1000) -> Dict[str, Any]:
+        """Dry-run de un CSV leído en streaming (ver EnrollContacts.diff)."""
+        return self.enroll_contacts_uc.diff(campaign_id, self.read_file(file, created_by), created_by, chunk_size)
+
+    def read_file(self, file: BinaryIO, created_by: str = "system") -> Iterator[Dict[str, Any]]:
+        """Lee el CSV de forma incremental y produce los contactos crudos (sin validar)."""
+        return _rows_to_contacts(_read_rows(file), created_by)
+
+    def clean_file_chunks(
+        self,
+        file: BinaryIO,
+        created_by: str = "system",
+        chunk_size: int = 1000,
+        on_reject: Optional[Callable[[int, ValidationError], None]] = None,
+        executor: Optional[Executor] = None,
+        in_flight: int = 2,
+    ) -> Iterator[Tuple[int, List[Dict[str, Any]]]]:
+        """
+        EnrollContacts.clean_chunks sobre un CSV leído en streaming. Con executor (el pool
+        de procesos del worker de importaciones) json.loads y la validación corren en el
+        pool, por tramos de chunk_size registros y con hasta in_flight tramos en vuelo
+        (~2 por proceso; acota la memoria). Este proceso solo separa los registros con
+        csv.DictReader (un campo entre comillas puede tener saltos de línea) y une los
+        tramos en orden: deduplicación, rechazos y mensajes son los del camino serial.
+        Produce un chunk por tramo.
+        """
+        enroll_uc = self.enroll_contacts_uc
+        if executor is None:
+            yield from enroll_uc.clean_chunks(self.read_file(file, created_by), created_by, chunk_size, on_reject)
+            return
+
+        rows = _read_rows(file)
+        pending: deque = deque()
+        seen_phones: set[str] = set()
+        read = 0
+
+        def _submit(batch: List[Dict[str, Any]], start: int) -> None:
+            pending.append((
+                start + len(batch),
+                executor.submit(_prevalidate_rows, batch, start, created_by, enroll_uc.default_region),
+            ))
+
+        def _merge() -> Tuple[int, List[Dict[str, Any]]]:
+            upto, future = pending.popleft()
+            return upto, list(enroll_uc.merge_prevalidated(future.result(), seen_phones, on_reject))
+
+        for batch in iter(lambda: list(itertools.islice(rows, chunk_size)), []):
+            _submit(batch, read)
+            read += len(batch)
+            if len(pending) >= in_flight:
+                yield _merge()
+        if not pending:
+            yield 0, []
+        while pending:
+            yield _merge()
+
+def _decode_base64(csv_base64: str) -> Tuple[bytes, str]:
+    try:
+        csv_bytes = base64.b64decode(csv_base64)
+        return csv_bytes, csv_bytes.decode("utf-8")
+    except Exception:
+        raise ValidationError("Invalid base64 or encoding for CSV")
+
+def _rows_to_contacts(rows: Iterable[Dict[str, Any]], created_by: str) -> Iterator[Dict[str, Any]]:
+    for row in rows:
+        # Convierte attributes de string JSON a dict si corresponde
+        attributes = row.get("attributes")
+        if isinstance(attributes, str):
+            try:
+                attributes = json.loads(attributes)
+            except Exception:
+                attributes = {}
+        yield {
+            "phone": row.get("phone"),
+            "name": row.get("name"),
+            "attributes": attributes,
+            "created_by": created_by
+        }
+
+def _read_rows(file: BinaryIO) -> Iterator[Dict[str, str]]:
+    text = io.TextIOWrapper(file, encoding="utf-8", newline="")
+    try:
+        yield from csv.DictReader(text)
+    except UnicodeDecodeError:
+        raise ValidationError("Invalid encoding for CSV")
+    except csv.Error as ex:
+        raise ValidationError(f"Invalid CSV format: {ex}")
+    finally:
+        text.detach()  # el archivo lo cierra quien lo abrió
+
+def _prevalidate_rows(
+    rows: List[Dict[str, str]],
+    start: int,
+    created_by: str,
+    default_region: Optional[str] = None,
+) -> List[tuple]:
+    # Corre en un proceso del pool: json.loads + reglas de EnrollContacts
+    return EnrollContacts.prevalidate(_rows_to_contacts(rows, created_by), created_by, default_region, start)
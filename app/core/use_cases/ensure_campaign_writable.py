@@ -0,0 +1,22 @@
+# app/core/use_cases/ensure_campaign_writable.py
+from typing import Optional
+from app.core.domain.entities.campaign import Campaign
+from app.core.domain.errors import ConflictError
+from app.core.domain.repositories.campaign_repository import CampaignRepository
+
+class EnsureCampaignWritable:
+    """
+    Guardia para escrituras de contactos: una campaña en 'Deleting' ya no acepta
+    contactos nuevos ni cambios (el purgador la está borrando por chunks).
+    La fila queda bloqueada (FOR SHARE) hasta el commit, así que la campaña no
+    puede pasar a 'Deleting' a mitad de la transacción; quien confirma por chunks
+    vuelve a llamarla después de cada commit.
+    """
+    def __init__(self, repo: CampaignRepository):
+        self.repo = repo
+
+    def __call__(self, campaign_id: int) -> Optional[Campaign]:
+        campaign = self.repo.get_for_write(campaign_id)
+        if campaign and campaign.status == "Deleting":
+            raise ConflictError("Campaign is being deleted")
+        return campaign
@@ -0,0 +1,78 @@
+# app/core/use_cases/lease_contacts.py
+from datetime import datetime, timedelta
+from typing import Any, Callable, List, Optional, Tuple
+from app.core.domain.entities.campaign_contact import CampaignContact
+from app.core.domain.errors import NotFoundError, ConflictError, ValidationError
+from app.core.domain.schedule import schedule_for
+from app.core.domain.pacing import DispatchLimiter, PacingPolicy
+from app.core.domain.repositories.campaign_repository import CampaignRepository
+from app.core.domain.repositories.campaign_contact_repository import CampaignContactRepository
+from app.config.log import get_logger
+
+logger = get_logger(__name__)
+
+class LeaseContacts:
+    """
+    Entrega a un nodo dialer hasta n contactos para llamar:
+    - La campaña debe estar Active y dentro de su vigencia/franja horaria
+      (fuera de franja no es error: se devuelve una lista vacía).
+    - Los contactos pasan a Dialing con next_attempt_at = vencimiento del lease; si el
+      dialer no reporta el resultado antes, el contacto se libera de nuevo.
+    - scheduler (opcional): elige los candidatos desde memoria y solo los confirma en
+      la base (ver DueContactScheduler); sin él, el lease es una consulta SQL.
+    - limiter (opcional): si campaign.config define max_cps / max_concurrent, el lease
+      se hace dentro del permiso del limiter y se confirma (commit) antes de soltarlo,
+      para que el siguiente lease de la campaña vea los Dialing ya contados.
+    """
+    def __init__(
+        self,
+        campaign_repo: CampaignRepository,
+        contact_repo: CampaignContactRepository,
+        scheduler: Optional[Any] = None,
+        limiter: Optional[DispatchLimiter] = None,
+        commit: Optional[Callable[[], None]] = None,
+    ):
+        self.campaign_repo = campaign_repo
+        self.contact_repo = contact_repo
+        self.scheduler = scheduler
+        self.limiter = limiter
+        self.commit = commit
+
+    def __call__(
+        self,
+        campaign_id: int,
+        n: int,
+        now: datetime,
+        lease_seconds: int,
+    ) -> Tuple[List[CampaignContact], Optional[datetime]]:
+        if n < 1:
+            raise ValidationError("n must be >= 1")
+        campaign = self.campaign_repo.get(campaign_id)
+        if not campaign:
+            raise NotFoundError("Campaign not found")
+        if campaign.status != "Active":
+            raise ConflictError(f"Cannot dispatch campaign in status {campaign.status}")
+        if not schedule_for(campaign, now).is_open(now):
+            return [], None
+
+        lease_until = now + timedelta(seconds=lease_seconds)
+        policy = PacingPolicy.from_config(campaign.config)
+        if self.limiter is None or not policy.limited:
+            leased = self._lease(campaign_id, n, campaign.max_attempts, now, lease_until)
+        else:
+            with self.limiter.permit(campaign_id, n, policy, now) as permit:
+                leased = self._lease(campaign_id, permit.granted, campaign.max_attempts, now, lease_until)
+                permit.consume(len(leased))
+                if self.commit is not None:
+                    self.commit()
+            if len(leased) < n:
+                logger.debug("dispatch.paced", campaign_id=campaign_id, requested=n, granted=permit.granted)
+        logger.debug("dispatch.lease", campaign_id=campaign_id, requested=n, leased=len(leased))
+        return leased, lease_until
+
+    def _lease(self, campaign_id: int, n: int, max_attempts: int, now: datetime, lease_until: datetime) -> List[CampaignContact]:
+        if n <= 0:
+            return []
+        if self.scheduler is not None:
+            return self.scheduler.lease(self.contact_repo, campaign_id, n, max_attempts, now, lease_until)
+        return self.contact_repo.lease_due(campaign_id, n, max_attempts, now, lease_until)
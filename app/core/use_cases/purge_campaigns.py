@@ -0,0 +1,54 @@
+# app/core/use_cases/purge_campaigns.py
+from typing import Callable, Optional
+from app.core.domain.repositories.campaign_repository import CampaignRepository
+from app.core.domain.errors import ConflictError
+from app.config.log import get_logger
+
+logger = get_logger(__name__)
+
+class PurgeCampaigns:
+    """
+    Borra en segundo plano las campañas marcadas como 'Deleting':
+    - Cada llamada toma una campaña (SKIP LOCKED) y borra un chunk de contactos,
+      confirmando enseguida: los locks duran lo que dura un chunk, no la campaña.
+    - Cuando ya no quedan contactos borra la fila de la campaña.
+    - El progreso se ve en los logs y en GET /campaigns/{id}/stats (los contadores
+      bajan con cada chunk).
+    - Si hay registros relacionados que lo impiden (ON DELETE RESTRICT, p.ej. calls)
+      la campaña pasa a 'DeleteFailed' para no reintentarla sin fin.
+    """
+    def __init__(
+        self,
+        repo: CampaignRepository,
+        commit: Callable[[], None],
+        rollback: Callable[[], None],
+        chunk_size: int = 5000,
+    ):
+        self.repo = repo
+        self.commit = commit
+        self.rollback = rollback
+        self.chunk_size = chunk_size
+
+    def __call__(self) -> Optional[int]:
+        """Procesa un chunk. Devuelve el campaign_id trabajado o None si no hay pendientes."""
+        campaign_id = self.repo.claim_deleting()
+        if campaign_id is None:
+            return None
+
+        try:
+            deleted = self.repo.purge_contacts(campaign_id, self.chunk_size)
+            if not deleted:
+                self.repo.delete(campaign_id)
+        except ConflictError as ex:
+            self.rollback()
+            self.repo.update(campaign_id, {"status": "DeleteFailed"})
+            self.commit()
+            logger.error("campaign_purge.failed", campaign_id=campaign_id, reason=str(ex))
+            return campaign_id
+
+        self.commit()
+        if deleted:
+            logger.info("campaign_purge.chunk", campaign_id=campaign_id, deleted=deleted)
+        else:
+            logger.info("campaign_purge.done", campaign_id=campaign_id)
+        return campaign_id
@@ -0,0 +1,49 @@
+# app/core/use_cases/report_outcomes.py
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+from app.core.domain.errors import NotFoundError, ValidationError
+from app.core.domain.schedule import schedule_for
+from app.core.domain.repositories.campaign_repository import CampaignRepository
+from app.core.domain.repositories.campaign_contact_repository import CampaignContactRepository
+from app.config.log import get_logger
+
+logger = get_logger(__name__)
+
+class ReportOutcomes:
+    """
+    Cierra los leases de /dispatch/lease con el resultado de cada llamada.
+    Cada resultado repite el lease_expires_at de su lease, que identifica el lease: todo
+    el lote se aplica en una sentencia y los que no corresponden al lease vigente del
+    contacto (lease vencido, liberado o reasignado a otro dialer; reporte duplicado) se
+    devuelven como ignorados.
+    """
+    def __init__(self, campaign_repo: CampaignRepository, contact_repo: CampaignContactRepository):
+        self.campaign_repo = campaign_repo
+        self.contact_repo = contact_repo
+
+    def __call__(self, campaign_id: int, outcomes: List[Dict[str, Any]], now: datetime) -> Dict[str, Any]:
+        if not outcomes:
+            raise ValidationError("outcomes is empty")
+        campaign = self.campaign_repo.get(campaign_id)
+        if not campaign:
+            raise NotFoundError("Campaign not found")
+
+        # Reintento a retry_minutes, corrido a la próxima apertura de la franja si cae fuera
+        retry_at = now + timedelta(minutes=campaign.retry_minutes)
+        retry_at = schedule_for(campaign, now).next_open(retry_at) or retry_at
+
+        # Un contacto repetido en el lote: gana el último reporte
+        by_id = {o["campaign_contact_id"]: o for o in outcomes}
+        applied = self.contact_repo.apply_outcomes(
+            campaign_id, list(by_id.values()), campaign.max_attempts, retry_at, now
+        )
+
+        summary: Dict[str, int] = {}
+        for st in applied.values():
+            summary[st] = summary.get(st, 0) + 1
+        ignored = sorted(set(by_id) - set(applied))
+        logger.info(
+            "dispatch.outcomes",
+            campaign_id=campaign_id, received=len(outcomes), applied=len(applied), ignored=len(ignored),
+        )
+        return {"applied": len(applied), "statuses": summary, "ignored": ignored}
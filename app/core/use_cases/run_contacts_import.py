@@ -0,0 +1,73 @@
+# app/core/use_cases/run_contacts_import.py
+from concurrent.futures import Executor
+from typing import Any, BinaryIO, Callable, Optional
+from app.core.domain.entities.contact_import_job import ContactImportJob
+from app.core.domain.errors import ValidationError
+from app.core.domain.repositories.contact_import_job_repository import ContactImportJobRepository
+from app.core.use_cases.enroll_contacts_csv import EnrollContactsCSV
+from app.config.log import get_logger
+
+logger = get_logger(__name__)
+
+class RunContactsImport:
+    """
+    Procesa un job de importación encolado:
+    - Lee el CSV en streaming y valida con las reglas de EnrollContacts.
+    - Las filas inválidas se cuentan como rechazadas (no abortan el job).
+    - Hace upsert por chunks marcando source_batch_id = job_id, y confirma cada
+      chunk junto con el progreso del job (commit inyectado por quien maneja la sesión).
+    - ensure_writable (opcional, EnsureCampaignWritable): se verifica la campaña al
+      empezar cada chunk; si pasó a 'Deleting' el job termina con ConflictError.
+    - executor (opcional, pool de procesos): valida el CSV en paralelo con
+      EnrollContactsCSV.clean_file_chunks; in_flight acota los tramos pendientes.
+    """
+    def __init__(
+        self,
+        enroll_csv_uc: EnrollContactsCSV,
+        job_repo: ContactImportJobRepository,
+        commit: Callable[[], None],
+        ensure_writable: Optional[Callable[[int], Any]] = None,
+        executor: Optional[Executor] = None,
+        in_flight: int = 2,
+    ):
+        self.enroll_csv_uc = enroll_csv_uc
+        self.job_repo = job_repo
+        self.commit = commit
+        self.ensure_writable = ensure_writable
+        self.executor = executor
+        self.in_flight = in_flight
+
+    def __call__(self, job: ContactImportJob, file: BinaryIO, chunk_size: int = 1000) -> None:
+        enroll_uc = self.enroll_csv_uc.enroll_contacts_uc
+        inserted = updated = rejected = 0
+
+        def _reject(idx: int, ex: ValidationError) -> None:
+            nonlocal rejected
+            rejected += 1
+            logger.debug("contact_import.row_rejected", job_id=job.job_id, idx=idx, reason=str(ex))
+
+        chunks = self.enroll_csv_uc.clean_file_chunks(
+            file, job.created_by, chunk_size, _reject, self.executor, self.in_flight,
+        )
+        for read, chunk in chunks:
+            if chunk:
+                if self.ensure_writable is not None:
+                    self.ensure_writable(job.campaign_id)
+                for item in chunk:
+                    item["source_batch_id"] = job.job_id
+                ins, ex = enroll_uc.repo.bulk_upsert(job.campaign_id, chunk)
+                inserted, updated = inserted + ins, updated + ex
+            self.job_repo.update_progress(job.job_id, read, inserted, updated, rejected)
+            self.commit()
+            logger.debug(
+                "contact_import.progress",
+                job_id=job.job_id, rows=read, inserted=inserted, updated=updated, rejected=rejected,
+            )
+
+        self.job_repo.finish(job.job_id, "Done")
+        self.commit()
+        logger.info(
+            "contact_import.done",
+            job_id=job.job_id, campaign_id=job.campaign_id,
+            inserted=inserted, updated=updated, rejected=rejected,
+        )
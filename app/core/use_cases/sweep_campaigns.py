@@ -0,0 +1,52 @@
+# app/core/use_cases/sweep_campaigns.py
+from datetime import datetime
+from typing import Callable, Dict
+from app.core.domain.repositories.campaign_repository import CampaignRepository
+from app.core.domain.repositories.campaign_contact_repository import CampaignContactRepository
+from app.config.log import get_logger
+
+logger = get_logger(__name__)
+
+class SweepCampaigns:
+    """
+    Una pasada del ciclo de vida de campañas, con sentencias set-based (no lee
+    campañas una por una):
+    1. Libera leases vencidos: Dialing con next_attempt_at < now vuelve a Pending,
+       en lotes de `batch_size` confirmados uno a uno.
+    2. Scheduled -> Active cuando llega start_at.
+    3. -> Finished cuando pasa end_at, o cuando una campaña Active ya no tiene
+       contactos en Pending/Dialing (según campaign_contact_stats).
+    Los leases se liberan antes de cerrar campañas: un Dialing vencido sigue abierto.
+    """
+    def __init__(
+        self,
+        campaign_repo: CampaignRepository,
+        contact_repo: CampaignContactRepository,
+        commit: Callable[[], None],
+        batch_size: int = 5000,
+    ):
+        self.campaign_repo = campaign_repo
+        self.contact_repo = contact_repo
+        self.commit = commit
+        self.batch_size = batch_size
+
+    def __call__(self, now: datetime) -> Dict[str, int]:
+        released = 0
+        while True:
+            batch = self.contact_repo.release_expired_leases(now, self.batch_size)
+            self.commit()
+            n = sum(batch.values())
+            released += n
+            if batch:
+                logger.info("campaign_sweep.leases_released", released=n, campaigns=sorted(batch))
+            if n < self.batch_size:
+                break
+
+        activated = self.campaign_repo.activate_started(now)
+        finished = self.campaign_repo.finish_completed(now)
+        self.commit()
+        if activated:
+            logger.info("campaign_sweep.activated", campaign_ids=activated)
+        if finished:
+            logger.info("campaign_sweep.finished", campaign_ids=finished)
+        return {"released": released, "activated": len(activated), "finished": len(finished)}
@@ -1,6 +1,8 @@
 from app.core.domain.repositories.campaign_repository import CampaignRepository
 from app.core.domain.entities.campaign import Campaign
 from app.core.domain.errors import NotFoundError, ValidationError, ConflictError
+from app.core.domain.pacing import PacingPolicy
+from app.core.domain.schedule import SCHEDULE_FIELDS, invalidate_schedule
 
 class UpdateCampaign:
     def __init__(self, repo: CampaignRepository):
@@ -13,4 +15,11 @@ class UpdateCampaign:
         obj = self.repo.get(campaign_id)
         if not obj:
             raise NotFoundError("Campaign not found")
-        return self.repo.update(campaign_id, data)
\ No newline at end of file
+        if obj.status == "Deleting":
+            raise ConflictError("Campaign is being deleted")
+        if "config" in data:
+            PacingPolicy.from_config(data["config"])
+        updated = self.repo.update(campaign_id, data)
+        if any(f in data for f in SCHEDULE_FIELDS):
+            invalidate_schedule(campaign_id)
+        return updated
\ No newline at end of file
@@ -0,0 +1,27 @@
+# backend/app/infrastructure/db/advisory_lock.py
+from contextlib import contextmanager
+from typing import Iterator
+
+from sqlalchemy import text
+
+from app.infrastructure.db.session import engine
+
+# Claves de advisory locks de la aplicación (bigint, únicas en toda la base)
+CAMPAIGN_SWEEPER_LOCK = 7_301_001
+
+@contextmanager
+def try_advisory_lock(key: int) -> Iterator[bool]:
+    """
+    pg_try_advisory_lock de sesión sobre una conexión dedicada: yield True si se obtuvo
+    (se libera al salir), False si otro proceso lo tiene. No espera.
+    La conexión es aparte para que el trabajo protegido pueda confirmar por lotes.
+    """
+    with engine.connect() as conn:
+        acquired = conn.scalar(text("SELECT pg_try_advisory_lock(:key)"), {"key": key})
+        conn.commit()
+        try:
+            yield bool(acquired)
+        finally:
+            if acquired:
+                conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": key})
+                conn.commit()
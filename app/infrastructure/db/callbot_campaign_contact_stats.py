@@ -0,0 +1,21 @@
+# backend/app/infrastructure/db/callbot_campaign_contact_stats.py
+from __future__ import annotations
+from sqlalchemy import Integer, SmallInteger, String, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+from app.infrastructure.db.base import Base
+
+# Contadores de contactos por (campaña, status), repartidos en CONTACT_STATS_SHARDS filas:
+# el valor es la suma de los shards. Los mantiene cada escritura de contactos en la misma
+# transacción; se reconstruyen (en el shard 0) con app.cli.reconcile_contact_stats.
+class CampaignContactStatsORM(Base):
+    __tablename__ = "campaign_contact_stats"
+    __table_args__ = {"schema": "callbot"}
+
+    campaign_id: Mapped[int] = mapped_column(
+        ForeignKey("callbot.campaigns.campaign_id", ondelete="CASCADE"),
+        primary_key=True
+    )
+    status: Mapped[str] = mapped_column(String(20), primary_key=True)
+    # Cada conexión escribe siempre en el mismo shard (pg_backend_pid() % shards)
+    shard: Mapped[int] = mapped_column(SmallInteger, primary_key=True, default=0)
+    contacts: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
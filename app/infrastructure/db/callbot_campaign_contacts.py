@@ -1,20 +1,45 @@
 # backend/app/infraestructure/db/callbot_campaign_contacts.py
 from __future__ import annotations
 from datetime import datetime
-from sqlalchemy import Integer, String, Text, JSON, SmallInteger, TIMESTAMP, ForeignKey
+from sqlalchemy import Integer, String, Text, JSON, SmallInteger, TIMESTAMP, ForeignKey, Index, UniqueConstraint, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.infrastructure.db.base import Base
 from app.security.auth import now_utc
 
 class CampaignContactORM(Base):
     __tablename__ = "campaign_contacts"
-    __table_args__ = {"schema": "callbot"}
+    __table_args__ = (
+        # Un teléfono por campaña: árbitro de los ON CONFLICT (campaign_id, phone) de upsert/bulk
+        UniqueConstraint("campaign_id", "phone", name="uq_campaign_contacts_campaign_phone"),
+        # list(): keyset por campaign_contact_id DESC dentro de la campaña
+        Index("ix_campaign_contacts_campaign_id_desc", "campaign_id", text("campaign_contact_id DESC")),
+        # Filtros por status (list/export/bulk, reconcile de contadores)
+        Index("ix_campaign_contacts_campaign_status_next", "campaign_id", "status", "next_attempt_at"),
+        # Lease: Pending vencidos en orden de vencimiento (NULL = ya vencido); misma expresión
+        # que _DUE_AT en el repositorio para que el planner use el índice
+        Index("ix_campaign_contacts_due", "campaign_id",
+              text("(coalesce(next_attempt_at, '-infinity'::timestamptz))"), "campaign_contact_id",
+              postgresql_where=text("status = 'Pending'")),
+        # Sweeper: leases vencidos (Dialing con next_attempt_at < now), conjunto chico
+        Index("ix_campaign_contacts_dialing_lease", "next_attempt_at",
+              postgresql_where=text("status = 'Dialing'")),
+        # Búsqueda de list(q=...): trigramas para ILIKE '%q%' (requiere la extensión pg_trgm)
+        Index("ix_campaign_contacts_name_trgm", "name",
+              postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}),
+        Index("ix_campaign_contacts_phone_trgm", "phone",
+              postgresql_using="gin", postgresql_ops={"phone": "gin_trgm_ops"}),
+        # Búsqueda por sufijo ("últimos N dígitos"): reverse(phone) LIKE 'N...%'
+        Index("ix_campaign_contacts_phone_reversed", "campaign_id",
+              text("reverse(phone) text_pattern_ops")),
+        {"schema": "callbot"},
+    )
 
     campaign_contact_id: Mapped[int] = mapped_column(Integer, primary_key=True)
 
     campaign_id: Mapped[int] = mapped_column(
+        # Sin índice propio: lo cubren los índices compuestos que empiezan por campaign_id
         ForeignKey("callbot.campaigns.campaign_id", ondelete="CASCADE"),
-        nullable=False, index=True
+        nullable=False
     )
 
     # Datos de contacto
@@ -39,6 +64,6 @@ class CampaignContactORM(Base):
     campaign = relationship(
         "CampaignORM", 
         back_populates="contacts", 
-        lazy="selectin")
+        lazy="select")  # no se carga por defecto; usar joinedload en la consulta que lo necesite
 
 
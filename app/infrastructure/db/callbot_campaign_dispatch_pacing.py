@@ -0,0 +1,19 @@
+# backend/app/infrastructure/db/callbot_campaign_dispatch_pacing.py
+from __future__ import annotations
+from datetime import datetime
+from sqlalchemy import Float, TIMESTAMP, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+from app.infrastructure.db.base import Base
+
+# Token bucket de despacho por campaña (compartido por todos los procesos de la API).
+# La fila se bloquea (FOR UPDATE) durante cada lease de una campaña con límites.
+class CampaignDispatchPacingORM(Base):
+    __tablename__ = "campaign_dispatch_pacing"
+    __table_args__ = {"schema": "callbot"}
+
+    campaign_id: Mapped[int] = mapped_column(
+        ForeignKey("callbot.campaigns.campaign_id", ondelete="CASCADE"),
+        primary_key=True
+    )
+    tokens: Mapped[float] = mapped_column(Float, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(TIMESTAMP(timezone=True), nullable=False)
@@ -18,7 +18,7 @@ class CampaignTypeORM(Base):
     campaigns: Mapped[list["CampaignORM"]] = relationship(
         "CampaignORM",
         back_populates="campaign_type",
-        lazy="selectin",
+        lazy="select",  # no se carga por defecto; usar selectinload en la consulta que lo necesite
         cascade="all, delete",
         passive_deletes=True,
     )
@@ -45,15 +45,15 @@ class CampaignORM(Base):
     campaign_type = relationship(
         "CampaignTypeORM",
         back_populates="campaigns", #crear relacion bidreccional para poder acceder desde CampaignTypeORM
-        lazy="selectin",
+        lazy="select",  # no se carga por defecto; usar selectinload/joinedload en la consulta que lo necesite
     )
 
     contacts = relationship(
         "CampaignContactORM",
         back_populates="campaign", #crear relacion bidreccional para poder acceder desde CampaignContactORM
         cascade="all, delete-orphan",
-        passive_deletes=True,
-        lazy="selectin",
+        passive_deletes=True,  # el borrado lo resuelve ON DELETE CASCADE sin cargar la colección
+        lazy="select",  # una campaña puede tener millones de contactos: nunca se carga por defecto
     )
 
     #Para debugging
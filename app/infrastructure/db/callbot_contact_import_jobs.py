@@ -0,0 +1,37 @@
+# backend/app/infrastructure/db/callbot_contact_import_jobs.py
+from __future__ import annotations
+from datetime import datetime
+from sqlalchemy import Integer, String, Text, TIMESTAMP, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+from app.infrastructure.db.base import Base
+from app.security.auth import now_utc
+
+# Tabla de jobs de importación de contactos (cola procesada por app.workers.contact_import_worker)
+class ContactImportJobORM(Base):
+    __tablename__ = "contact_import_jobs"
+    __table_args__ = {"schema": "callbot"}
+
+    job_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+
+    campaign_id: Mapped[int] = mapped_column(
+        ForeignKey("callbot.campaigns.campaign_id", ondelete="CASCADE"),
+        nullable=False, index=True
+    )
+
+    status: Mapped[str] = mapped_column(String(20), default="Queued", nullable=False, index=True)
+    file_path: Mapped[str] = mapped_column(Text, nullable=False)
+
+    # Progreso
+    rows_processed: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    inserted: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    updated: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    rejected: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    error: Mapped[str | None] = mapped_column(Text)
+
+    created_by: Mapped[str] = mapped_column(String(80), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(TIMESTAMP(timezone=True), default=now_utc)
+    started_at: Mapped[datetime | None] = mapped_column(TIMESTAMP(timezone=True))
+    finished_at: Mapped[datetime | None] = mapped_column(TIMESTAMP(timezone=True))
+
+    def __repr__(self) -> str:
+        return f"<ContactImportJobORM id={self.job_id} campaign={self.campaign_id} status={self.status!r}>"
@@ -0,0 +1,20 @@
+# backend/app/infrastructure/db/models.py
+
+def load_all_models() -> None:
+    # Importaciones por efecto colateral: registran los mappers en Base.metadata.
+    # La usan la API y los procesos worker antes de abrir sesiones.
+    import app.infrastructure.db.roles
+    import app.infrastructure.db.scopes
+    import app.infrastructure.db.role_scopes
+    import app.infrastructure.db.user_roles
+    import app.infrastructure.db.users                 
+    import app.infrastructure.db.refresh_tokens        
+    import app.infrastructure.db.revoked_access_tokens  
+    import app.infrastructure.db.callbot_campaign_types      
+    import app.infrastructure.db.callbot_campaigns                
+    import app.infrastructure.db.callbot_campaign_contacts                 
+    import app.infrastructure.db.callbot_contact_import_jobs
+    import app.infrastructure.db.callbot_campaign_contact_stats
+    import app.infrastructure.db.callbot_campaign_dispatch_pacing
+    from sqlalchemy.orm import configure_mappers
+    configure_mappers()
@@ -0,0 +1,151 @@
+# backend/app/infrastructure/db/partitioning.py
+"""
+Particiones de callbot.campaign_contacts (CONTACTS_PARTITIONING).
+
+Una partición LIST por campaña (campaign_contacts_c<id>): las consultas con
+campaign_id solo leen la de su campaña y borrar una campaña es eliminar su tabla.
+
+- create_contacts_partition: tabla nueva + ATTACH PARTITION, que toma SHARE UPDATE
+  EXCLUSIVE sobre la tabla padre (no bloquea lecturas ni escrituras de otras
+  campañas, a diferencia de CREATE TABLE ... PARTITION OF).
+- drop_contacts_partition: DETACH + DROP. Requiere un lock breve ACCESS EXCLUSIVE
+  sobre la tabla padre; con lock_timeout el purgador reintenta en vez de encolar
+  todas las consultas de contactos detrás de una lectura larga.
+- convert_contacts_table: convierte la tabla entera (o la revierte); la usa
+  app.cli.partition_campaign_contacts en una ventana de mantenimiento.
+"""
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+_SCHEMA = "callbot"
+_PARENT = "callbot.campaign_contacts"
+_DROP_LOCK_TIMEOUT = "5s"
+
+def partition_name(campaign_id: int) -> str:
+    return f"campaign_contacts_c{int(campaign_id)}"
+
+def partition_exists(db: Session, campaign_id: int) -> bool:
+    return db.scalar(
+        text("SELECT to_regclass(:name) IS NOT NULL"),
+        {"name": f"{_SCHEMA}.{partition_name(campaign_id)}"},
+    )
+
+def create_contacts_partition(db: Session, campaign_id: int) -> None:
+    name = f"{_SCHEMA}.{partition_name(campaign_id)}"
+    db.execute(text(f"CREATE TABLE IF NOT EXISTS {name} (LIKE {_PARENT} INCLUDING DEFAULTS)"))
+    # Los índices, la PK/UNIQUE y la FK se heredan del padre al adjuntarla (tabla vacía: inmediato)
+    db.execute(text(f"ALTER TABLE {_PARENT} ATTACH PARTITION {name} FOR VALUES IN ({int(campaign_id)})"))
+
+def drop_contacts_partition(db: Session, campaign_id: int) -> bool:
+    """Elimina la partición de la campaña. False si no tiene (filas en la DEFAULT)."""
+    if not partition_exists(db, campaign_id):
+        return False
+    name = f"{_SCHEMA}.{partition_name(campaign_id)}"
+    db.execute(text(f"SET LOCAL lock_timeout = '{_DROP_LOCK_TIMEOUT}'"))
+    db.execute(text(f"ALTER TABLE {_PARENT} DETACH PARTITION {name}"))
+    db.execute(text(f"DROP TABLE {name}"))
+    return True
+
+# ---------- Conversión de la tabla (app.cli.partition_campaign_contacts) ----------
+# Columnas, constraint e índices de campaign_contacts en head (migraciones 0001-0003): si
+# una migración nueva los cambia, se actualizan también aquí.
+
+_SEQ = "callbot.campaign_contacts_campaign_contact_id_seq"
+
+_COLUMNS = f"""
+    campaign_contact_id integer NOT NULL DEFAULT nextval('{_SEQ}'),
+    campaign_id integer NOT NULL REFERENCES callbot.campaigns (campaign_id) ON DELETE CASCADE,
+    phone varchar(25) NOT NULL,
+    name varchar(120),
+    attributes json NOT NULL,
+    status varchar(20) NOT NULL,
+    attempt_count smallint NOT NULL,
+    next_attempt_at timestamptz,
+    last_disposition varchar(60),
+    last_error text,
+    notes text,
+    source_batch_id integer,
+    created_at timestamptz NOT NULL,
+    updated_at timestamptz,
+    created_by varchar(80) NOT NULL
+"""
+
+_COPY_COLUMNS = (
+    "campaign_contact_id, campaign_id, phone, name, attributes, status, attempt_count, "
+    "next_attempt_at, last_disposition, last_error, notes, source_batch_id, created_at, updated_at, created_by"
+)
+
+# Sin CONCURRENTLY: no aplica a tablas particionadas y la tabla está bloqueada
+_INDEXES = (
+    "CREATE INDEX ix_campaign_contacts_campaign_id_desc ON {t} (campaign_id, campaign_contact_id DESC)",
+    "CREATE INDEX ix_campaign_contacts_campaign_status_next ON {t} (campaign_id, status, next_attempt_at)",
+    "CREATE INDEX ix_campaign_contacts_due ON {t} "
+    "(campaign_id, (coalesce(next_attempt_at, '-infinity'::timestamptz)), campaign_contact_id) "
+    "WHERE status = 'Pending'",
+    "CREATE INDEX ix_campaign_contacts_dialing_lease ON {t} (next_attempt_at) WHERE status = 'Dialing'",
+    "CREATE INDEX ix_campaign_contacts_name_trgm ON {t} USING gin (name gin_trgm_ops)",
+    "CREATE INDEX ix_campaign_contacts_phone_trgm ON {t} USING gin (phone gin_trgm_ops)",
+    "CREATE INDEX ix_campaign_contacts_phone_reversed ON {t} (campaign_id, reverse(phone) text_pattern_ops)",
+)
+
+_CREATE_PARTITIONS = """
+    DO $$
+    DECLARE cid integer;
+    BEGIN
+        FOR cid IN SELECT campaign_id FROM callbot.campaigns ORDER BY campaign_id LOOP
+            EXECUTE format(
+                'CREATE TABLE callbot.%I PARTITION OF callbot.campaign_contacts FOR VALUES IN (%s)',
+                'campaign_contacts_c' || cid, cid
+            );
+        END LOOP;
+    END $$
+"""
+
+def contacts_partitioned(db: Session) -> bool:
+    """True si campaign_contacts es hoy una tabla particionada."""
+    return db.scalar(text(f"SELECT relkind = 'p' FROM pg_class WHERE oid = '{_PARENT}'::regclass"))
+
+def convert_contacts_table(db: Session, partitioned: bool) -> None:
+    """
+    Reescribe campaign_contacts particionada por LIST (campaign_id) o sin particionar,
+    dentro de la transacción de `db` (el DDL es transaccional: un error no deja nada a
+    medias). Toma ACCESS EXCLUSIVE sobre la tabla hasta el commit y dura lo que copiar
+    las filas.
+
+    Particionada, la PK pasa a (campaign_contact_id, campaign_id) porque debe incluir la
+    clave de partición; campaign_contact_id sigue saliendo de la misma secuencia. Se crea
+    una partición por campaña existente y una DEFAULT de respaldo que debe quedar vacía
+    (CampaignRepository.create crea la partición de cada campaña nueva). Tablas de otros
+    módulos con FK a campaign_contacts(campaign_contact_id) deben referenciar
+    (campaign_contact_id, campaign_id) antes de convertir.
+    """
+    old = "campaign_contacts_unpartitioned" if partitioned else "campaign_contacts_partitioned"
+    pk = "campaign_contact_id, campaign_id" if partitioned else "campaign_contact_id"
+    suffix = " PARTITION BY LIST (campaign_id)" if partitioned else ""
+
+    db.execute(text(f"LOCK TABLE {_PARENT} IN ACCESS EXCLUSIVE MODE"))
+    db.execute(text(f"ALTER TABLE {_PARENT} RENAME TO {old}"))
+    # Los nombres de índices/constraints son por schema: se liberan para la tabla nueva
+    db.execute(text(f"ALTER TABLE {_SCHEMA}.{old} DROP CONSTRAINT IF EXISTS uq_campaign_contacts_campaign_phone"))
+    for ddl in _INDEXES:
+        db.execute(text(f"DROP INDEX IF EXISTS {_SCHEMA}.{ddl.split()[2]}"))
+    db.execute(text(f"ALTER TABLE {_SCHEMA}.{old} RENAME CONSTRAINT campaign_contacts_pkey TO {old}_pkey"))
+    db.execute(text(f"ALTER SEQUENCE {_SEQ} OWNED BY NONE"))
+    db.execute(text(
+        f"CREATE TABLE {_PARENT} ({_COLUMNS.rstrip()},\n"
+        f"    CONSTRAINT campaign_contacts_pkey PRIMARY KEY ({pk})\n){suffix}"
+    ))
+    if partitioned:
+        db.execute(text(f"CREATE TABLE {_SCHEMA}.campaign_contacts_default PARTITION OF {_PARENT} DEFAULT"))
+        db.execute(text(_CREATE_PARTITIONS))
+
+    db.execute(text(f"INSERT INTO {_PARENT} ({_COPY_COLUMNS}) SELECT {_COPY_COLUMNS} FROM {_SCHEMA}.{old}"))
+    # DROP de la tabla particionada elimina también sus particiones
+    db.execute(text(f"DROP TABLE {_SCHEMA}.{old}"))
+    db.execute(text(f"ALTER SEQUENCE {_SEQ} OWNED BY {_PARENT}.campaign_contact_id"))
+    db.execute(text(
+        f"ALTER TABLE {_PARENT} ADD CONSTRAINT uq_campaign_contacts_campaign_phone UNIQUE (campaign_id, phone)"
+    ))
+    for ddl in _INDEXES:
+        db.execute(text(ddl.format(t=_PARENT)))
+    db.execute(text(f"ANALYZE {_PARENT}"))
@@ -0,0 +1,107 @@
+# backend/app/infrastructure/db/query_stats.py
+"""
+Contabilidad de SQL por unidad de trabajo (request HTTP, job, test).
+
+- install(engine): registra los eventos before/after_cursor_execute del engine.
+- track(): context manager que abre un QueryStats en el contexto actual; fuera de
+  un track() los eventos no hacen nada (workers, scripts).
+- Cada sentencia suma statements, filas y tiempo en BD. Cuando el mismo SQL se
+  repite SQL_N_PLUS_ONE_THRESHOLD veces se anota como N+1 junto con el método del
+  repositorio que lo emitió.
+- strict=True (SQL_BUDGET_STRICT, para tests) lanza QueryBudgetExceeded en la
+  sentencia que supera el presupuesto, con la traza apuntando al código culpable.
+"""
+import sys
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.config.settings import get_settings
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+@dataclass
+class QueryStats:
+    budget: int
+    n_plus_one_threshold: int
+    strict: bool = False
+    statements: int = 0
+    rows: int = 0
+    db_seconds: float = 0.0
+    by_statement: Counter = field(default_factory=Counter)
+    n_plus_one: Dict[str, Optional[str]] = field(default_factory=dict)   # sql -> caller
+
+    @property
+    def over_budget(self) -> bool:
+        return self.statements > self.budget
+
+    def server_timing(self) -> str:
+        return f'db;dur={self.db_seconds * 1000:.1f};desc="{self.statements} queries, {self.rows} rows"'
+
+_current: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+def current() -> Optional[QueryStats]:
+    return _current.get()
+
+@contextmanager
+def track(
+    budget: Optional[int] = None,
+    strict: Optional[bool] = None,
+    n_plus_one_threshold: Optional[int] = None,
+) -> Iterator[QueryStats]:
+    settings = get_settings()
+    stats = QueryStats(
+        budget=settings.SQL_QUERY_BUDGET if budget is None else budget,
+        n_plus_one_threshold=n_plus_one_threshold or settings.SQL_N_PLUS_ONE_THRESHOLD,
+        strict=settings.SQL_BUDGET_STRICT if strict is None else strict,
+    )
+    token = _current.set(stats)
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
+
+_REPOSITORY_MODULES = "app.infrastructure.repositories."
+
+def _caller() -> Optional[str]:
+    # Primer frame de un repositorio en la pila: "CampaignContactRepositorySQLAlchemy.bulk_upsert"
+    frame = sys._getframe(2)
+    while frame is not None:
+        if frame.f_globals.get("__name__", "").startswith(_REPOSITORY_MODULES):
+            owner = frame.f_locals.get("self")
+            name = frame.f_code.co_name
+            return f"{type(owner).__name__}.{name}" if owner is not None else name
+        frame = frame.f_back
+    return None
+
+def _before(conn, cursor, statement, parameters, context, executemany):
+    if _current.get() is not None:
+        conn.info["query_started"] = time.perf_counter()
+
+def _after(conn, cursor, statement, parameters, context, executemany):
+    stats = _current.get()
+    if stats is None:
+        return
+    stats.db_seconds += time.perf_counter() - conn.info.pop("query_started", time.perf_counter())
+    stats.statements += 1
+    stats.rows += max(cursor.rowcount, 0)
+
+    stats.by_statement[statement] += 1
+    if stats.by_statement[statement] == stats.n_plus_one_threshold:
+        stats.n_plus_one[statement] = _caller()
+
+    if stats.strict and stats.statements == stats.budget + 1:
+        raise QueryBudgetExceeded(
+            f"query budget exceeded: {stats.statements} > {stats.budget} (last: {statement[:200]})"
+        )
+
+def install(engine: Engine) -> None:
+    event.listen(engine, "before_cursor_execute", _before)
+    event.listen(engine, "after_cursor_execute", _after)
@@ -1,12 +1,14 @@
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, Session
 from app.config.settings import get_settings
+from app.infrastructure.db import query_stats
 
 # Crea la conexión a Postgres y la Session por request de la applicación.
 
 settings = get_settings()
 
 engine = create_engine(settings.DB_POSTGRESQL_URL, pool_pre_ping=True, future=True)
+query_stats.install(engine)  # contadores por request (ver query_stats.track)
 SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)
 
 def get_session() -> Session:
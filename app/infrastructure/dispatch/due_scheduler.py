@@ -0,0 +1,214 @@
+# backend/app/infrastructure/dispatch/due_scheduler.py
+"""
+Scheduler en memoria de contactos vencidos (opcional, DISPATCH_SCHEDULER_ENABLED).
+
+- Por campaña, un min-heap de (next_attempt_at, campaign_contact_id) con los
+  contactos Pending. Se carga por páginas la primera vez que se pide un lease y se
+  actualiza de forma incremental con changes_since. La marca de sincronización sale
+  siempre de la base (pg_snapshot_xmin, ver change_watermark), también en la carga
+  inicial: una transacción que confirma tarde se ve en la sincronización siguiente
+  por larga que haya sido, sin depender de updated_at ni de un margen fijo.
+- lease(): saca del heap los vencidos (microsegundos) y los confirma en un único
+  UPDATE condicional por llamada (lease_ids: mismas condiciones que el lease SQL,
+  con SKIP LOCKED). Los que la base no confirma se vuelven a consultar (pending_among):
+  los que siguen Pending (p.ej. bloqueados por otra transacción) vuelven al heap con
+  su vencimiento actual; el resto se descarta.
+- La base sigue siendo la fuente de verdad: un loop de reconciliación recarga cada
+  campaña periódicamente y registra el drift encontrado.
+- Cada proceso de la API tiene su propio heap; la confirmación en la base evita
+  que dos procesos entreguen el mismo contacto.
+"""
+import heapq
+import threading
+import time
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, List, Optional, Set, Tuple
+
+from app.config.settings import get_settings
+from app.config.log import get_logger
+from app.core.domain.entities.campaign_contact import CampaignContact
+from app.core.domain.repositories.campaign_contact_repository import CampaignContactRepository
+
+logger = get_logger(__name__)
+
+class _CampaignHeap:
+    def __init__(self):
+        self.heap: List[Tuple[float, int]] = []
+        self.due: Dict[int, float] = {}     # id -> vencimiento vigente; el resto del heap es obsoleto
+        self.lock = threading.Lock()
+        self.sync_lock = threading.Lock()
+        self.watermark: Optional[int] = None    # marca de la base (change_watermark) de la última sincronización
+        self.synced_mono = 0.0
+
+    def push(self, contact_id: int, next_attempt_at: Optional[datetime]) -> None:
+        ts = next_attempt_at.timestamp() if next_attempt_at else 0.0
+        if self.due.get(contact_id) == ts:
+            return
+        self.due[contact_id] = ts
+        heapq.heappush(self.heap, (ts, contact_id))
+
+    def discard(self, contact_id: int) -> None:
+        self.due.pop(contact_id, None)
+
+    def pop_due(self, now_ts: float, n: int) -> List[int]:
+        out: List[int] = []
+        heap, due = self.heap, self.due
+        while heap and len(out) < n:
+            ts, contact_id = heap[0]
+            if ts > now_ts:
+                break
+            heapq.heappop(heap)
+            if due.get(contact_id) == ts:
+                del due[contact_id]
+                out.append(contact_id)
+        # Las reprogramaciones dejan entradas obsoletas: se compacta si dominan el heap
+        if len(heap) > 2 * len(due) + 1024:
+            self.heap = [(ts, cid) for cid, ts in due.items()]
+            heapq.heapify(self.heap)
+        return out
+
+class DueContactScheduler:
+    def __init__(self, page_size: int, sync_seconds: float):
+        self.page_size = page_size
+        self.sync_seconds = sync_seconds
+        self._campaigns: Dict[int, _CampaignHeap] = {}
+        self._lock = threading.Lock()
+
+    def campaign_ids(self) -> List[int]:
+        with self._lock:
+            return list(self._campaigns)
+
+    def lease(
+        self,
+        repo: CampaignContactRepository,
+        campaign_id: int,
+        n: int,
+        max_attempts: int,
+        now: datetime,
+        lease_until: datetime,
+    ) -> List[CampaignContact]:
+        state = self._state(campaign_id)
+        self._sync(repo, campaign_id, state, now)
+
+        leased: List[CampaignContact] = []
+        unconfirmed: List[int] = []
+        # Segunda vuelta solo si la base no confirmó todos los candidatos
+        for _ in range(2):
+            with state.lock:
+                ids = state.pop_due(now.timestamp(), n - len(leased))
+            if not ids:
+                break
+            confirmed = repo.lease_ids(campaign_id, ids, max_attempts, now, lease_until)
+            leased += confirmed
+            if len(confirmed) < len(ids):
+                taken = {c.campaign_contact_id for c in confirmed}
+                unconfirmed += [i for i in ids if i not in taken]
+            if len(leased) >= n:
+                break
+        if unconfirmed:
+            self._requeue(repo, campaign_id, state, unconfirmed, max_attempts)
+        return leased
+
+    def _requeue(
+        self,
+        repo: CampaignContactRepository,
+        campaign_id: int,
+        state: _CampaignHeap,
+        ids: List[int],
+        max_attempts: int,
+    ) -> None:
+        pending = repo.pending_among(campaign_id, ids, max_attempts)
+        with state.lock:
+            for contact_id, next_attempt_at in pending:
+                state.push(contact_id, next_attempt_at)
+        logger.debug("dispatch_scheduler.unconfirmed", campaign_id=campaign_id, unconfirmed=len(ids), requeued=len(pending))
+
+    def reconcile(self, repo: CampaignContactRepository, campaign_id: int, now: datetime) -> Tuple[int, int]:
+        """Recarga la campaña desde la base. Devuelve (faltaban en memoria, sobraban en memoria)."""
+        state = self._state(campaign_id)
+        with state.sync_lock:
+            fresh = self._load(repo, campaign_id, now)
+            with state.lock:
+                in_memory: Set[int] = set(state.due)
+                state.heap, state.due = fresh.heap, fresh.due
+                state.watermark, state.synced_mono = fresh.watermark, fresh.synced_mono
+        in_db = set(fresh.due)
+        return len(in_db - in_memory), len(in_memory - in_db)
+
+    def _state(self, campaign_id: int) -> _CampaignHeap:
+        with self._lock:
+            state = self._campaigns.get(campaign_id)
+            if state is None:
+                state = self._campaigns[campaign_id] = _CampaignHeap()
+            return state
+
+    def _load(self, repo: CampaignContactRepository, campaign_id: int, now: datetime) -> _CampaignHeap:
+        fresh = _CampaignHeap()
+        # Antes de la primera página: lo que confirme durante la carga queda por encima de la marca
+        fresh.watermark = repo.change_watermark()
+        after = 0
+        while True:
+            page = repo.due_page(campaign_id, after, self.page_size)
+            for contact_id, next_attempt_at in page:
+                fresh.push(contact_id, next_attempt_at)
+            if len(page) < self.page_size:
+                break
+            after = page[-1][0]
+        fresh.synced_mono = time.monotonic()
+        logger.info("dispatch_scheduler.loaded", campaign_id=campaign_id, pending=len(fresh.due))
+        return fresh
+
+    def _sync(self, repo: CampaignContactRepository, campaign_id: int, state: _CampaignHeap, now: datetime) -> None:
+        if state.watermark is not None and time.monotonic() - state.synced_mono < self.sync_seconds:
+            return
+        # Un solo hilo sincroniza; los demás despachan con lo que ya está en memoria
+        if not state.sync_lock.acquire(blocking=state.watermark is None):
+            return
+        try:
+            if state.watermark is None:
+                fresh = self._load(repo, campaign_id, now)
+                with state.lock:
+                    state.heap, state.due = fresh.heap, fresh.due
+                    state.watermark, state.synced_mono = fresh.watermark, fresh.synced_mono
+                return
+            if time.monotonic() - state.synced_mono < self.sync_seconds:
+                return
+            changes, watermark = repo.changes_since(campaign_id, state.watermark)
+            with state.lock:
+                for contact_id, status, next_attempt_at in changes:
+                    if status == "Pending":
+                        state.push(contact_id, next_attempt_at)
+                    else:
+                        state.discard(contact_id)
+                state.watermark = watermark
+                state.synced_mono = time.monotonic()
+        finally:
+            state.sync_lock.release()
+
+@lru_cache
+def get_due_scheduler() -> Optional[DueContactScheduler]:
+    settings = get_settings()
+    if not settings.DISPATCH_SCHEDULER_ENABLED:
+        return None
+    return DueContactScheduler(settings.DISPATCH_SCHEDULER_PAGE_SIZE, settings.DISPATCH_SCHEDULER_SYNC_SECONDS)
+
+def run_reconciler(stop: threading.Event) -> None:
+    """Loop de reconciliación (hilo de fondo de la API) contra la base."""
+    from app.infrastructure.db.session import SessionLocal
+    from app.infrastructure.repositories.campaign_contact_repository_sqlalchemy import CampaignContactRepositorySQLAlchemy
+    from app.security.auth import now_utc
+
+    scheduler = get_due_scheduler()
+    interval = get_settings().DISPATCH_SCHEDULER_RECONCILE_SECONDS
+    while scheduler is not None and not stop.wait(interval):
+        for campaign_id in scheduler.campaign_ids():
+            db = SessionLocal()
+            try:
+                missing, extra = scheduler.reconcile(CampaignContactRepositorySQLAlchemy(db), campaign_id, now_utc())
+                if missing or extra:
+                    logger.warning("dispatch_scheduler.drift", campaign_id=campaign_id, missing=missing, extra=extra)
+            except Exception:
+                logger.exception("dispatch_scheduler.reconcile_failed", campaign_id=campaign_id)
+            finally:
+                db.close()
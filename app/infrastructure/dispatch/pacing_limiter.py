@@ -0,0 +1,107 @@
+# backend/app/infrastructure/dispatch/pacing_limiter.py
+"""
+Implementaciones de DispatchLimiter (ver app.core.domain.pacing).
+
+- DbDispatchLimiter: el bucket vive en callbot.campaign_dispatch_pacing y se bloquea
+  con FOR UPDATE hasta el commit del lease, así que todos los procesos de la API
+  comparten el mismo estado. Los leases de una campaña con límites se serializan;
+  las campañas sin límites no pasan por aquí.
+- LocalDispatchLimiter: mismo algoritmo con estado en memoria y un lock por campaña
+  (un solo proceso: desarrollo, tests o despliegues de una réplica).
+
+En ambos casos la concurrencia se mide con el contador Dialing de
+campaign_contact_stats, leído después de tomar el lock.
+"""
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Callable, Dict, Iterator
+
+from sqlalchemy import select, update, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.core.domain.pacing import DispatchLimiter, DispatchPermit, PacingPolicy
+from app.core.domain.repositories.campaign_stats_repository import CampaignStatsRepository
+from app.infrastructure.db.callbot_campaign_dispatch_pacing import CampaignDispatchPacingORM
+
+class _Permit(DispatchPermit):
+    def __init__(self, granted: int, debit: Callable[[int], None]):
+        self.granted = granted
+        self.used = 0
+        self._debit = debit
+
+    def consume(self, used: int) -> None:
+        used = min(used, self.granted - self.used)
+        self.used += used
+        self._debit(used)
+
+def _refill(tokens: float, elapsed: float, policy: PacingPolicy) -> float:
+    if policy.max_cps is None:
+        return tokens
+    return min(policy.burst, tokens + policy.max_cps * max(elapsed, 0.0))
+
+class DbDispatchLimiter(DispatchLimiter):
+    def __init__(self, db: Session, stats_repo: CampaignStatsRepository):
+        self.db = db
+        self.stats_repo = stats_repo
+
+    @contextmanager
+    def permit(self, campaign_id: int, requested: int, policy: PacingPolicy, now: datetime) -> Iterator[DispatchPermit]:
+        table = CampaignDispatchPacingORM
+        self.db.execute(
+            pg_insert(table)
+            .values(campaign_id=campaign_id, tokens=policy.burst, updated_at=func.clock_timestamp())
+            .on_conflict_do_nothing(index_elements=[table.campaign_id])
+        )
+        # Reloj de la base: todos los procesos refrescan el bucket con la misma referencia
+        tokens, updated_at, db_now = self.db.execute(
+            select(table.tokens, table.updated_at, func.clock_timestamp())
+            .where(table.campaign_id == campaign_id)
+            .with_for_update()
+        ).one()
+        tokens = _refill(tokens, (db_now - updated_at).total_seconds(), policy)
+        dialing = self.stats_repo.get_counts(campaign_id).get("Dialing", 0)
+
+        def debit(used: int) -> None:
+            # Se descuenta en la misma transacción del lease; el commit libera la fila
+            nonlocal tokens
+            if policy.max_cps is not None:
+                tokens -= used
+            self.db.execute(
+                update(table).where(table.campaign_id == campaign_id).values(tokens=tokens, updated_at=db_now)
+            )
+
+        yield _Permit(policy.grant(requested, tokens, dialing), debit)
+
+class _LocalBucket:
+    def __init__(self, tokens: float):
+        self.lock = threading.Lock()
+        self.tokens = tokens
+        self.updated = time.monotonic()
+
+class LocalDispatchLimiter(DispatchLimiter):
+    _buckets: Dict[int, _LocalBucket] = {}
+    _guard = threading.Lock()
+
+    def __init__(self, stats_repo: CampaignStatsRepository):
+        self.stats_repo = stats_repo
+
+    @contextmanager
+    def permit(self, campaign_id: int, requested: int, policy: PacingPolicy, now: datetime) -> Iterator[DispatchPermit]:
+        with self._guard:
+            bucket = self._buckets.get(campaign_id)
+            if bucket is None:
+                bucket = self._buckets[campaign_id] = _LocalBucket(policy.burst)
+        with bucket.lock:
+            mono = time.monotonic()
+            bucket.tokens = _refill(bucket.tokens, mono - bucket.updated, policy)
+            bucket.updated = mono
+            dialing = self.stats_repo.get_counts(campaign_id).get("Dialing", 0)
+
+            def debit(used: int) -> None:
+                if policy.max_cps is not None:
+                    bucket.tokens -= used
+
+            yield _Permit(policy.grant(requested, bucket.tokens, dialing), debit)
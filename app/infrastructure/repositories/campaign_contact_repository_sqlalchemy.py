@@ -1,17 +1,42 @@
 # backend/app/infraestructure/repositories/campaign_contact_repository_sqlalchemy.py
 from __future__ import annotations
 
-from typing import Optional, List, Dict, Any, Tuple
-from sqlalchemy.orm import Session
-from sqlalchemy import select, update, func
+import csv
+import io
+import json
+import re
+from datetime import datetime
+from typing import Callable, Optional, List, Dict, Any, Tuple, Iterable, Iterator
+from sqlalchemy.orm import Session, raiseload
+from sqlalchemy import select, update, func, cast, any_, bindparam, exists, text, literal_column, Integer, String, JSON
+from sqlalchemy.dialects.postgresql import insert as pg_insert, array, JSONB
 from sqlalchemy.exc import IntegrityError
 from psycopg2.errors import UniqueViolation, CheckViolation, ForeignKeyViolation
 
 from app.core.domain.entities.campaign_contact import CampaignContact
-from app.core.domain.repositories.campaign_contact_repository import CampaignContactRepository
+from app.core.domain.repositories.campaign_contact_repository import CampaignContactRepository, EXPORT_FIELDS
 from app.core.domain.errors import NotFoundError, ValidationError, ConflictError
+from app.config.settings import get_settings
+from app.config.log import get_logger
 
 from app.infrastructure.db.callbot_campaign_contacts import CampaignContactORM
+from app.infrastructure.db.callbot_campaigns import CampaignORM
+from app.infrastructure.repositories.campaign_stats_repository_sqlalchemy import (
+    bump_status_counts, status_transitions,
+)
+
+logger = get_logger(__name__)
+
+# Lecturas sin relaciones: _to_domain solo usa columnas (ver CampaignContactORM.campaign)
+_COLUMNS_ONLY = (raiseload("*"),)
+
+# Vencimiento para el lease: NULL (nunca llamado) cuenta como ya vencido. Es la expresión
+# del índice parcial ix_campaign_contacts_due: rango + orden sin OR, el scan se corta en n.
+_DUE_AT = func.coalesce(CampaignContactORM.__table__.c.next_attempt_at, literal_column("'-infinity'::timestamptz"))
+
+def _dispatchable(campaign_id: int):
+    """La campaña no está en 'Deleting': el purgador la está borrando, no se entregan sus contactos."""
+    return exists().where(CampaignORM.campaign_id == campaign_id, CampaignORM.status != "Deleting")
 
 def _to_domain(row: CampaignContactORM) -> CampaignContact:
     return CampaignContact(
@@ -37,9 +62,156 @@ def _merge_dicts(base: Optional[dict], patch: Optional[dict]) -> dict:
     patch = patch or {}
     return {**base, **patch}  # reemplazo superficial; ajusta si quieres deep-merge
 
+_SUFFIX_Q = re.compile(r"\*(\d{1,25})")
+
+def _search_clause(q: str):
+    """
+    Filtro de búsqueda según la forma de q:
+    - '*1234': phone termina en 1234 ("últimos N dígitos"), vía el índice sobre reverse(phone).
+    - cualquier otro: subcadena en phone o name (ILIKE '%q%', la semántica de siempre),
+      resuelta con los índices de trigramas cuando q tiene 3 o más caracteres.
+    """
+    m = _SUFFIX_Q.fullmatch(q)
+    if m:
+        return func.reverse(CampaignContactORM.phone).like(m.group(1)[::-1] + "%")
+    like = f"%{q}%"
+    return (CampaignContactORM.phone.ilike(like)) | (CampaignContactORM.name.ilike(like))
+
+def _dedupe_chunk(items: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """
+    Agrupa el chunk por phone. ON CONFLICT no admite dos filas con la misma clave
+    en una sola sentencia, así que los repetidos se fusionan aquí con la misma
+    política que se aplicaría fila a fila.
+    """
+    out: Dict[str, Dict[str, Any]] = {}
+    for it in items:
+        phone = (it.get("phone") or "").strip()
+        if not phone:
+            continue
+        prev = out.get(phone)
+        if prev is None:
+            out[phone] = {**it, "phone": phone}
+            continue
+        if it.get("attributes"):
+            prev["attributes"] = _merge_dicts(prev.get("attributes"), it["attributes"])
+        for k in ("name", "notes", "status", "next_attempt_at", "last_disposition", "last_error"):
+            if it.get(k) is not None:
+                prev[k] = it[k]
+    return out
+
+class _CopyReader:
+    """
+    Adaptador file-like para COPY FROM STDIN: serializa las filas a CSV a medida
+    que psycopg2 llama a read(), sin materializar la entrada completa.
+    """
+    def __init__(self, rows: Iterator[tuple], batch: int = 1000):
+        self._rows = rows
+        self._batch = batch
+        self._buf = io.StringIO()
+        self._writer = csv.writer(self._buf, lineterminator="\n")
+        self._pending = ""
+        self.count = 0
+
+    def read(self, size: int = -1) -> str:
+        while size < 0 or len(self._pending) < size:
+            n = 0
+            for row in self._rows:
+                self._writer.writerow(row)
+                n += 1
+                if n >= self._batch:
+                    break
+            if not n:
+                break
+            self.count += n
+            self._pending += self._buf.getvalue()
+            self._buf.seek(0)
+            self._buf.truncate()
+        if size < 0:
+            out, self._pending = self._pending, ""
+        else:
+            out, self._pending = self._pending[:size], self._pending[size:]
+        return out
+
+_STAGE_DDL = """
+    CREATE TEMP TABLE IF NOT EXISTS _campaign_contacts_stage (
+        ord bigint NOT NULL,
+        phone varchar(25) NOT NULL,
+        name varchar(120),
+        attributes jsonb,
+        created_by varchar(80),
+        source_batch_id integer
+    ) ON COMMIT DROP
+"""
+
+_STAGE_MERGE = text("""
+    WITH src AS (
+        SELECT DISTINCT ON (phone) phone, name, attributes, created_by, source_batch_id
+        FROM _campaign_contacts_stage
+        ORDER BY phone, ord
+    ), merged AS (
+        INSERT INTO callbot.campaign_contacts AS cc
+            (campaign_id, phone, name, attributes, status, attempt_count,
+             source_batch_id, created_at, created_by)
+        SELECT :campaign_id, phone, name, coalesce(attributes, '{}'::jsonb)::json, 'Pending', 0,
+               source_batch_id, now(), coalesce(created_by, 'system')
+        FROM src
+        ON CONFLICT (campaign_id, phone) DO UPDATE
+            SET attributes = (cc.attributes::jsonb || excluded.attributes::jsonb)::json,
+                name = coalesce(excluded.name, cc.name),
+                updated_at = now()
+        RETURNING (cc.updated_at IS NULL) AS inserted
+    )
+    SELECT count(*) FILTER (WHERE inserted), count(*) FILTER (WHERE NOT inserted) FROM merged
+""")
+
+# Resultados de llamadas: un UPDATE ... FROM unnest(arrays) para todo el lote. El
+# next_attempt_at de un contacto en Dialing es el vencimiento de su lease y cada lease
+# escribe uno nuevo: el reporte que no lo repite exacto es de un lease anterior.
+_APPLY_OUTCOMES = text("""
+    UPDATE callbot.campaign_contacts AS cc
+    SET attempt_count = cc.attempt_count + 1,
+        last_disposition = o.disposition,
+        last_error = o.error,
+        status = CASE
+            WHEN o.final OR cc.attempt_count + 1 >= :max_attempts
+                THEN CASE WHEN o.error IS NULL THEN 'Finished' ELSE 'Error' END
+            ELSE 'Pending'
+        END,
+        next_attempt_at = CASE
+            WHEN o.final OR cc.attempt_count + 1 >= :max_attempts THEN NULL
+            ELSE CAST(:retry_at AS timestamptz)
+        END,
+        updated_at = :now
+    FROM unnest(
+        CAST(:ids AS integer[]), CAST(:dispositions AS varchar[]),
+        CAST(:errors AS text[]), CAST(:finals AS boolean[]), CAST(:leases AS timestamptz[])
+    ) AS o(campaign_contact_id, disposition, error, final, lease_expires_at)
+    WHERE cc.campaign_contact_id = o.campaign_contact_id
+      AND cc.campaign_id = :campaign_id
+      AND cc.status = 'Dialing'
+      AND cc.next_attempt_at = o.lease_expires_at
+    RETURNING cc.campaign_contact_id, cc.status
+""")
+
+# Cambios para el scheduler en memoria, por transacción y no por updated_at: xmin (xid de
+# 32 bits de la transacción que escribió la versión visible de la fila) se lleva a 64 bits
+# contra el xmax del snapshot y se compara con la marca (xmin de un snapshot anterior).
+# Las transacciones largas o que confirman tarde quedan dentro aunque su updated_at sea viejo.
+# Filas congeladas muy antiguas pueden volver a aparecer: re-empujarlas al heap es inocuo.
+_CHANGES_SINCE = text("""
+    WITH snap AS (SELECT pg_snapshot_xmax(pg_current_snapshot())::text::bigint AS xmax)
+    SELECT cc.campaign_contact_id, cc.status, cc.next_attempt_at
+    FROM callbot.campaign_contacts AS cc, snap
+    WHERE cc.campaign_id = :campaign_id
+      AND (snap.xmax % 4294967296 - cc.xmin::text::bigint + 4294967296) % 4294967296 <= snap.xmax - :since
+""")
+
+_WATERMARK = text("SELECT pg_snapshot_xmin(pg_current_snapshot())::text::bigint")
+
 class CampaignContactRepositorySQLAlchemy(CampaignContactRepository):
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, chunk_size: Optional[int] = None):
         self.db = db
+        self.chunk_size = chunk_size or get_settings().CONTACTS_UPSERT_CHUNK_SIZE
 
 
     def contact_exists(self, contact_id: int) -> bool:
@@ -57,7 +229,7 @@ class CampaignContactRepositorySQLAlchemy(CampaignContactRepository):
 
     # ---------- READ ----------
     def get(self, campaign_contact_id: int) -> Optional[CampaignContact]:
-        row = self.db.get(CampaignContactORM, campaign_contact_id)
+        row = self.db.get(CampaignContactORM, campaign_contact_id, options=_COLUMNS_ONLY)
         return _to_domain(row) if row else None
 
     def get_by_phone(self, campaign_id: int, phone: str) -> Optional[CampaignContact]:
@@ -65,7 +237,7 @@ class CampaignContactRepositorySQLAlchemy(CampaignContactRepository):
             select(CampaignContactORM).where(
                 CampaignContactORM.campaign_id == campaign_id,
                 CampaignContactORM.phone == phone
-            )
+            ).options(*_COLUMNS_ONLY)
         ).first()
         return _to_domain(row) if row else None
 
@@ -75,21 +247,52 @@ class CampaignContactRepositorySQLAlchemy(CampaignContactRepository):
         q: Optional[str],
         status: Optional[str],
         limit: int,
-        offset: int
+        offset: int,
+        after: Optional[int] = None,
     ) -> List[CampaignContact]:
-        stmt = select(CampaignContactORM).where(CampaignContactORM.campaign_id == campaign_id)
+        # BETWEEN en lugar de "=": con igualdad el planner descarta campaign_id del ORDER BY y,
+        # para una campaña con gran parte de la tabla, prefiere recorrer la PK hacia atrás
+        # filtrando las filas de otras campañas; así el orden solo lo da el índice compuesto
+        stmt = select(CampaignContactORM).options(*_COLUMNS_ONLY).where(
+            CampaignContactORM.campaign_id.between(campaign_id, campaign_id)
+        )
+        if after is not None:
+            # keyset: evita recorrer y descartar las filas de las páginas anteriores
+            stmt = stmt.where(CampaignContactORM.campaign_contact_id < after)
         if q:
-            like = f"%{q}%"
-            stmt = stmt.where(
-                (CampaignContactORM.phone.ilike(like)) |
-                (CampaignContactORM.name.ilike(like))
-            )
+            stmt = stmt.where(_search_clause(q))
         if status:
             stmt = stmt.where(CampaignContactORM.status == status)
-        stmt = stmt.order_by(CampaignContactORM.campaign_contact_id.desc()).limit(limit).offset(offset)
+        stmt = stmt.order_by(
+            CampaignContactORM.campaign_id, CampaignContactORM.campaign_contact_id.desc()
+        ).limit(limit).offset(offset)
         rows = self.db.scalars(stmt).all()
         return [_to_domain(r) for r in rows]
 
+    def iter_rows(
+        self,
+        campaign_id: int,
+        q: Optional[str],
+        status: Optional[str],
+        batch_size: int = 1000,
+    ) -> Iterator[tuple]:
+        # Columnas Core (sin entidades ORM) + cursor del lado del servidor
+        table = CampaignContactORM.__table__
+        stmt = select(*(table.c[f] for f in EXPORT_FIELDS)).where(table.c.campaign_id == campaign_id)
+        if q:
+            stmt = stmt.where(_search_clause(q))
+        if status:
+            stmt = stmt.where(table.c.status == status)
+        stmt = stmt.order_by(table.c.campaign_contact_id).execution_options(
+            stream_results=True, yield_per=batch_size
+        )
+        result = self.db.execute(stmt)
+        try:
+            for part in result.partitions():
+                yield from part
+        finally:
+            result.close()
+
     # ---------- WRITE ----------
     def create(self, campaign_id: int, data: Dict[str, Any]) -> CampaignContact:
         # phone es obligatorio
@@ -125,6 +328,7 @@ class CampaignContactRepositorySQLAlchemy(CampaignContactRepository):
             self.db.add(row)
             self.db.flush()
             self.db.refresh(row)
+            bump_status_counts(self.db, campaign_id, {row.status: 1})
             return _to_domain(row)
         except IntegrityError as ex:
             orig = getattr(ex, "orig", None)
@@ -156,63 +360,467 @@ class CampaignContactRepositorySQLAlchemy(CampaignContactRepository):
         if "attributes" in changes:
             changes["attributes"] = _merge_dicts(existing.attributes, changes["attributes"])
         
+        old_status = existing.status
         for k, v in changes.items():
             if v is not None and hasattr(existing, k):
                 setattr(existing, k, v)
         self.db.flush()
         self.db.refresh(existing)
+        bump_status_counts(self.db, campaign_id, status_transitions([(old_status, existing.status)]))
         return _to_domain(existing)
 
     def bulk_upsert(self, campaign_id: int, items: List[Dict[str, Any]]) -> Tuple[int, int]:
-        import logging
-        logger = logging.getLogger(__name__)
-        logger.setLevel(logging.INFO)
-        
         inserted = existing = 0
-        for it in items:
-            logger.info(f"🔍 Processing item for bulk_upsert: {it}")
-            logger.info(f"🔍 Item attributes: {it.get('attributes')} (type: {type(it.get('attributes'))})")
-            
-            phone = (it.get("phone") or "").strip()
-            if not phone:
+        for start in range(0, len(items), self.chunk_size):
+            chunk = _dedupe_chunk(items[start:start + self.chunk_size])
+            if not chunk:
                 continue
-            row = self.db.scalars(
-                select(CampaignContactORM).where(
-                    CampaignContactORM.campaign_id == campaign_id,
-                    CampaignContactORM.phone == phone
-                )
-            ).first()
-            if row:
-                # opcional: merge de atributos/datos
-                if it.get("attributes"):
-                    logger.info(f"🔄 Updating existing contact attributes from {row.attributes} to {it['attributes']}")
-                    row.attributes = _merge_dicts(row.attributes, it["attributes"])
-                # Actualiza campos simples si vienen
-                for k in ("name", "notes", "status", "next_attempt_at", "last_disposition", "last_error"):
-                    if it.get(k) is not None:
-                        setattr(row, k, it[k])
-                existing += 1
-            else:
-                attributes_to_save = it.get("attributes") or {}
-                logger.info(f"➕ Creating new contact with attributes: {attributes_to_save} (type: {type(attributes_to_save)})")
-                
-                new_contact = CampaignContactORM(
-                    campaign_id=campaign_id,
-                    phone=phone,
-                    name=it.get("name"),
-                    attributes=attributes_to_save,
-                    status=it.get("status") or "Pending",
-                    source_batch_id=it.get("source_batch_id"),
-                    created_by=it.get("created_by") or "system",
-                )
-                logger.info(f"📝 ORM object created with attributes: {new_contact.attributes}")
-                self.db.add(new_contact)
-                self.db.flush()  # Forzar flush para ver el estado
-                logger.info(f"🔄 After flush, attributes: {new_contact.attributes}")
-                inserted += 1
-        # flush lo hace la dependency transaccional cuando corresponda; aquí podemos dejarlo implícito
+
+            # Prefetch (una sola consulta por chunk) del status actual de los phones ya
+            # existentes; quedan bloqueados hasta el commit para que los contadores no
+            # se desfasen con escrituras concurrentes.
+            found = self._existing_statuses(campaign_id, list(chunk.keys()))
+            existing += len(found)
+            inserted += len(chunk) - len(found)
+
+            # Las filas que traen 'status' lo sobrescriben; las demás conservan el actual.
+            # Se separan porque el INSERT aplica "Pending" por defecto a las nuevas.
+            with_status = [r for r in chunk.values() if r.get("status") is not None]
+            without_status = [r for r in chunk.values() if r.get("status") is None]
+            transitions = []
+            for rows, override_status in ((with_status, True), (without_status, False)):
+                if rows:
+                    result = self.db.execute(self._upsert_stmt(campaign_id, rows, override_status))
+                    for phone, was_inserted, status in result:
+                        transitions.append((None if was_inserted else found.get(phone, "Pending"), status))
+            bump_status_counts(self.db, campaign_id, status_transitions(transitions))
+
+            logger.debug(
+                "contacts.bulk_upsert.chunk",
+                campaign_id=campaign_id, chunk=start // self.chunk_size + 1, rows=len(chunk), existing=len(found),
+            )
+        logger.info("contacts.bulk_upsert", campaign_id=campaign_id, inserted=inserted, existing=existing)
+        # commit lo hace la dependency transaccional
         return inserted, existing
 
+    def existing_phones(self, campaign_id: int, phones: List[str]) -> set[str]:
+        if not phones:
+            return set()
+        return set(self.db.scalars(
+            select(CampaignContactORM.phone).where(
+                CampaignContactORM.campaign_id == campaign_id,
+                CampaignContactORM.phone == any_(array(phones, type_=String)),
+            )
+        ))
+
+    def _existing_statuses(self, campaign_id: int, phones: List[str]) -> Dict[str, str]:
+        if not phones:
+            return {}
+        rows = self.db.execute(
+            select(CampaignContactORM.phone, CampaignContactORM.status).where(
+                CampaignContactORM.campaign_id == campaign_id,
+                CampaignContactORM.phone == any_(array(phones, type_=String)),
+            ).with_for_update()
+        )
+        return {phone: status for phone, status in rows}
+
+    def _upsert_stmt(self, campaign_id: int, rows: List[Dict[str, Any]], override_status: bool):
+        table = CampaignContactORM.__table__
+        stmt = pg_insert(table).values([
+            {
+                "campaign_id": campaign_id,
+                "phone": r["phone"],
+                "name": r.get("name"),
+                "attributes": r.get("attributes") or {},
+                "status": r.get("status") or "Pending",
+                "next_attempt_at": r.get("next_attempt_at"),
+                "last_disposition": r.get("last_disposition"),
+                "last_error": r.get("last_error"),
+                "notes": r.get("notes"),
+                "source_batch_id": r.get("source_batch_id"),
+                "created_by": r.get("created_by") or "system",
+            }
+            for r in rows
+        ])
+        excluded = stmt.excluded
+        # Misma política que upsert(): merge superficial de attributes y
+        # los campos simples solo se reemplazan si vienen informados.
+        set_ = {
+            "attributes": cast(
+                cast(table.c.attributes, JSONB).op("||")(cast(excluded.attributes, JSONB)),
+                JSON,
+            ),
+        }
+        for k in ("name", "notes", "next_attempt_at", "last_disposition", "last_error"):
+            set_[k] = func.coalesce(excluded[k], table.c[k])
+        set_["updated_at"] = func.now()
+        if override_status:
+            set_["status"] = excluded.status
+        # Una fila recién insertada no tiene updated_at (el DO UPDATE lo fija): marca de
+        # insertado que, a diferencia de xmax, también se puede devolver con particiones
+        return stmt.on_conflict_do_update(
+            index_elements=[table.c.campaign_id, table.c.phone],
+            set_=set_,
+        ).returning(table.c.phone, table.c.updated_at.is_(None), table.c.status)
+
+    def bulk_import(self, campaign_id: int, items: Iterable[Dict[str, Any]]) -> Tuple[int, int]:
+        """
+        Vía COPY para listas muy grandes: las filas se vuelcan por COPY FROM STDIN a una
+        tabla temporal (ON COMMIT DROP) y se fusionan con un único INSERT ... SELECT ...
+        ON CONFLICT. Mismo merge que bulk_upsert; ante phones repetidos gana la primera aparición.
+        """
+        rows = (
+            (
+                ord_,
+                (it.get("phone") or "").strip(),
+                it.get("name"),
+                json.dumps(it.get("attributes") or {}),
+                it.get("created_by") or "system",
+                it.get("source_batch_id"),
+            )
+            for ord_, it in enumerate(items)
+            if (it.get("phone") or "").strip()
+        )
+        reader = _CopyReader(rows)
+
+        # La tabla temporal vive en la conexión de la transacción de esta sesión
+        dbapi_conn = self.db.connection().connection
+        with dbapi_conn.cursor() as cur:
+            cur.execute(_STAGE_DDL)
+            cur.execute("TRUNCATE _campaign_contacts_stage")
+            cur.copy_expert(
+                "COPY _campaign_contacts_stage (ord, phone, name, attributes, created_by, source_batch_id) "
+                "FROM STDIN WITH (FORMAT csv)",
+                reader,
+            )
+        inserted, updated = self.db.execute(_STAGE_MERGE, {"campaign_id": campaign_id}).one()
+        # El merge no toca el status de los existentes: solo suman las nuevas (Pending)
+        bump_status_counts(self.db, campaign_id, {"Pending": inserted})
+        logger.info(
+            "contacts.bulk_import",
+            campaign_id=campaign_id, staged=reader.count, inserted=inserted, updated=updated,
+        )
+        return inserted, updated
+
+    def bulk_update(
+        self,
+        campaign_id: int,
+        criteria: Dict[str, Any],
+        changes: Dict[str, Any],
+        after: int,
+        limit: int,
+    ) -> Tuple[int, int, Optional[int]]:
+        table = CampaignContactORM.__table__
+        conds = [table.c.campaign_id == campaign_id, table.c.campaign_contact_id > after]
+        if criteria.get("status"):
+            conds.append(table.c.status.in_(criteria["status"]))
+        if criteria.get("attempt_count_min") is not None:
+            conds.append(table.c.attempt_count >= criteria["attempt_count_min"])
+        if criteria.get("attempt_count_max") is not None:
+            conds.append(table.c.attempt_count <= criteria["attempt_count_max"])
+        if criteria.get("attributes"):
+            conds.append(cast(table.c.attributes, JSONB).contains(criteria["attributes"]))
+        if criteria.get("phones"):
+            conds.append(table.c.phone == any_(array(criteria["phones"], type_=String)))
+
+        # scan fija el tramo sin bloquear (keyset por id); batch bloquea esas filas y vuelve a
+        # evaluar criteria: en READ COMMITTED una fila que otra transacción cambió mientras se
+        # esperaba su lock queda fuera del UPDATE, pero no acorta el recorrido. batch conserva
+        # el status previo para los contadores.
+        scan = (
+            select(table.c.campaign_contact_id)
+            .where(*conds)
+            .order_by(table.c.campaign_contact_id)
+            .limit(limit)
+            .cte("scan")
+        )
+        batch = (
+            select(table.c.campaign_contact_id, table.c.status)
+            .where(*conds, table.c.campaign_contact_id.in_(select(scan.c.campaign_contact_id)))
+            .with_for_update()
+            .cte("batch")
+        )
+        values: Dict[str, Any] = {"updated_at": func.now()}
+        if changes.get("status"):
+            values["status"] = changes["status"]
+        if changes.get("reset_attempts"):
+            values["attempt_count"] = 0
+        if changes.get("next_attempt_at") is not None:
+            values["next_attempt_at"] = changes["next_attempt_at"]
+        if changes.get("merge_attributes"):
+            values["attributes"] = cast(
+                cast(table.c.attributes, JSONB).op("||")(cast(changes["merge_attributes"], JSONB)),
+                JSON,
+            )
+        updated = (
+            update(table)
+            .where(table.c.campaign_id == campaign_id, table.c.campaign_contact_id == batch.c.campaign_contact_id)
+            .values(**values)
+            .returning(batch.c.status.label("old_status"), table.c.status.label("new_status"))
+            .cte("updated")
+        )
+        scanned = select(
+            func.count().label("scanned"), func.max(scan.c.campaign_contact_id).label("last_id"),
+        ).subquery()
+        # Siempre devuelve al menos una fila con el recorrido, aunque no se actualice ninguna
+        rows = self.db.execute(
+            select(scanned.c.scanned, scanned.c.last_id, updated.c.old_status, updated.c.new_status)
+            .select_from(scanned.outerjoin(updated, literal_column("true")))
+        ).all()
+        n_scanned, last_id = rows[0][0], rows[0][1]
+        transitions = [(old, new) for _, _, old, new in rows if new is not None]
+        if transitions:
+            bump_status_counts(self.db, campaign_id, status_transitions(transitions))
+        return len(transitions), n_scanned, last_id
+
+    def canonicalize_phones(
+        self,
+        campaign_id: int,
+        canonical: Callable[[str], Optional[str]],
+        after: int,
+        limit: int,
+    ) -> Tuple[int, int, Optional[int]]:
+        table = CampaignContactORM.__table__
+        rows = self.db.execute(
+            select(table.c.campaign_contact_id, table.c.phone)
+            .where(table.c.campaign_id == campaign_id, table.c.campaign_contact_id > after)
+            .order_by(table.c.campaign_contact_id)
+            .limit(limit)
+            .with_for_update()
+        ).all()
+        if not rows:
+            return 0, 0, None
+        last_id = rows[-1][0]
+
+        moves: Dict[str, List[int]] = {}  # phone canónico -> ids que lo tendrían (orden por id)
+        for contact_id, phone in rows:
+            target = canonical(phone)
+            if target and target != phone:
+                moves.setdefault(target, []).append(contact_id)
+        if not moves:
+            return 0, 0, last_id
+
+        # Los que ya están guardados en forma canónica (de este chunk o de chunks anteriores)
+        current = dict(self.db.execute(
+            select(table.c.phone, table.c.campaign_contact_id)
+            .where(table.c.campaign_id == campaign_id, table.c.phone == any_(array(list(moves), type_=String)))
+            .with_for_update()
+        ).all())
+        survivors: Dict[int, str] = {}   # id -> phone final
+        losers: Dict[int, int] = {}      # id fusionado -> id que sobrevive
+        renamed = 0
+        for target, ids in moves.items():
+            survivor = current.get(target)
+            if survivor is None:
+                survivor, ids = ids[0], ids[1:]
+                renamed += 1
+            survivors[survivor] = target
+            losers.update((contact_id, survivor) for contact_id in ids)
+
+        data = {
+            r.campaign_contact_id: r for r in self.db.execute(
+                select(table.c.campaign_contact_id, table.c.name, table.c.attributes)
+                .where(table.c.campaign_id == campaign_id,
+                       table.c.campaign_contact_id == any_(array(list(survivors) + list(losers), type_=Integer)))
+            )
+        }
+        merged: Dict[int, Dict[str, Any]] = {
+            sid: {"attributes": {}, "name": data[sid].name} for sid in survivors
+        }
+        for loser_id in sorted(losers):
+            into = merged[losers[loser_id]]
+            into["attributes"] = {**(data[loser_id].attributes or {}), **into["attributes"]}
+            into["name"] = into["name"] or data[loser_id].name
+
+        if losers:
+            statuses = self.db.scalars(
+                table.delete()
+                .where(table.c.campaign_id == campaign_id,
+                       table.c.campaign_contact_id == any_(array(list(losers), type_=Integer)))
+                .returning(table.c.status)
+            ).all()
+            deltas: Dict[str, int] = {}
+            for status in statuses:
+                deltas[status] = deltas.get(status, 0) - 1
+            bump_status_counts(self.db, campaign_id, deltas)
+
+        # Los attributes propios del sobreviviente tienen prioridad sobre los fusionados
+        self.db.execute(
+            update(table)
+            .where(table.c.campaign_id == campaign_id, table.c.campaign_contact_id == bindparam("b_id"))
+            .values(
+                phone=bindparam("b_phone"),
+                name=bindparam("b_name"),
+                attributes=bindparam("b_attributes", type_=JSON),
+                updated_at=func.now(),
+            ),
+            [
+                {
+                    "b_id": sid, "b_phone": phone, "b_name": merged[sid]["name"],
+                    "b_attributes": {**merged[sid]["attributes"], **(data[sid].attributes or {})},
+                }
+                for sid, phone in survivors.items()
+            ],
+        )
+        return renamed, len(losers), last_id
+
+    def lease_due(
+        self,
+        campaign_id: int,
+        n: int,
+        max_attempts: int,
+        now: datetime,
+        lease_until: datetime,
+    ) -> List[CampaignContact]:
+        return self._lease(campaign_id, None, n, max_attempts, now, lease_until)
+
+    def lease_ids(
+        self,
+        campaign_id: int,
+        ids: List[int],
+        max_attempts: int,
+        now: datetime,
+        lease_until: datetime,
+    ) -> List[CampaignContact]:
+        if not ids:
+            return []
+        return self._lease(campaign_id, ids, len(ids), max_attempts, now, lease_until)
+
+    def _lease(
+        self,
+        campaign_id: int,
+        ids: Optional[List[int]],
+        n: int,
+        max_attempts: int,
+        now: datetime,
+        lease_until: datetime,
+    ) -> List[CampaignContact]:
+        table = CampaignContactORM.__table__
+        conds = [
+            table.c.campaign_id == campaign_id,
+            table.c.status == "Pending",
+            _DUE_AT <= now,
+            table.c.attempt_count < max_attempts,
+            _dispatchable(campaign_id),
+        ]
+        if ids is not None:
+            # Candidatos elegidos por el scheduler en memoria: se reconfirman las mismas condiciones
+            conds.append(table.c.campaign_contact_id == any_(array(ids, type_=Integer)))
+        # SKIP LOCKED: dialers concurrentes reciben lotes disjuntos sin esperarse entre sí
+        due = (
+            select(table.c.campaign_contact_id)
+            .where(*conds)
+            .order_by(_DUE_AT, table.c.campaign_contact_id)
+            .limit(n)
+            .with_for_update(skip_locked=True)
+            .cte("due")
+        )
+        rows = self.db.scalars(
+            update(CampaignContactORM)
+            .where(
+                # campaign_id: con la tabla particionada el UPDATE solo toca la partición de la campaña
+                CampaignContactORM.campaign_id == campaign_id,
+                CampaignContactORM.campaign_contact_id == due.c.campaign_contact_id,
+            )
+            .values(status="Dialing", next_attempt_at=lease_until, updated_at=now)
+            .returning(CampaignContactORM)
+            .execution_options(synchronize_session=False)
+        ).all()
+        if rows:
+            bump_status_counts(self.db, campaign_id, {"Pending": -len(rows), "Dialing": len(rows)})
+        return [_to_domain(r) for r in rows]
+
+    def due_page(self, campaign_id: int, after: int, limit: int) -> List[Tuple[int, Optional[datetime]]]:
+        table = CampaignContactORM.__table__
+        return [tuple(r) for r in self.db.execute(
+            select(table.c.campaign_contact_id, table.c.next_attempt_at)
+            .where(
+                table.c.campaign_id == campaign_id,
+                table.c.status == "Pending",
+                table.c.campaign_contact_id > after,
+                _dispatchable(campaign_id),
+            )
+            .order_by(table.c.campaign_contact_id)
+            .limit(limit)
+        )]
+
+    def pending_among(self, campaign_id: int, ids: List[int], max_attempts: int) -> List[Tuple[int, Optional[datetime]]]:
+        if not ids:
+            return []
+        table = CampaignContactORM.__table__
+        # Sin FOR UPDATE: una fila bloqueada por otra transacción se lee en su versión confirmada
+        return [tuple(r) for r in self.db.execute(
+            select(table.c.campaign_contact_id, table.c.next_attempt_at)
+            .where(
+                table.c.campaign_id == campaign_id,
+                table.c.campaign_contact_id == any_(array(ids, type_=Integer)),
+                table.c.status == "Pending",
+                table.c.attempt_count < max_attempts,
+                _dispatchable(campaign_id),
+            )
+        )]
+
+    def change_watermark(self) -> int:
+        return self.db.scalar(_WATERMARK)
+
+    def changes_since(self, campaign_id: int, since: int) -> Tuple[List[Tuple[int, str, Optional[datetime]]], int]:
+        # La marca siguiente se toma antes de leer: lo que confirme después tiene xid >= marca
+        watermark = self.change_watermark()
+        rows = self.db.execute(_CHANGES_SINCE, {"campaign_id": campaign_id, "since": since})
+        return [tuple(r) for r in rows], watermark
+
+    def apply_outcomes(
+        self,
+        campaign_id: int,
+        outcomes: List[Dict[str, Any]],
+        max_attempts: int,
+        retry_at: datetime,
+        now: datetime,
+    ) -> Dict[int, str]:
+        if not outcomes:
+            return {}
+        rows = self.db.execute(_APPLY_OUTCOMES, {
+            "campaign_id": campaign_id,
+            "max_attempts": max_attempts,
+            "retry_at": retry_at,
+            "now": now,
+            "ids": [o["campaign_contact_id"] for o in outcomes],
+            "dispositions": [o.get("disposition") for o in outcomes],
+            "errors": [o.get("error") for o in outcomes],
+            "finals": [bool(o.get("final")) for o in outcomes],
+            "leases": [o["lease_expires_at"] for o in outcomes],
+        }).all()
+        applied = {contact_id: status for contact_id, status in rows}
+        bump_status_counts(self.db, campaign_id, status_transitions(("Dialing", st) for st in applied.values()))
+        return applied
+
+    def release_expired_leases(self, now: datetime, limit: int) -> Dict[int, int]:
+        table = CampaignContactORM.__table__
+        # SKIP LOCKED: no espera a un lease u outcome que esté confirmándose en este momento
+        expired = (
+            select(table.c.campaign_contact_id, table.c.campaign_id)
+            .where(table.c.status == "Dialing", table.c.next_attempt_at < now)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .cte("expired")
+        )
+        campaign_ids = self.db.scalars(
+            update(CampaignContactORM)
+            .where(
+                CampaignContactORM.campaign_contact_id == expired.c.campaign_contact_id,
+                CampaignContactORM.campaign_id == expired.c.campaign_id,
+            )
+            .values(status="Pending", next_attempt_at=now, updated_at=now)
+            .returning(CampaignContactORM.campaign_id)
+            .execution_options(synchronize_session=False)
+        ).all()
+        released: Dict[int, int] = {}
+        for campaign_id in campaign_ids:
+            released[campaign_id] = released.get(campaign_id, 0) + 1
+        for campaign_id in sorted(released):
+            bump_status_counts(self.db, campaign_id, {"Dialing": -released[campaign_id], "Pending": released[campaign_id]})
+        return released
+
     def update(self, campaign_contact_id: int, changes: Dict[str, Any]) -> CampaignContact:
         row = self.db.get(CampaignContactORM, campaign_contact_id)
         if not row:
@@ -222,11 +830,15 @@ class CampaignContactRepositorySQLAlchemy(CampaignContactRepository):
             if "attributes" in changes and changes["attributes"] is not None:
                 row.attributes = _merge_dicts(row.attributes, changes["attributes"])
                 changes.pop("attributes", None)
+            old_status = row.status
             for k, v in changes.items():
                 if v is not None and hasattr(row, k):
                     setattr(row, k, v)
+            if changes.get("updated_at") is None:
+                row.updated_at = func.now()
             self.db.flush()
             self.db.refresh(row)
+            bump_status_counts(self.db, row.campaign_id, status_transitions([(old_status, row.status)]))
             return _to_domain(row)
         except IntegrityError as ex:
             orig = getattr(ex, "orig", None)
@@ -241,8 +853,10 @@ class CampaignContactRepositorySQLAlchemy(CampaignContactRepository):
         if not row:
             return
         try:
+            campaign_id, status = row.campaign_id, row.status
             self.db.delete(row)
             self.db.flush()
+            bump_status_counts(self.db, campaign_id, {status: -1})
         except IntegrityError as ex:
             if isinstance(getattr(ex, "orig", None), ForeignKeyViolation):
                 # Hay calls asociados con ON DELETE RESTRICT
@@ -1,17 +1,29 @@
 # backend/app/infrastructure/repositories/campaign_repository_sqlalchemy.py
+from datetime import datetime
 from typing import Optional, List, Dict, Any
-from sqlalchemy.orm import Session
-from sqlalchemy import select, update, func
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, raiseload
+from sqlalchemy import select, update, delete, func, and_, or_
+from sqlalchemy.exc import IntegrityError, DBAPIError
 from app.core.domain.entities.campaign import Campaign
 from app.core.domain.repositories.campaign_repository import CampaignRepository
 from app.infrastructure.db.callbot_campaigns import CampaignORM
 from app.infrastructure.db.callbot_campaign_contacts import CampaignContactORM
 from app.infrastructure.db.callbot_campaign_types import CampaignTypeORM
-from psycopg2.errors import UniqueViolation, ForeignKeyViolation, CheckViolation
+from app.infrastructure.db.callbot_campaign_contact_stats import CampaignContactStatsORM
+from app.infrastructure.db.partitioning import create_contacts_partition, drop_contacts_partition
+from app.infrastructure.repositories.campaign_stats_repository_sqlalchemy import (
+    CampaignStatsRepositorySQLAlchemy, bump_status_counts,
+)
+from app.config.settings import get_settings
+from psycopg2.errors import UniqueViolation, ForeignKeyViolation, CheckViolation, DependentObjectsStillExist
 
 from app.core.domain.errors import ConflictError, ValidationError, NotFoundError
 
+# _to_domain solo lee columnas: las lecturas no cargan relaciones y cualquier acceso
+# accidental a campaign_type/contacts falla en vez de disparar consultas ocultas.
+# Quien necesite datos relacionados los pide en su consulta (selectinload/joinedload).
+_COLUMNS_ONLY = (raiseload("*"),)
+
 
 def _to_domain(row: CampaignORM) -> Campaign:
     return Campaign(
@@ -51,6 +63,8 @@ class CampaignRepositorySQLAlchemy(CampaignRepository):
             obj = CampaignORM(**data)
             self.db.add(obj)
             self.db.flush()
+            if get_settings().CONTACTS_PARTITIONING:
+                create_contacts_partition(self.db, obj.campaign_id)
             self.db.refresh(obj)
             return _to_domain(obj)
         except IntegrityError as ex:
@@ -64,17 +78,33 @@ class CampaignRepositorySQLAlchemy(CampaignRepository):
             raise
 
     def get(self, campaign_id: int) -> Optional[Campaign]:
-        row = self.db.get(CampaignORM, campaign_id)
+        row = self.db.get(CampaignORM, campaign_id, options=_COLUMNS_ONLY)
+        return _to_domain(row) if row else None
+
+    def get_for_write(self, campaign_id: int) -> Optional[Campaign]:
+        # FOR SHARE: mark_deleting (UPDATE) espera a que la escritura en curso confirme
+        row = self.db.scalars(
+            select(CampaignORM).where(CampaignORM.campaign_id == campaign_id)
+            .options(*_COLUMNS_ONLY)
+            .with_for_update(read=True)
+            .execution_options(populate_existing=True)
+        ).first()
         return _to_domain(row) if row else None
 
     def get_by_name(self, name: str) -> Optional[Campaign]:
         row = self.db.scalars(
-            select(CampaignORM).where(CampaignORM.name == name)
+            select(CampaignORM).where(CampaignORM.name == name).options(*_COLUMNS_ONLY)
         ).first()
         return _to_domain(row) if row else None
 
-    def list(self, q: Optional[str], limit: int, offset: int) -> List[Campaign]:
-        stmt = select(CampaignORM).order_by(CampaignORM.campaign_id.desc())
+    def list(self, q: Optional[str], limit: int, offset: int, after: Optional[int] = None) -> List[Campaign]:
+        stmt = (
+            select(CampaignORM).options(*_COLUMNS_ONLY)
+            .where(CampaignORM.status != "Deleting")
+            .order_by(CampaignORM.campaign_id.desc())
+        )
+        if after is not None:
+            stmt = stmt.where(CampaignORM.campaign_id < after)
         if q:
             stmt = stmt.where(CampaignORM.name.ilike(f"%{q}%"))
         rows = self.db.scalars(stmt.limit(limit).offset(offset)).all()
@@ -87,7 +117,7 @@ class CampaignRepositorySQLAlchemy(CampaignRepository):
                 .where(CampaignORM.campaign_id == campaign_id)
                 .values(**data)
             )
-            row = self.db.get(CampaignORM, campaign_id)
+            row = self.db.get(CampaignORM, campaign_id, options=_COLUMNS_ONLY)
             if not row:
                 return # el use case ya valida existencia
             return _to_domain(row)
@@ -112,4 +142,103 @@ class CampaignRepositorySQLAlchemy(CampaignRepository):
                 raise ConflictError(
                     "Cannot delete campaign with related records"
                 ) from ex
-            raise
\ No newline at end of file
+            raise
+
+    def mark_deleting(self, campaign_id: int) -> None:
+        self.db.execute(
+            update(CampaignORM)
+            .where(CampaignORM.campaign_id == campaign_id)
+            .values(status="Deleting")
+        )
+
+    def claim_deleting(self) -> Optional[int]:
+        # SKIP LOCKED: varios purgadores trabajan campañas distintas sin esperarse
+        return self.db.scalar(
+            select(CampaignORM.campaign_id)
+            .where(CampaignORM.status == "Deleting")
+            .order_by(CampaignORM.campaign_id)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+        )
+
+    def purge_contacts(self, campaign_id: int, limit: int) -> int:
+        if get_settings().CONTACTS_PARTITIONING:
+            dropped = self._drop_partition(campaign_id)
+            if dropped is not None:
+                return dropped
+        # DELETE set-based acotado por PK; los contadores por status bajan en la misma transacción
+        ids = (
+            select(CampaignContactORM.campaign_contact_id)
+            .where(CampaignContactORM.campaign_id == campaign_id)
+            .limit(limit)
+            .scalar_subquery()
+        )
+        try:
+            statuses = self.db.scalars(
+                delete(CampaignContactORM)
+                .where(CampaignContactORM.campaign_contact_id.in_(ids))
+                .returning(CampaignContactORM.status)
+                .execution_options(synchronize_session=False)
+            ).all()
+        except IntegrityError as ex:
+            if isinstance(getattr(ex, "orig", None), ForeignKeyViolation):
+                raise ConflictError("Cannot delete contacts with related records") from ex
+            raise
+        deltas: Dict[str, int] = {}
+        for status in statuses:
+            deltas[status] = deltas.get(status, 0) - 1
+        bump_status_counts(self.db, campaign_id, deltas)
+        return len(statuses)
+
+    def activate_started(self, now: datetime) -> List[int]:
+        return list(self.db.scalars(
+            update(CampaignORM)
+            .where(
+                CampaignORM.status == "Scheduled",
+                CampaignORM.start_at <= now,
+                or_(CampaignORM.end_at.is_(None), CampaignORM.end_at > now),
+            )
+            .values(status="Active")
+            .returning(CampaignORM.campaign_id)
+            .execution_options(synchronize_session=False)
+        ))
+
+    def finish_completed(self, now: datetime) -> List[int]:
+        # Se decide con los contadores por status (suma de los shards): no recorre campaign_contacts
+        stats = CampaignContactStatsORM
+
+        def total(*conds):
+            return (
+                select(func.coalesce(func.sum(stats.contacts), 0))
+                .where(stats.campaign_id == CampaignORM.campaign_id, *conds)
+                .scalar_subquery()
+            )
+        has_contacts = total() > 0
+        has_open = total(stats.status.in_(("Pending", "Dialing"))) > 0
+        return list(self.db.scalars(
+            update(CampaignORM)
+            .where(or_(
+                and_(
+                    CampaignORM.status.in_(("Scheduled", "Active", "Paused")),
+                    CampaignORM.end_at <= now,
+                ),
+                and_(CampaignORM.status == "Active", has_contacts, ~has_open),
+            ))
+            .values(status="Finished")
+            .returning(CampaignORM.campaign_id)
+            .execution_options(synchronize_session=False)
+        ))
+
+    def _drop_partition(self, campaign_id: int) -> Optional[int]:
+        """Toda la partición de la campaña de una vez; None si no tiene partición propia."""
+        counts = CampaignStatsRepositorySQLAlchemy(self.db).get_counts(campaign_id)
+        try:
+            if not drop_contacts_partition(self.db, campaign_id):
+                return None
+        except DBAPIError as ex:
+            # Otra tabla con FK a estos contactos (p.ej. calls)
+            if isinstance(getattr(ex, "orig", None), DependentObjectsStillExist):
+                raise ConflictError("Cannot delete contacts with related records") from ex
+            raise
+        bump_status_counts(self.db, campaign_id, {status: -n for status, n in counts.items()})
+        return sum(counts.values())
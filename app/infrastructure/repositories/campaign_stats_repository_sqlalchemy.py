@@ -0,0 +1,93 @@
+# backend/app/infrastructure/repositories/campaign_stats_repository_sqlalchemy.py
+from __future__ import annotations
+
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+from sqlalchemy.orm import Session
+from sqlalchemy import select, delete, func, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from app.config.settings import get_settings
+from app.core.domain.repositories.campaign_stats_repository import CampaignStatsRepository
+from app.infrastructure.db.callbot_campaign_contact_stats import CampaignContactStatsORM
+from app.infrastructure.db.callbot_campaign_contacts import CampaignContactORM
+
+def bump_status_counts(db: Session, campaign_id: int, deltas: Dict[str, int]) -> None:
+    """
+    Aplica deltas {status: +n/-n} a los contadores de la campaña en la transacción actual.
+    Cada conexión escribe en su shard (pg_backend_pid() % CONTACT_STATS_SHARDS): leases y
+    outcomes concurrentes de una misma campaña no esperan el lock de una única fila por
+    status. Dentro del shard las claves se ordenan para que dos escrituras que coinciden
+    en él bloqueen filas en el mismo orden.
+    """
+    shard = func.pg_backend_pid() % get_settings().CONTACT_STATS_SHARDS
+    rows = [
+        {"campaign_id": campaign_id, "status": status, "shard": shard, "contacts": n}
+        for status, n in sorted(deltas.items()) if n
+    ]
+    if not rows:
+        return
+    stmt = pg_insert(CampaignContactStatsORM).values(rows)
+    db.execute(stmt.on_conflict_do_update(
+        index_elements=[CampaignContactStatsORM.campaign_id, CampaignContactStatsORM.status, CampaignContactStatsORM.shard],
+        set_={"contacts": CampaignContactStatsORM.contacts + stmt.excluded.contacts},
+    ))
+
+def status_transitions(pairs: Iterable[Tuple[Optional[str], Optional[str]]]) -> Dict[str, int]:
+    """Convierte pares (status anterior, status nuevo) en deltas; None = fila creada/borrada."""
+    deltas: Counter = Counter()
+    for old, new in pairs:
+        if old == new:
+            continue
+        if old is not None:
+            deltas[old] -= 1
+        if new is not None:
+            deltas[new] += 1
+    return dict(deltas)
+
+class CampaignStatsRepositorySQLAlchemy(CampaignStatsRepository):
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_counts(self, campaign_id: int) -> Dict[str, int]:
+        rows = self.db.execute(
+            select(CampaignContactStatsORM.status, func.sum(CampaignContactStatsORM.contacts))
+            .where(CampaignContactStatsORM.campaign_id == campaign_id)
+            .group_by(CampaignContactStatsORM.status)
+        ).all()
+        return {status: int(n) for status, n in rows}
+
+    def reconcile(self, campaign_id: Optional[int] = None, apply: bool = True) -> List[Tuple[int, str, int, int]]:
+        # El lock bloquea los bump concurrentes mientras se cuenta: los que esperan
+        # corresponden a filas que este conteo todavía no ve, así que no se pierden.
+        self.db.execute(text("LOCK TABLE callbot.campaign_contact_stats IN SHARE ROW EXCLUSIVE MODE"))
+
+        actual_stmt = select(
+            CampaignContactORM.campaign_id, CampaignContactORM.status, func.count()
+        ).group_by(CampaignContactORM.campaign_id, CampaignContactORM.status)
+        stored_stmt = select(
+            CampaignContactStatsORM.campaign_id, CampaignContactStatsORM.status, func.sum(CampaignContactStatsORM.contacts)
+        ).group_by(CampaignContactStatsORM.campaign_id, CampaignContactStatsORM.status)
+        if campaign_id is not None:
+            actual_stmt = actual_stmt.where(CampaignContactORM.campaign_id == campaign_id)
+            stored_stmt = stored_stmt.where(CampaignContactStatsORM.campaign_id == campaign_id)
+
+        actual = {(c, s): n for c, s, n in self.db.execute(actual_stmt)}
+        stored = {(c, s): int(n) for c, s, n in self.db.execute(stored_stmt)}
+        drift = [
+            (c, s, stored.get((c, s), 0), actual.get((c, s), 0))
+            for c, s in sorted(actual.keys() | stored.keys())
+            if stored.get((c, s), 0) != actual.get((c, s), 0)
+        ]
+
+        if apply:
+            # Los shards se compactan: el valor real queda en el shard 0
+            clear = delete(CampaignContactStatsORM)
+            if campaign_id is not None:
+                clear = clear.where(CampaignContactStatsORM.campaign_id == campaign_id)
+            self.db.execute(clear)
+            if actual:
+                self.db.execute(pg_insert(CampaignContactStatsORM).values([
+                    {"campaign_id": c, "status": s, "shard": 0, "contacts": n} for (c, s), n in actual.items()
+                ]))
+        return drift
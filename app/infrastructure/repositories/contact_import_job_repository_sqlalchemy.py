@@ -0,0 +1,88 @@
+# backend/app/infrastructure/repositories/contact_import_job_repository_sqlalchemy.py
+from __future__ import annotations
+
+from typing import Optional, Dict, Any
+from sqlalchemy.orm import Session
+from sqlalchemy import select, update
+from sqlalchemy.exc import IntegrityError
+from psycopg2.errors import ForeignKeyViolation
+
+from app.core.domain.entities.contact_import_job import ContactImportJob
+from app.core.domain.repositories.contact_import_job_repository import ContactImportJobRepository
+from app.core.domain.errors import ValidationError
+from app.infrastructure.db.callbot_contact_import_jobs import ContactImportJobORM
+from app.security.auth import now_utc
+
+def _to_domain(row: ContactImportJobORM) -> ContactImportJob:
+    return ContactImportJob(
+        job_id=row.job_id,
+        campaign_id=row.campaign_id,
+        status=row.status,
+        file_path=row.file_path,
+        rows_processed=row.rows_processed,
+        inserted=row.inserted,
+        updated=row.updated,
+        rejected=row.rejected,
+        error=row.error,
+        created_by=row.created_by,
+        created_at=row.created_at,
+        started_at=row.started_at,
+        finished_at=row.finished_at,
+    )
+
+class ContactImportJobRepositorySQLAlchemy(ContactImportJobRepository):
+    def __init__(self, db: Session):
+        self.db = db
+
+    def create(self, campaign_id: int, data: Dict[str, Any]) -> ContactImportJob:
+        try:
+            row = ContactImportJobORM(
+                campaign_id=campaign_id,
+                status="Queued",
+                file_path=data["file_path"],
+                created_by=data.get("created_by") or "system",
+            )
+            self.db.add(row)
+            self.db.flush()
+            self.db.refresh(row)
+            return _to_domain(row)
+        except IntegrityError as ex:
+            if isinstance(getattr(ex, "orig", None), ForeignKeyViolation):
+                raise ValidationError(f"El campaign_id {campaign_id} no existe en la tabla campaigns") from ex
+            raise
+
+    def get(self, job_id: int) -> Optional[ContactImportJob]:
+        row = self.db.get(ContactImportJobORM, job_id)
+        return _to_domain(row) if row else None
+
+    def claim_next(self) -> Optional[ContactImportJob]:
+        # SKIP LOCKED: varios workers pueden hacer polling sin pisarse
+        next_id = (
+            select(ContactImportJobORM.job_id)
+            .where(ContactImportJobORM.status == "Queued")
+            .order_by(ContactImportJobORM.job_id)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        row = self.db.scalars(
+            update(ContactImportJobORM)
+            .where(ContactImportJobORM.job_id == next_id)
+            .values(status="Running", started_at=now_utc())
+            .returning(ContactImportJobORM)
+        ).first()
+        return _to_domain(row) if row else None
+
+    def update_progress(self, job_id: int, rows_processed: int, inserted: int, updated: int, rejected: int) -> None:
+        self.db.execute(
+            update(ContactImportJobORM)
+            .where(ContactImportJobORM.job_id == job_id)
+            .values(rows_processed=rows_processed, inserted=inserted, updated=updated, rejected=rejected)
+        )
+
+    def finish(self, job_id: int, status: str, error: Optional[str] = None) -> None:
+        self.db.execute(
+            update(ContactImportJobORM)
+            .where(ContactImportJobORM.job_id == job_id)
+            .values(status=status, error=error, finished_at=now_utc())
+        )
@@ -1,28 +1,45 @@
+import threading
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from app.config.settings import get_settings
-from app.presentation.api.routers import campaign_contacts, campaigns, auth, users
-
-def _load_all_models() -> None:
-    # Importaciones por efecto colateral: registran los mappers en Base.metadata
-    import app.infrastructure.db.users                 
-    import app.infrastructure.db.refresh_tokens        
-    import app.infrastructure.db.revoked_access_tokens  
-    import app.infrastructure.db.callbot_campaign_types      
-    import app.infrastructure.db.callbot_campaigns                
-    import app.infrastructure.db.callbot_campaign_contacts                 
-    from sqlalchemy.orm import configure_mappers
-    configure_mappers()
+from app.config.log import configure_logging
+from app.infrastructure.db.models import load_all_models
+from app.infrastructure.dispatch.due_scheduler import run_reconciler
+from app.workers.campaign_sweeper import run_loop as run_sweeper
+from app.presentation.api.query_budget import query_budget_middleware
+from app.presentation.api.routers import campaign_contacts, campaigns, auth, users, contact_imports, dispatch
 
 # Carga los modelos ANTES de crear la app / montar routers / abrir sesiones
-_load_all_models()
+load_all_models()
 
 settings = get_settings()
-app = FastAPI(title=settings.APP_NAME)
+configure_logging(settings)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Hilos de fondo opcionales; se detienen al apagar la app
+    stop = threading.Event()
+    threads = []
+    if settings.DISPATCH_SCHEDULER_ENABLED:
+        threads.append(threading.Thread(target=run_reconciler, args=(stop,), name="dispatch-reconciler", daemon=True))
+    if settings.CAMPAIGN_SWEEPER_ENABLED:
+        threads.append(threading.Thread(target=run_sweeper, args=(stop,), name="campaign-sweeper", daemon=True))
+    for t in threads:
+        t.start()
+    yield
+    stop.set()
+    for t in threads:
+        t.join(timeout=5)
+
+app = FastAPI(title=settings.APP_NAME, lifespan=lifespan)
+app.middleware("http")(query_budget_middleware)
 
 app.include_router(auth.router)
 app.include_router(users.router)
 app.include_router(campaigns.router)
 app.include_router(campaign_contacts.router)
+app.include_router(contact_imports.router)
+app.include_router(dispatch.router)
 
 @app.get("/")
 def root():
@@ -1,9 +1,9 @@
-from fastapi import Depends, HTTPException
+from fastapi import Depends, HTTPException, Request
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError
 from sqlalchemy.orm import Session
 
-from app.security.auth import decode_access_token
+from app.security.auth import decode_access_token_cached
 from app.infrastructure.db.session import get_session
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
@@ -13,12 +13,21 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 def get_db(db: Session = Depends(get_session)):
     return db
 
-def get_current_claims(token: str = Depends(oauth2_scheme)) -> dict:
+def get_current_claims(request: Request, token: str = Depends(oauth2_scheme)) -> dict:
+    # FastAPI ya resuelve esta dependencia una sola vez por request (require_scopes y el
+    # handler comparten el resultado); request.state.claims la deja disponible fuera del
+    # árbol de dependencias (middlewares, logs) y el caché evita verificar la firma del
+    # mismo token en cada request.
+    claims = getattr(request.state, "claims", None)
+    if claims is not None:
+        return claims
     try:
-        payload = decode_access_token(token)
-        return {"sub": payload.get("sub"), "scopes": payload.get("scopes", [])}
+        payload = decode_access_token_cached(token)
     except JWTError:
         raise HTTPException(status_code=401, detail="Token inválido o expirado")
+    claims = {"sub": payload.get("sub"), "scopes": payload.get("scopes", [])}
+    request.state.claims = claims
+    return claims
 
 def require_scopes(required: list[str]):
     def _dep(claims = Depends(get_current_claims)):
@@ -1,9 +1,19 @@
 # backend/app/presentation/api/dependencies_callbot.py
-from fastapi import Depends
+from contextlib import contextmanager
+from typing import Iterator, Optional
+from fastapi import Depends, HTTPException
 from sqlalchemy.orm import Session
-from app.infrastructure.db.session import get_session
+from app.config.settings import get_settings
+from app.core.domain.errors import ConflictError
+from app.core.domain.phone import region_for_campaign
+from app.core.use_cases.ensure_campaign_writable import EnsureCampaignWritable
+from app.infrastructure.db.session import get_session, SessionLocal
 from app.infrastructure.repositories.campaign_repository_sqlalchemy import CampaignRepositorySQLAlchemy
 from app.infrastructure.repositories.campaign_contact_repository_sqlalchemy import CampaignContactRepositorySQLAlchemy
+from app.infrastructure.repositories.contact_import_job_repository_sqlalchemy import ContactImportJobRepositorySQLAlchemy
+from app.infrastructure.repositories.campaign_stats_repository_sqlalchemy import CampaignStatsRepositorySQLAlchemy
+from app.infrastructure.dispatch.due_scheduler import get_due_scheduler
+from app.infrastructure.dispatch.pacing_limiter import DbDispatchLimiter, LocalDispatchLimiter
 
 
 def get_db(db: Session = Depends(get_session)):
@@ -12,5 +22,44 @@ def get_db(db: Session = Depends(get_session)):
 def get_campaign_repo(db: Session = Depends(get_db)):
     return CampaignRepositorySQLAlchemy(db)
 
+def get_campaign_phone_region(campaign_id: int, repo=Depends(get_campaign_repo)) -> Optional[str]:
+    # Región por defecto para normalizar teléfonos de la campaña (None si no existe)
+    campaign = repo.get(campaign_id)
+    return region_for_campaign(campaign.timezone, campaign.config) if campaign else None
+
+def require_writable_campaign(campaign_id: int, repo=Depends(get_campaign_repo)) -> None:
+    # 409 para escrituras sobre una campaña en 'Deleting'; la fila queda bloqueada (FOR SHARE)
+    # hasta el commit del request, así que no puede pasar a 'Deleting' a mitad de la escritura
+    try:
+        EnsureCampaignWritable(repo)(campaign_id)
+    except ConflictError as ex:
+        raise HTTPException(status_code=409, detail=str(ex))
+
 def get_campaign_contact_repo(db: Session = Depends(get_db)):
-    return CampaignContactRepositorySQLAlchemy(db)
\ No newline at end of file
+    return CampaignContactRepositorySQLAlchemy(db)
+
+def get_contact_import_job_repo(db: Session = Depends(get_db)):
+    return ContactImportJobRepositorySQLAlchemy(db)
+
+def get_campaign_stats_repo(db: Session = Depends(get_db)):
+    return CampaignStatsRepositorySQLAlchemy(db)
+
+def get_dispatch_scheduler():
+    # None si DISPATCH_SCHEDULER_ENABLED está apagado (lease puramente SQL)
+    return get_due_scheduler()
+
+def get_dispatch_limiter(db: Session = Depends(get_db)):
+    stats_repo = CampaignStatsRepositorySQLAlchemy(db)
+    if get_settings().DISPATCH_LIMITER_BACKEND == "local":
+        return LocalDispatchLimiter(stats_repo)
+    return DbDispatchLimiter(db, stats_repo)
+
+@contextmanager
+def campaign_contact_repo_scope() -> Iterator[CampaignContactRepositorySQLAlchemy]:
+    # Sesión propia (solo lectura) para respuestas en streaming: la de get_session
+    # se cierra antes de que se envíe el cuerpo de la respuesta.
+    db = SessionLocal()
+    try:
+        yield CampaignContactRepositorySQLAlchemy(db)
+    finally:
+        db.close()
\ No newline at end of file
@@ -0,0 +1,31 @@
+# backend/app/presentation/api/pagination.py
+import base64
+import json
+from typing import Optional, Sequence
+from fastapi import HTTPException, Response
+
+# Paginación por cursor (keyset): el cursor es opaco para el cliente y codifica
+# el último id entregado; la siguiente página pide los ids menores (orden DESC).
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+def encode_cursor(last_id: int) -> str:
+    raw = json.dumps({"k": last_id}, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+def decode_cursor(cursor: Optional[str]) -> Optional[int]:
+    if not cursor:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        value = json.loads(base64.urlsafe_b64decode(padded))["k"]
+        if not isinstance(value, int):
+            raise ValueError(value)
+        return value
+    except Exception:
+        raise HTTPException(status_code=422, detail="Invalid cursor")
+
+def set_next_cursor(response: Response, items: Sequence, limit: int, id_attr: str) -> None:
+    """Agrega X-Next-Cursor si la página vino llena (puede haber más resultados)."""
+    if items and len(items) >= limit:
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(getattr(items[-1], id_attr))
@@ -0,0 +1,34 @@
+# backend/app/presentation/api/query_budget.py
+from fastapi import Request
+
+from app.config.log import get_logger
+from app.infrastructure.db import query_stats
+
+logger = get_logger(__name__)
+
+async def query_budget_middleware(request: Request, call_next):
+    """
+    Abre un QueryStats por request: agrega Server-Timing (tiempo en BD, sentencias,
+    filas) y registra la ruta cuando supera SQL_QUERY_BUDGET o repite sentencias (N+1).
+    Las consultas de un StreamingResponse que ocurren al enviar el cuerpo no se cuentan.
+    """
+    with query_stats.track() as stats:
+        response = await call_next(request)
+
+    if stats.statements:
+        response.headers.append("Server-Timing", stats.server_timing())
+    route = request.scope.get("route")
+    path = getattr(route, "path", request.url.path)
+    if stats.over_budget:
+        logger.warning(
+            "sql.budget_exceeded",
+            method=request.method, route=path, statements=stats.statements,
+            budget=stats.budget, rows=stats.rows, db_ms=round(stats.db_seconds * 1000, 1),
+        )
+    for statement, caller in stats.n_plus_one.items():
+        logger.warning(
+            "sql.n_plus_one",
+            method=request.method, route=path, caller=caller,
+            repeats=stats.by_statement[statement], statement=statement[:200],
+        )
+    return response
@@ -1,60 +1,192 @@
 # backend/app/presentation/api/routers/campaign_contacts.py
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from typing import Optional, List, Dict, Any
+from fastapi import APIRouter, Depends, File, HTTPException, Query, Response, UploadFile, status
+from fastapi.responses import StreamingResponse
+from typing import Iterator, Optional, List, Dict, Any
 from datetime import datetime
-from app.core.domain.repositories.campaign_contact_repository import CampaignContactRepository
-from app.presentation.api.dependencies_callbot import get_campaign_contact_repo
+from app.core.domain.repositories.campaign_contact_repository import CampaignContactRepository, EXPORT_FIELDS
+from app.presentation.api.dependencies_callbot import (
+    get_db,
+    get_campaign_contact_repo,
+    get_campaign_phone_region,
+    get_campaign_repo,
+    require_writable_campaign,
+    campaign_contact_repo_scope,
+)
+from app.presentation.api.schemas.contact_schemas import ContactBulkIn, ContactBulkOut
 from app.presentation.api.dependencies_auth import get_current_claims, require_scopes
+from app.presentation.api.pagination import decode_cursor, set_next_cursor
 from app.core.domain.errors import ValidationError, ConflictError
 from app.core.use_cases.enroll_contacts import EnrollContacts
 from app.core.use_cases.enroll_contacts_csv import EnrollContactsCSV
+from app.core.use_cases.bulk_update_contacts import BulkUpdateContacts
+from app.core.use_cases.ensure_campaign_writable import EnsureCampaignWritable
+from app.core.domain.repositories.campaign_repository import CampaignRepository
+from app.core.domain.phone import normalize_phone
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from app.config.settings import get_settings
+import csv
+import io
+import json
 import logging
 
 from app.security.auth import now_utc
 
 router = APIRouter(prefix="/campaigns/{campaign_id}/contacts", tags=["campaign-contacts"])
 
+def _canonical_phone(body: Dict[str, Any], region: Optional[str]) -> None:
+    # Misma forma canónica (E.164) que usa EnrollContacts, para no duplicar contactos
+    phone = body.get("phone")
+    if isinstance(phone, str) and phone.strip():
+        info = normalize_phone(phone, region)
+        if info:
+            body["phone"] = info.e164
+
 @router.get("/list", dependencies=[Depends(require_scopes(["campaigns:read"]))])
 def list_contacts(
     campaign_id: int,
-    q: Optional[str] = Query(None),
+    response: Response,
+    q: Optional[str] = Query(None, description="Subcadena de phone o name; '*1234' busca phones que terminan en 1234"),
     status_q: Optional[str] = Query(None, alias="status"),
     limit: int = 50,
     offset: int = 0,
+    after: Optional[str] = Query(None, description="Cursor de X-Next-Cursor de la página anterior"),
     repo: CampaignContactRepository = Depends(get_campaign_contact_repo),
 ):
-    return repo.list(campaign_id, q, status_q, limit, offset)
+    items = repo.list(campaign_id, q, status_q, limit, offset, decode_cursor(after))
+    set_next_cursor(response, items, limit, "campaign_contact_id")
+    return items
+
+def _json_default(v: Any) -> str:
+    return v.isoformat() if isinstance(v, datetime) else str(v)
+
+def _export_stream(campaign_id: int, q: Optional[str], status_q: Optional[str], fmt: str) -> Iterator[bytes]:
+    batch_size = get_settings().CONTACTS_EXPORT_BATCH_SIZE
+    buf = io.StringIO()
+    writer = csv.writer(buf, lineterminator="\n")
+    if fmt == "csv":
+        writer.writerow(EXPORT_FIELDS)
+    with campaign_contact_repo_scope() as repo:
+        for n, row in enumerate(repo.iter_rows(campaign_id, q, status_q, batch_size), start=1):
+            if fmt == "csv":
+                writer.writerow(
+                    json.dumps(v, ensure_ascii=False) if isinstance(v, dict)
+                    else v.isoformat() if isinstance(v, datetime) else v
+                    for v in row
+                )
+            else:
+                buf.write(json.dumps(dict(zip(EXPORT_FIELDS, row)), default=_json_default, ensure_ascii=False))
+                buf.write("\n")
+            if n % batch_size == 0:
+                yield buf.getvalue().encode("utf-8")
+                buf.seek(0)
+                buf.truncate()
+    yield buf.getvalue().encode("utf-8")
+
+@router.get("/export", dependencies=[Depends(require_scopes(["campaigns:read"]))])
+def export_contacts(
+    campaign_id: int,
+    fmt: str = Query("csv", alias="format", pattern="^(csv|ndjson)$"),
+    q: Optional[str] = Query(None),
+    status_q: Optional[str] = Query(None, alias="status"),
+):
+    """
+    Exporta los contactos de la campaña (mismos filtros que /list) en CSV o NDJSON.
+    Las filas salen de un cursor del lado del servidor directo a la respuesta,
+    sin pasar por el ORM, con memoria constante.
+    """
+    media_type = "text/csv" if fmt == "csv" else "application/x-ndjson"
+    filename = f"campaign_{campaign_id}_contacts.{fmt}"
+    return StreamingResponse(
+        _export_stream(campaign_id, q, status_q, fmt),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
 
-@router.post("/enroll", status_code=status.HTTP_201_CREATED, dependencies=[Depends(require_scopes(["campaigns:write"]))])
+@router.post("/enroll", status_code=status.HTTP_201_CREATED,
+             dependencies=[Depends(require_scopes(["campaigns:write"])), Depends(require_writable_campaign)])
 def create_contact(
     campaign_id: int,
     body: Dict[str, Any],
+    response: Response,
+    dry_run: bool = Query(False),
     repo: CampaignContactRepository = Depends(get_campaign_contact_repo),
     claims: Dict[str, Any] = Depends(get_current_claims),
+    region: Optional[str] = Depends(get_campaign_phone_region),
 ):
     try:
         if not body.get("created_by"):
             body["created_by"] = claims.get("sub") or "system"
+        _canonical_phone(body, region)
+        if dry_run:
+            return _check_create(repo, campaign_id, body, response)
         return repo.create(campaign_id, body)
     except ValidationError as ex:
         raise HTTPException(status_code=422, detail=str(ex))
     except ConflictError as ex:
         raise HTTPException(status_code=409, detail=str(ex))
 
-@router.put("/update", dependencies=[Depends(require_scopes(["campaigns:write"]))])
+def _check_create(repo: CampaignContactRepository, campaign_id: int, body: Dict[str, Any], response: Response) -> Dict[str, Any]:
+    """
+    Dry-run de /enroll con las mismas reglas que repo.create: sin phone responde 422 y
+    con un phone ya inscrito 409; si se crearía, 200 con la forma del diff de los CSV.
+    """
+    phone = str(body.get("phone") or "").strip()
+    if not phone:
+        raise ValidationError("phone is required")
+    if repo.get_by_phone(campaign_id, phone) is not None:
+        raise ConflictError(f"Contact with phone '{phone}' already exists for this campaign.")
+    response.status_code = status.HTTP_200_OK
+    return {
+        "received": 1, "inserted": 1, "updated": 0,
+        "deduplicated": 0, "skipped": 0, "rejected": 0, "errors": [],
+    }
+
+@router.put("/update",
+            dependencies=[Depends(require_scopes(["campaigns:write"])), Depends(require_writable_campaign)])
 def upsert_contact(
     campaign_id: int,
     body: Dict[str, Any],
     repo: CampaignContactRepository = Depends(get_campaign_contact_repo),
     claims: Dict[str, Any] = Depends(get_current_claims),
+    region: Optional[str] = Depends(get_campaign_phone_region),
 ):
     if not body.get("created_by"):
         body["created_by"] = claims.get("sub") or "system"
+    _canonical_phone(body, region)
     
     body["updated_at"] = now_utc()
     return repo.upsert(campaign_id, body)
 
+@router.post("/bulk", response_model=ContactBulkOut,
+             dependencies=[Depends(require_scopes(["campaigns:write"])), Depends(require_writable_campaign)])
+def bulk_update_contacts(
+    campaign_id: int,
+    body: ContactBulkIn,
+    repo: CampaignContactRepository = Depends(get_campaign_contact_repo),
+    campaign_repo: CampaignRepository = Depends(get_campaign_repo),
+    db: Session = Depends(get_db),
+    region: Optional[str] = Depends(get_campaign_phone_region),
+):
+    """
+    Aplica una acción (status, reset de intentos, next_attempt_at, merge de attributes)
+    a todos los contactos que cumplen el filtro, en UPDATEs set-based por chunks.
+    """
+    criteria = body.filter.model_dump()
+    if criteria.get("phones"):
+        criteria["phones"] = [
+            info.e164 if (info := normalize_phone(p, region)) else p.strip()
+            for p in criteria["phones"]
+        ]
+    try:
+        return BulkUpdateContacts(repo, db.commit, EnsureCampaignWritable(campaign_repo))(
+            campaign_id, criteria, body.action.model_dump(), get_settings().CONTACTS_BULK_CHUNK_SIZE
+        )
+    except ValidationError as ex:
+        raise HTTPException(status_code=422, detail=str(ex))
+    except ConflictError as ex:
+        raise HTTPException(status_code=409, detail=str(ex))
+
 @router.delete("/delete/{campaign_contact_id}", status_code=status.HTTP_204_NO_CONTENT,
                dependencies=[Depends(require_scopes(["campaigns:write"]))])
 def delete_contact(
@@ -65,22 +197,30 @@ def delete_contact(
     repo.delete(campaign_contact_id)
     return
 
-@router.post("/upload_csv", status_code=status.HTTP_201_CREATED, dependencies=[Depends(require_scopes(["campaigns:write"]))])
+@router.post("/upload_csv", status_code=status.HTTP_201_CREATED,
+             dependencies=[Depends(require_scopes(["campaigns:write"])), Depends(require_writable_campaign)])
 def upload_contacts_csv(
     campaign_id: int,
     body: Dict[str, str],
+    response: Response,
+    dry_run: bool = Query(False),
     repo: CampaignContactRepository = Depends(get_campaign_contact_repo),
     claims: Dict[str, Any] = Depends(get_current_claims),
+    region: Optional[str] = Depends(get_campaign_phone_region),
 ):
     csv_base64 = body.get("csv_base64")
     if not csv_base64:
         raise HTTPException(status_code=422, detail="csv_base64 is required")
     if not body.get("created_by"):
         body["created_by"] = claims.get("sub") or "system"
-    enroll_uc = EnrollContacts(repo)
-    enroll_csv_uc = EnrollContactsCSV(enroll_uc)
+    enroll_uc = EnrollContacts(repo, region)
+    settings = get_settings()
+    enroll_csv_uc = EnrollContactsCSV(enroll_uc, settings.CONTACTS_COPY_THRESHOLD)
     try:
         created_by = body.get("created_by", claims.get("sub") or "system")
+        if dry_run:
+            response.status_code = status.HTTP_200_OK
+            return enroll_csv_uc.diff(campaign_id, csv_base64, created_by)
         inserted, existing = enroll_csv_uc(campaign_id, csv_base64, created_by)
         return {"inserted": inserted, "existing": existing}
     except ValidationError as ex:
@@ -92,3 +232,40 @@ def upload_contacts_csv(
     except Exception as ex:
         logging.exception("Error inesperado en upload_contacts_csv")
         raise HTTPException(status_code=500, detail="Error inesperado: " + str(ex))
+
+@router.post("/upload_csv_file", status_code=status.HTTP_201_CREATED,
+             dependencies=[Depends(require_scopes(["campaigns:write"])), Depends(require_writable_campaign)])
+def upload_contacts_csv_file(
+    campaign_id: int,
+    response: Response,
+    file: UploadFile = File(...),
+    dry_run: bool = Query(False),
+    repo: CampaignContactRepository = Depends(get_campaign_contact_repo),
+    claims: Dict[str, Any] = Depends(get_current_claims),
+    region: Optional[str] = Depends(get_campaign_phone_region),
+):
+    """
+    Variante multipart de upload_csv: el archivo se lee por streaming y se
+    valida/inserta por chunks, sin cargarlo completo en memoria.
+    Con dry_run=true solo informa el diff (insertados/actualizados/duplicados/rechazados).
+    """
+    created_by = claims.get("sub") or "system"
+    settings = get_settings()
+    enroll_csv_uc = EnrollContactsCSV(EnrollContacts(repo, region), settings.CONTACTS_COPY_THRESHOLD)
+    try:
+        if dry_run:
+            response.status_code = status.HTTP_200_OK
+            return enroll_csv_uc.diff_file(campaign_id, file.file, created_by, settings.CONTACTS_UPSERT_CHUNK_SIZE)
+        inserted, existing = enroll_csv_uc.from_file(
+            campaign_id, file.file, created_by, settings.CONTACTS_UPSERT_CHUNK_SIZE
+        )
+        return {"inserted": inserted, "existing": existing}
+    except ValidationError as ex:
+        raise HTTPException(status_code=422, detail=str(ex))
+    except ConflictError as ex:
+        raise HTTPException(status_code=409, detail=str(ex))
+    except IntegrityError as ex:
+        raise HTTPException(status_code=422, detail="Error de integridad en la base de datos: " + str(ex))
+    except Exception as ex:
+        logging.exception("Error inesperado en upload_contacts_csv_file")
+        raise HTTPException(status_code=500, detail="Error inesperado: " + str(ex))
@@ -1,5 +1,5 @@
 # backend/app/presentation/api/routers/campaigns.py
-from fastapi import APIRouter, Depends, HTTPException, Query, UploadFile, File, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, UploadFile, File, status
 from fastapi.responses import JSONResponse
 from typing import Optional, List, Dict, Any
 from sqlalchemy.orm import Session
@@ -7,15 +7,20 @@ from app.presentation.api.schemas.campaign_schemas import (
     CampaignCreateIn,
     CampaignUpdateIn,
     CampaignOut,
+    CampaignStatsOut,
 )
 from app.presentation.api.dependencies_callbot import (
     get_campaign_repo,
     get_campaign_contact_repo,
+    get_campaign_stats_repo,
 )
 from app.core.domain.repositories.campaign_repository import CampaignRepository
 from app.core.domain.repositories.campaign_contact_repository import CampaignContactRepository
+from app.core.domain.repositories.campaign_stats_repository import CampaignStatsRepository
+from app.core.domain.entities.campaign_contact import CONTACT_STATUSES
 from app.presentation.api.dependencies_callbot import get_db
 from app.presentation.api.dependencies_auth import get_current_claims, require_scopes
+from app.presentation.api.pagination import decode_cursor, set_next_cursor
 from psycopg2.errors import UniqueViolation
 
 from app.core.use_cases.create_campaign import CreateCampaign
@@ -89,7 +94,7 @@ def update_campaign(
 
 @router.delete(
     "/delete/{campaign_id}",
-    status_code=status.HTTP_204_NO_CONTENT,
+    status_code=status.HTTP_202_ACCEPTED,
     dependencies=[Depends(require_scopes(["campaigns:write"]))],
 )
 def delete_campaign(
@@ -97,8 +102,9 @@ def delete_campaign(
     repo: CampaignRepository = Depends(get_campaign_repo),
 ):
     try:
+        # Marca la campaña como 'Deleting'; el borrado real lo hace app.workers.campaign_purger
         DeleteCampaign(repo)(campaign_id)
-        return  # 204
+        return {"campaign_id": campaign_id, "status": "Deleting"}
     except NotFoundError as ex:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(ex))
     except ConflictError as ex:
@@ -127,14 +133,36 @@ def get_campaign(
     return obj
 
 
+@router.get("/{campaign_id}/stats",
+            response_model=CampaignStatsOut,
+            dependencies=[Depends(require_scopes(["campaigns:read"]))],
+            )
+def get_campaign_stats(
+    campaign_id: int,
+    repo: CampaignRepository = Depends(get_campaign_repo),
+    stats_repo: CampaignStatsRepository = Depends(get_campaign_stats_repo),
+):
+    # Lee los contadores mantenidos en cada escritura (sin COUNT sobre campaign_contacts)
+    if not repo.get(campaign_id):
+        raise HTTPException(404, "Campaign not found")
+    stored = stats_repo.get_counts(campaign_id)
+    counts = {s: stored.get(s, 0) for s in CONTACT_STATUSES}
+    counts.update({s: n for s, n in stored.items() if s not in counts})
+    return CampaignStatsOut(campaign_id=campaign_id, counts=counts, total=sum(counts.values()))
+
+
 @router.get("/all", 
             response_model=List[CampaignOut],
             dependencies=[Depends(require_scopes(["campaigns:read"]))],
             )
 def list_campaigns(
+    response: Response,
     q: Optional[str] = Query(None),
     limit: int = 50,
     offset: int = 0,
+    after: Optional[str] = Query(None, description="Cursor de X-Next-Cursor de la página anterior"),
     repo: CampaignRepository = Depends(get_campaign_repo),
 ):
-    return repo.list(q, limit, offset)
+    items = repo.list(q, limit, offset, decode_cursor(after))
+    set_next_cursor(response, items, limit, "campaign_id")
+    return items
@@ -0,0 +1,69 @@
+# backend/app/presentation/api/routers/contact_imports.py
+import os
+import shutil
+import uuid
+from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
+from typing import Dict, Any
+from app.config.settings import get_settings
+from app.core.domain.entities.contact_import_job import ContactImportJob
+from app.core.domain.repositories.contact_import_job_repository import ContactImportJobRepository
+from app.core.domain.errors import ValidationError
+from app.presentation.api.dependencies_callbot import get_contact_import_job_repo, require_writable_campaign
+from app.presentation.api.dependencies_auth import get_current_claims, require_scopes
+from app.presentation.api.schemas.contact_import_schemas import ContactImportJobOut
+from app.security.auth import now_utc
+
+router = APIRouter(prefix="/campaigns/{campaign_id}/imports", tags=["contact-imports"])
+
+def _to_out(job: ContactImportJob) -> ContactImportJobOut:
+    return ContactImportJobOut(
+        job_id=job.job_id,
+        campaign_id=job.campaign_id,
+        status=job.status,
+        rows_processed=job.rows_processed,
+        inserted=job.inserted,
+        updated=job.updated,
+        rejected=job.rejected,
+        rows_per_second=job.rows_per_second(now_utc()),
+        error=job.error,
+        created_by=job.created_by,
+        created_at=job.created_at,
+        started_at=job.started_at,
+        finished_at=job.finished_at,
+    )
+
+@router.post("", response_model=ContactImportJobOut, status_code=status.HTTP_202_ACCEPTED,
+             dependencies=[Depends(require_scopes(["campaigns:write"])), Depends(require_writable_campaign)])
+def queue_import(
+    campaign_id: int,
+    file: UploadFile = File(...),
+    repo: ContactImportJobRepository = Depends(get_contact_import_job_repo),
+    claims: Dict[str, Any] = Depends(get_current_claims),
+):
+    """
+    Encola la importación de un CSV (phone, name, attributes). El archivo se guarda
+    en IMPORT_SPOOL_DIR y lo procesa app.workers.contact_import_worker por chunks.
+    """
+    spool_dir = get_settings().IMPORT_SPOOL_DIR
+    os.makedirs(spool_dir, exist_ok=True)
+    path = os.path.join(spool_dir, f"{campaign_id}-{uuid.uuid4().hex}.csv")
+    with open(path, "wb") as out:
+        shutil.copyfileobj(file.file, out, 1024 * 1024)
+    try:
+        job = repo.create(campaign_id, {"file_path": path, "created_by": claims.get("sub") or "system"})
+    except ValidationError as ex:
+        os.remove(path)
+        raise HTTPException(status_code=422, detail=str(ex))
+    return _to_out(job)
+
+@router.get("/{job_id}", response_model=ContactImportJobOut,
+            dependencies=[Depends(require_scopes(["campaigns:read"]))])
+def get_import(
+    campaign_id: int,
+    job_id: int,
+    repo: ContactImportJobRepository = Depends(get_contact_import_job_repo),
+):
+    job = repo.get(job_id)
+    if not job or job.campaign_id != campaign_id:
+        raise HTTPException(404, "Import job not found")
+    return _to_out(job)
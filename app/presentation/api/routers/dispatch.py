@@ -0,0 +1,78 @@
+# backend/app/presentation/api/routers/dispatch.py
+from fastapi import APIRouter, Depends, HTTPException, Query
+from app.config.settings import get_settings
+from app.core.domain.errors import NotFoundError, ConflictError, ValidationError
+from app.core.domain.repositories.campaign_repository import CampaignRepository
+from app.core.domain.repositories.campaign_contact_repository import CampaignContactRepository
+from app.core.use_cases.lease_contacts import LeaseContacts
+from app.core.use_cases.report_outcomes import ReportOutcomes
+from app.presentation.api.dependencies_callbot import get_campaign_repo, get_campaign_contact_repo, get_dispatch_scheduler, get_dispatch_limiter, get_db
+from app.presentation.api.dependencies_auth import require_scopes
+from app.presentation.api.schemas.dispatch_schemas import LeaseOut, LeasedContactOut, OutcomesIn, OutcomesOut
+from app.security.auth import now_utc
+
+router = APIRouter(prefix="/campaigns/{campaign_id}", tags=["dispatch"])
+
+@router.post("/dispatch/lease", response_model=LeaseOut, dependencies=[Depends(require_scopes(["campaigns:write"]))])
+def lease_contacts(
+    campaign_id: int,
+    n: int = Query(100, ge=1, le=1000),
+    campaign_repo: CampaignRepository = Depends(get_campaign_repo),
+    contact_repo: CampaignContactRepository = Depends(get_campaign_contact_repo),
+    scheduler=Depends(get_dispatch_scheduler),
+    limiter=Depends(get_dispatch_limiter),
+    db=Depends(get_db),
+):
+    """
+    Reclama hasta n contactos vencidos para un nodo dialer (FOR UPDATE SKIP LOCKED:
+    varios dialers en paralelo reciben lotes disjuntos). Los contactos quedan en
+    Dialing hasta lease_expires_at; el resultado se reporta en /outcomes.
+    Con max_cps / max_concurrent en campaign.config se pueden recibir menos de n.
+    """
+    try:
+        leased, lease_until = LeaseContacts(campaign_repo, contact_repo, scheduler, limiter, db.commit)(
+            campaign_id, n, now_utc(), get_settings().DISPATCH_LEASE_SECONDS
+        )
+    except NotFoundError as ex:
+        raise HTTPException(status_code=404, detail=str(ex))
+    except ConflictError as ex:
+        raise HTTPException(status_code=409, detail=str(ex))
+    except ValidationError as ex:
+        raise HTTPException(status_code=422, detail=str(ex))
+    return LeaseOut(
+        campaign_id=campaign_id,
+        window_open=lease_until is not None,
+        lease_expires_at=lease_until,
+        contacts=[
+            LeasedContactOut(
+                campaign_contact_id=c.campaign_contact_id,
+                phone=c.phone,
+                name=c.name,
+                attributes=c.attributes,
+                attempt_count=c.attempt_count,
+            )
+            for c in leased
+        ],
+    )
+
+@router.post("/outcomes", response_model=OutcomesOut, dependencies=[Depends(require_scopes(["campaigns:write"]))])
+def report_outcomes(
+    campaign_id: int,
+    body: OutcomesIn,
+    campaign_repo: CampaignRepository = Depends(get_campaign_repo),
+    contact_repo: CampaignContactRepository = Depends(get_campaign_contact_repo),
+):
+    """
+    Resultados de llamadas en lote: un solo UPDATE que suma el intento, guarda
+    disposition/error y reprograma (retry_minutes) o cierra el contacto
+    (Finished/Error con final=true o al agotar max_attempts). Cada resultado lleva el
+    lease_expires_at de su lease; los de un lease que ya no está vigente se ignoran.
+    """
+    try:
+        return ReportOutcomes(campaign_repo, contact_repo)(
+            campaign_id, [o.model_dump() for o in body.outcomes], now_utc()
+        )
+    except NotFoundError as ex:
+        raise HTTPException(status_code=404, detail=str(ex))
+    except ValidationError as ex:
+        raise HTTPException(status_code=422, detail=str(ex))
@@ -1,6 +1,6 @@
 # backend/app/presentation/api/schemas/campaign_schemas.py
 from pydantic import BaseModel, Field
-from typing import Optional, Any
+from typing import Optional, Any, Dict
 from datetime import datetime, time
 
 class CampaignCreateIn(BaseModel):
@@ -40,3 +40,8 @@ class CampaignOut(BaseModel):
     config: dict
     created_by: str
     created_at: datetime
+
+class CampaignStatsOut(BaseModel):
+    campaign_id: int
+    counts: Dict[str, int]      # contactos por status (todos los status, 0 si no hay)
+    total: int
@@ -0,0 +1,19 @@
+# backend/app/presentation/api/schemas/contact_import_schemas.py
+from pydantic import BaseModel
+from typing import Optional
+from datetime import datetime
+
+class ContactImportJobOut(BaseModel):
+    job_id: int
+    campaign_id: int
+    status: str
+    rows_processed: int
+    inserted: int
+    updated: int
+    rejected: int
+    rows_per_second: Optional[float]
+    error: Optional[str]
+    created_by: str
+    created_at: datetime
+    started_at: Optional[datetime]
+    finished_at: Optional[datetime]
@@ -1,6 +1,7 @@
 # backend/app/presentation/api/schemas/contact_schemas.py
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, Field
+from typing import Optional, List, Dict, Any
+from datetime import datetime
 
 class ContactUpsertIn(BaseModel):
     phone: str
@@ -14,3 +15,24 @@ class ContactOut(BaseModel):
     name: Optional[str]
     attributes: dict
     created_by: str
+
+class ContactBulkFilter(BaseModel):
+    status: Optional[List[str]] = None
+    attempt_count_min: Optional[int] = None
+    attempt_count_max: Optional[int] = None
+    attributes: Optional[Dict[str, Any]] = None     # attributes contiene estos pares
+    phones: Optional[List[str]] = None
+
+class ContactBulkAction(BaseModel):
+    status: Optional[str] = None
+    reset_attempts: bool = False
+    next_attempt_at: Optional[datetime] = None
+    merge_attributes: Optional[Dict[str, Any]] = None
+
+class ContactBulkIn(BaseModel):
+    filter: ContactBulkFilter
+    action: ContactBulkAction
+
+class ContactBulkOut(BaseModel):
+    updated: int
+    chunks: int
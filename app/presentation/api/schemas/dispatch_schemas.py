@@ -0,0 +1,32 @@
+# backend/app/presentation/api/schemas/dispatch_schemas.py
+from pydantic import BaseModel, Field
+from typing import Optional, List, Dict
+from datetime import datetime
+
+class LeasedContactOut(BaseModel):
+    campaign_contact_id: int
+    phone: str
+    name: Optional[str]
+    attributes: dict
+    attempt_count: int
+
+class LeaseOut(BaseModel):
+    campaign_id: int
+    window_open: bool
+    lease_expires_at: Optional[datetime]
+    contacts: List[LeasedContactOut]
+
+class OutcomeIn(BaseModel):
+    campaign_contact_id: int
+    lease_expires_at: datetime          # el de la respuesta de /dispatch/lease: identifica el lease
+    disposition: Optional[str] = Field(default=None, max_length=60)
+    error: Optional[str] = None
+    final: bool = False                 # no reintentar aunque queden intentos
+
+class OutcomesIn(BaseModel):
+    outcomes: List[OutcomeIn] = Field(max_length=5000)
+
+class OutcomesOut(BaseModel):
+    applied: int
+    statuses: Dict[str, int]            # contactos aplicados por status resultante
+    ignored: List[int]                  # ids sin ese lease vigente (vencido, reasignado o ya reportado)
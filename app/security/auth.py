@@ -1,9 +1,12 @@
+from collections import OrderedDict
 from datetime import datetime, timezone
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 from jose import jwt
 from passlib.context import CryptContext
 from app.config.settings import get_settings
 import hashlib
+import threading
+import time
 from secrets import token_urlsafe
 import uuid
 
@@ -43,6 +46,50 @@ def decode_access_token(token: str) -> dict:
         issuer=settings.JWT_ISS,
     )
 
+class _ClaimsCache:
+    """
+    LRU acotado de tokens ya verificados: sha256(token) -> (claims, exp).
+    Solo guarda tokens válidos y cada entrada vale hasta su `exp`; los tokens de
+    acceso no se revocan antes de expirar, así que el resultado es el mismo que
+    volver a verificar la firma.
+    """
+    def __init__(self, size: int):
+        self.size = size
+        self._entries: "OrderedDict[bytes, Tuple[dict, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: bytes) -> dict | None:
+        with self._lock:
+            hit = self._entries.get(key)
+            if hit is None:
+                return None
+            if hit[1] <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return hit[0]
+
+    def put(self, key: bytes, claims: dict) -> None:
+        exp = claims.get("exp")
+        if self.size <= 0 or not isinstance(exp, (int, float)):
+            return
+        with self._lock:
+            self._entries[key] = (claims, float(exp))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.size:
+                self._entries.popitem(last=False)
+
+_claims_cache = _ClaimsCache(settings.JWT_CACHE_SIZE)
+
+def decode_access_token_cached(token: str) -> dict:
+    """decode_access_token con caché hasta `exp`. El dict devuelto se comparte: no mutarlo."""
+    key = hashlib.sha256(token.encode("utf-8")).digest()
+    claims = _claims_cache.get(key)
+    if claims is None:
+        claims = decode_access_token(token)     # JWTError si no es válido (no se cachea)
+        _claims_cache.put(key, claims)
+    return claims
+
 def new_refresh_raw() -> str:
     """Genera un refresh token opaco (alto entropía)."""
     return token_urlsafe(64)
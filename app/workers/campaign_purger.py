@@ -0,0 +1,43 @@
+# backend/app/workers/campaign_purger.py
+# Purgador de campañas en 'Deleting'. Ejecutar como proceso aparte:
+#   python -m app.workers.campaign_purger
+import time
+
+from app.config.settings import get_settings
+from app.config.log import configure_logging, get_logger
+from app.infrastructure.db.models import load_all_models
+from app.infrastructure.db.session import SessionLocal
+from app.infrastructure.repositories.campaign_repository_sqlalchemy import CampaignRepositorySQLAlchemy
+from app.core.use_cases.purge_campaigns import PurgeCampaigns
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+def run_once() -> bool:
+    """Borra un chunk de alguna campaña pendiente. Devuelve True si hubo trabajo."""
+    db = SessionLocal()
+    try:
+        repo = CampaignRepositorySQLAlchemy(db)
+        purge = PurgeCampaigns(repo, db.commit, db.rollback, settings.CAMPAIGN_PURGE_CHUNK_SIZE)
+        try:
+            return purge() is not None
+        except Exception:
+            db.rollback()
+            logger.exception("campaign_purge.error")
+            return False
+    finally:
+        db.close()
+
+def main() -> None:
+    configure_logging(settings)
+    load_all_models()
+    logger.info(
+        "campaign_purge.worker_started",
+        chunk_size=settings.CAMPAIGN_PURGE_CHUNK_SIZE, poll_seconds=settings.CAMPAIGN_PURGE_POLL_SECONDS,
+    )
+    while True:
+        if not run_once():
+            time.sleep(settings.CAMPAIGN_PURGE_POLL_SECONDS)
+
+if __name__ == "__main__":
+    main()
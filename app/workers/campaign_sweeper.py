@@ -0,0 +1,59 @@
+# backend/app/workers/campaign_sweeper.py
+# Ciclo de vida de campañas (activar/terminar) y liberación de leases vencidos.
+# Se corre como proceso aparte:
+#   python -m app.workers.campaign_sweeper
+# o, con CAMPAIGN_SWEEPER_ENABLED=true (por defecto false), como hilo de fondo de cada
+# proceso de la API.
+# Un advisory lock de Postgres garantiza que solo una instancia trabaje en cada pasada.
+import threading
+from typing import Dict, Optional
+
+from app.config.settings import get_settings
+from app.config.log import configure_logging, get_logger
+from app.infrastructure.db.advisory_lock import CAMPAIGN_SWEEPER_LOCK, try_advisory_lock
+from app.infrastructure.db.models import load_all_models
+from app.infrastructure.db.session import SessionLocal
+from app.infrastructure.repositories.campaign_repository_sqlalchemy import CampaignRepositorySQLAlchemy
+from app.infrastructure.repositories.campaign_contact_repository_sqlalchemy import CampaignContactRepositorySQLAlchemy
+from app.core.use_cases.sweep_campaigns import SweepCampaigns
+from app.security.auth import now_utc
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+def run_once() -> Optional[Dict[str, int]]:
+    """Una pasada. Devuelve los totales, o None si otra instancia tiene el lock."""
+    with try_advisory_lock(CAMPAIGN_SWEEPER_LOCK) as acquired:
+        if not acquired:
+            return None
+        db = SessionLocal()
+        try:
+            sweep = SweepCampaigns(
+                CampaignRepositorySQLAlchemy(db),
+                CampaignContactRepositorySQLAlchemy(db),
+                db.commit,
+                settings.CAMPAIGN_SWEEPER_BATCH_SIZE,
+            )
+            return sweep(now_utc())
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+def run_loop(stop: threading.Event) -> None:
+    """Loop del hilo de fondo de la API; termina cuando se activa `stop`."""
+    while not stop.wait(settings.CAMPAIGN_SWEEPER_INTERVAL_SECONDS):
+        try:
+            run_once()
+        except Exception:
+            logger.exception("campaign_sweep.error")
+
+def main() -> None:
+    configure_logging(settings)
+    load_all_models()
+    logger.info("campaign_sweep.worker_started", interval_seconds=settings.CAMPAIGN_SWEEPER_INTERVAL_SECONDS)
+    run_loop(threading.Event())
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+# backend/app/workers/contact_import_worker.py
+# Worker de importaciones de contactos. Ejecutar como proceso aparte:
+#   python -m app.workers.contact_import_worker
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Optional
+
+from app.config.settings import get_settings
+from app.config.log import configure_logging, get_logger
+from app.infrastructure.db.models import load_all_models
+from app.infrastructure.db.session import SessionLocal
+from app.infrastructure.repositories.campaign_repository_sqlalchemy import CampaignRepositorySQLAlchemy
+from app.infrastructure.repositories.campaign_contact_repository_sqlalchemy import CampaignContactRepositorySQLAlchemy
+from app.infrastructure.repositories.contact_import_job_repository_sqlalchemy import ContactImportJobRepositorySQLAlchemy
+from app.core.domain.phone import region_for_campaign
+from app.core.use_cases.enroll_contacts import EnrollContacts
+from app.core.use_cases.enroll_contacts_csv import EnrollContactsCSV
+from app.core.use_cases.run_contacts_import import RunContactsImport
+from app.core.use_cases.ensure_campaign_writable import EnsureCampaignWritable
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+def run_once(executor: Optional[Executor] = None) -> bool:
+    """
+    Procesa un job encolado si lo hay. Devuelve True si tomó alguno.
+    Con executor (IMPORT_VALIDATION_WORKERS > 1) el CSV se valida en ese pool de procesos.
+    """
+    db = SessionLocal()
+    try:
+        job_repo = ContactImportJobRepositorySQLAlchemy(db)
+        job = job_repo.claim_next()
+        db.commit()
+        if not job:
+            return False
+
+        logger.info("contact_import.started", job_id=job.job_id, campaign_id=job.campaign_id)
+        campaign_repo = CampaignRepositorySQLAlchemy(db)
+        campaign = campaign_repo.get(job.campaign_id)
+        region = region_for_campaign(campaign.timezone, campaign.config) if campaign else None
+        enroll_csv_uc = EnrollContactsCSV(EnrollContacts(CampaignContactRepositorySQLAlchemy(db), region))
+        try:
+            with open(job.file_path, "rb") as fh:
+                RunContactsImport(
+                    enroll_csv_uc, job_repo, db.commit, EnsureCampaignWritable(campaign_repo),
+                    executor, 2 * settings.IMPORT_VALIDATION_WORKERS,
+                )(job, fh, settings.CONTACTS_UPSERT_CHUNK_SIZE)
+        except Exception as ex:
+            # Los chunks ya confirmados se conservan; el job queda en Failed con el error
+            db.rollback()
+            logger.exception("contact_import.failed", job_id=job.job_id)
+            job_repo.finish(job.job_id, "Failed", str(ex))
+            db.commit()
+            return True
+
+        try:
+            os.remove(job.file_path)
+        except OSError:
+            logger.warning("contact_import.spool_cleanup_failed", job_id=job.job_id, path=job.file_path)
+        return True
+    finally:
+        db.close()
+
+def main() -> None:
+    configure_logging(settings)
+    load_all_models()
+    workers = settings.IMPORT_VALIDATION_WORKERS
+    logger.info(
+        "contact_import.worker_started",
+        poll_seconds=settings.IMPORT_WORKER_POLL_SECONDS, validation_workers=workers,
+    )
+    # El pool se crea en este proceso (no en la API) y vive lo que vive el worker
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        while True:
+            if not run_once(executor):
+                time.sleep(settings.IMPORT_WORKER_POLL_SECONDS)
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+if __name__ == "__main__":
+    main()
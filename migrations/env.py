@@ -0,0 +1,44 @@
+# backend/migrations/env.py
+from logging.config import fileConfig
+
+from alembic import context
+from sqlalchemy import create_engine, pool
+
+from app.config.settings import get_settings
+from app.infrastructure.db.base import Base
+from app.infrastructure.db.models import load_all_models
+
+config = context.config
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name)
+
+# Metadata completa (auth + callbot) para `alembic revision --autogenerate`
+load_all_models()
+target_metadata = Base.metadata
+
+def _url() -> str:
+    return config.get_main_option("sqlalchemy.url") or get_settings().DB_POSTGRESQL_URL
+
+def run_migrations_offline() -> None:
+    # alembic upgrade head --sql: genera el SQL sin conectarse
+    context.configure(
+        url=_url(),
+        target_metadata=target_metadata,
+        include_schemas=True,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+def run_migrations_online() -> None:
+    engine = create_engine(_url(), poolclass=pool.NullPool, future=True)
+    with engine.connect() as connection:
+        context.configure(connection=connection, target_metadata=target_metadata, include_schemas=True)
+        with context.begin_transaction():
+            context.run_migrations()
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
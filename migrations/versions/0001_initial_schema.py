@@ -0,0 +1,139 @@
+"""Esquema inicial: schemas auth/callbot, citext y las tablas de la versión base
+
+Solo las tablas que existían antes de las migraciones versionadas (auth, campaign_types,
+campaigns, campaign_contacts); lo agregado después va en 0002 en adelante. En una base
+ya creada a mano o con metadata.create_all de esa versión no se ejecuta: se marca con
+`alembic stamp 0001` y se sigue con `alembic upgrade head`.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+def upgrade() -> None:
+    op.execute("CREATE SCHEMA IF NOT EXISTS auth")
+    op.execute("CREATE SCHEMA IF NOT EXISTS callbot")
+    op.execute("CREATE EXTENSION IF NOT EXISTS citext")
+
+    # ---------- auth ----------
+    op.create_table(
+        "roles",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("name", sa.String(30), nullable=False, unique=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        schema="auth",
+    )
+    op.create_table(
+        "scopes",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("name", sa.String(60), nullable=False, unique=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        schema="auth",
+    )
+    op.create_table(
+        "users",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("username", sa.String(50), nullable=False),
+        sa.Column("email", postgresql.CITEXT()),
+        sa.Column("hashed_password", sa.String(), nullable=False),
+        sa.Column("is_active", sa.Boolean(), nullable=False),
+        sa.Column("must_change_pw", sa.Boolean(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        schema="auth",
+    )
+    op.create_index("ix_auth_users_username", "users", ["username"], unique=True, schema="auth")
+    op.create_index("ix_auth_users_email", "users", ["email"], unique=True, schema="auth")
+    op.create_table(
+        "role_scopes",
+        sa.Column("role_id", sa.Integer(), sa.ForeignKey("auth.roles.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("scope_id", sa.Integer(), sa.ForeignKey("auth.scopes.id", ondelete="CASCADE"), primary_key=True),
+        schema="auth",
+    )
+    op.create_table(
+        "user_roles",
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("auth.users.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("role_id", sa.Integer(), sa.ForeignKey("auth.roles.id", ondelete="CASCADE"), primary_key=True),
+        schema="auth",
+    )
+    op.create_table(
+        "refresh_tokens",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("auth.users.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("token_hash", sa.String(), nullable=False),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column("revoked_at", sa.DateTime(timezone=True)),
+        sa.UniqueConstraint("user_id", "token_hash", name="uq_user_token"),
+        schema="auth",
+    )
+    op.create_index("ix_auth_refresh_tokens_user_id", "refresh_tokens", ["user_id"], schema="auth")
+    op.create_table(
+        "revoked_access_tokens",
+        sa.Column("jti", postgresql.UUID(as_uuid=False), primary_key=True),
+        sa.Column("revoked_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        schema="auth",
+    )
+
+    # ---------- callbot ----------
+    op.create_table(
+        "campaign_types",
+        sa.Column("campaign_type_id", sa.Integer(), primary_key=True),
+        sa.Column("code", sa.String(50), nullable=False, unique=True),
+        sa.Column("name", sa.String(100), nullable=False),
+        sa.Column("description", sa.Text()),
+        schema="callbot",
+    )
+    op.create_table(
+        "campaigns",
+        sa.Column("campaign_id", sa.Integer(), primary_key=True),
+        sa.Column("name", sa.String(120), nullable=False, unique=True),
+        sa.Column("campaign_type_id", sa.Integer(), sa.ForeignKey("callbot.campaign_types.campaign_type_id"), nullable=False),
+        sa.Column("status", sa.String(20), nullable=False),
+        sa.Column("start_at", sa.TIMESTAMP(timezone=True), nullable=False),
+        sa.Column("end_at", sa.TIMESTAMP(timezone=True)),
+        sa.Column("window_start", sa.Time()),
+        sa.Column("window_end", sa.Time()),
+        sa.Column("max_attempts", sa.SmallInteger(), nullable=False),
+        sa.Column("retry_minutes", sa.Integer(), nullable=False),
+        sa.Column("timezone", sa.String(60), nullable=False),
+        sa.Column("config", sa.JSON(), nullable=False),
+        sa.Column("created_by", sa.String(80), nullable=False),
+        sa.Column("created_at", sa.TIMESTAMP(timezone=True), nullable=False),
+        schema="callbot",
+    )
+    op.create_table(
+        "campaign_contacts",
+        sa.Column("campaign_contact_id", sa.Integer(), primary_key=True),
+        sa.Column("campaign_id", sa.Integer(), sa.ForeignKey("callbot.campaigns.campaign_id", ondelete="CASCADE"), nullable=False),
+        sa.Column("phone", sa.String(25), nullable=False),
+        sa.Column("name", sa.String(120)),
+        sa.Column("attributes", sa.JSON(), nullable=False),
+        sa.Column("status", sa.String(20), nullable=False),
+        sa.Column("attempt_count", sa.SmallInteger(), nullable=False),
+        sa.Column("next_attempt_at", sa.TIMESTAMP(timezone=True)),
+        sa.Column("last_disposition", sa.String(60)),
+        sa.Column("last_error", sa.Text()),
+        sa.Column("notes", sa.Text()),
+        sa.Column("source_batch_id", sa.Integer()),
+        sa.Column("created_at", sa.TIMESTAMP(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.TIMESTAMP(timezone=True)),
+        sa.Column("created_by", sa.String(80), nullable=False),
+        schema="callbot",
+    )
+    op.create_index("ix_callbot_campaign_contacts_campaign_id", "campaign_contacts", ["campaign_id"], schema="callbot")
+
+def downgrade() -> None:
+    for table in ("campaign_contacts", "campaigns", "campaign_types"):
+        op.drop_table(table, schema="callbot")
+    for table in ("revoked_access_tokens", "refresh_tokens", "user_roles", "role_scopes", "users", "scopes", "roles"):
+        op.drop_table(table, schema="auth")
+    # Los schemas y la extensión quedan: pueden tener objetos ajenos a la aplicación
@@ -0,0 +1,110 @@
+"""Tablas, extensión e índices agregados sobre la versión base
+
+- contact_import_jobs: cola de importaciones asíncronas.
+- campaign_contact_stats: contadores de contactos por status, repartidos en shards
+  (CONTACT_STATS_SHARDS) que se suman al leer. Se recalculan desde los contactos ya
+  cargados, todo en el shard 0, como hace app.cli.reconcile_contact_stats.
+- campaign_dispatch_pacing: token bucket de /dispatch/lease.
+- pg_trgm y los índices de búsqueda de list(q=...) (trigramas y reverse(phone)),
+  construidos CONCURRENTLY para no bloquear escrituras sobre campaign_contacts.
+
+Todo con IF NOT EXISTS: una base creada con metadata.create_all desde estos modelos y
+marcada con `alembic stamp 0001` pasa por aquí sin errores.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18
+"""
+from alembic import context, op
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+_TABLES = (
+    """
+    CREATE TABLE IF NOT EXISTS callbot.contact_import_jobs (
+        job_id serial PRIMARY KEY,
+        campaign_id integer NOT NULL REFERENCES callbot.campaigns (campaign_id) ON DELETE CASCADE,
+        status varchar(20) NOT NULL,
+        file_path text NOT NULL,
+        rows_processed integer NOT NULL,
+        inserted integer NOT NULL,
+        updated integer NOT NULL,
+        rejected integer NOT NULL,
+        error text,
+        created_by varchar(80) NOT NULL,
+        created_at timestamptz NOT NULL,
+        started_at timestamptz,
+        finished_at timestamptz
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_callbot_contact_import_jobs_campaign_id "
+    "ON callbot.contact_import_jobs (campaign_id)",
+    "CREATE INDEX IF NOT EXISTS ix_callbot_contact_import_jobs_status ON callbot.contact_import_jobs (status)",
+    """
+    CREATE TABLE IF NOT EXISTS callbot.campaign_contact_stats (
+        campaign_id integer NOT NULL REFERENCES callbot.campaigns (campaign_id) ON DELETE CASCADE,
+        status varchar(20) NOT NULL,
+        shard smallint NOT NULL DEFAULT 0,
+        contacts integer NOT NULL,
+        PRIMARY KEY (campaign_id, status, shard)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS callbot.campaign_dispatch_pacing (
+        campaign_id integer PRIMARY KEY REFERENCES callbot.campaigns (campaign_id) ON DELETE CASCADE,
+        tokens double precision NOT NULL,
+        updated_at timestamptz NOT NULL
+    )
+    """,
+)
+
+# Contadores de los contactos ya cargados (no-op en una base vacía); reemplaza los que
+# hubiera (base creada con create_all) igual que el reconcile
+_BACKFILL_STATS = (
+    "DELETE FROM callbot.campaign_contact_stats",
+    """
+    INSERT INTO callbot.campaign_contact_stats (campaign_id, status, shard, contacts)
+    SELECT campaign_id, status, 0, count(*)
+    FROM callbot.campaign_contacts
+    GROUP BY campaign_id, status
+    """,
+)
+
+_SEARCH_INDEXES = {
+    "ix_campaign_contacts_name_trgm":
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_campaign_contacts_name_trgm "
+        "ON callbot.campaign_contacts USING gin (name gin_trgm_ops)",
+    "ix_campaign_contacts_phone_trgm":
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_campaign_contacts_phone_trgm "
+        "ON callbot.campaign_contacts USING gin (phone gin_trgm_ops)",
+    "ix_campaign_contacts_phone_reversed":
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_campaign_contacts_phone_reversed "
+        "ON callbot.campaign_contacts (campaign_id, reverse(phone) text_pattern_ops)",
+}
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for ddl in _TABLES:
+        op.execute(ddl)
+    for sql in _BACKFILL_STATS:
+        op.execute(sql)
+    with context.get_context().autocommit_block():
+        for name, ddl in _SEARCH_INDEXES.items():
+            # IF NOT EXISTS también saltaría un índice INVALID de un intento interrumpido
+            op.execute(
+                "DO $$ BEGIN IF EXISTS (SELECT 1 FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid "
+                f"WHERE c.relname = '{name}' AND NOT i.indisvalid) "
+                f"THEN DROP INDEX callbot.{name}; END IF; END $$"
+            )
+            op.execute(ddl)
+
+def downgrade() -> None:
+    with context.get_context().autocommit_block():
+        for name in _SEARCH_INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS callbot.{name}")
+    for table in ("campaign_dispatch_pacing", "campaign_contact_stats", "contact_import_jobs"):
+        op.execute(f"DROP TABLE IF EXISTS callbot.{table}")
+    # pg_trgm queda: puede tener objetos ajenos a la aplicación
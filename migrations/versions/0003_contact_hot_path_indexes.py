@@ -0,0 +1,113 @@
+"""Índices y constraint de campaign_contacts para los caminos calientes
+
+- UNIQUE(campaign_id, phone): árbitro de los ON CONFLICT de upsert/bulk_upsert/bulk_import.
+  Se construye el índice CONCURRENTLY y se promueve a constraint con USING INDEX
+  (solo un lock breve). Si hay teléfonos duplicados la migración se detiene antes.
+- (campaign_id, campaign_contact_id DESC): list() con keyset.
+- (campaign_id, status, next_attempt_at): filtros por status.
+- Parcial WHERE status = 'Pending' sobre (campaign_id, coalesce(next_attempt_at, -inf), id):
+  lease de /dispatch/lease.
+- Parcial WHERE status = 'Dialing' sobre next_attempt_at: leases vencidos del sweeper.
+- Se elimina ix_callbot_campaign_contacts_campaign_id: los compuestos lo cubren.
+
+Todos los CREATE/DROP INDEX van CONCURRENTLY (fuera de transacción): la tabla sigue
+aceptando escrituras. Un build fallido deja un índice INVALID; al reintentar se
+elimina y se vuelve a construir. Verificación: python -m app.cli.explain_hot_paths.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18
+"""
+from alembic import context, op
+import sqlalchemy as sa
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+_TABLE = "callbot.campaign_contacts"
+_UNIQUE = "uq_campaign_contacts_campaign_phone"
+
+_INDEXES = {
+    _UNIQUE: f"CREATE UNIQUE INDEX CONCURRENTLY {_UNIQUE} ON {_TABLE} (campaign_id, phone)",
+    "ix_campaign_contacts_campaign_id_desc":
+        f"CREATE INDEX CONCURRENTLY ix_campaign_contacts_campaign_id_desc ON {_TABLE} "
+        "(campaign_id, campaign_contact_id DESC)",
+    "ix_campaign_contacts_campaign_status_next":
+        f"CREATE INDEX CONCURRENTLY ix_campaign_contacts_campaign_status_next ON {_TABLE} "
+        "(campaign_id, status, next_attempt_at)",
+    "ix_campaign_contacts_due":
+        f"CREATE INDEX CONCURRENTLY ix_campaign_contacts_due ON {_TABLE} "
+        "(campaign_id, (coalesce(next_attempt_at, '-infinity'::timestamptz)), campaign_contact_id) "
+        "WHERE status = 'Pending'",
+    "ix_campaign_contacts_dialing_lease":
+        f"CREATE INDEX CONCURRENTLY ix_campaign_contacts_dialing_lease ON {_TABLE} (next_attempt_at) "
+        "WHERE status = 'Dialing'",
+}
+
+_OLD_INDEX = "ix_callbot_campaign_contacts_campaign_id"
+
+def _index_state(name: str):
+    """None si no existe; True/False según pg_index.indisvalid."""
+    return op.get_bind().execute(
+        sa.text(
+            "SELECT i.indisvalid FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid "
+            "JOIN pg_namespace n ON n.oid = c.relnamespace "
+            "WHERE n.nspname = 'callbot' AND c.relname = :name"
+        ),
+        {"name": name},
+    ).scalar()
+
+def _create_concurrently(name: str, ddl: str) -> None:
+    if not context.is_offline_mode():
+        valid = _index_state(name)
+        if valid:
+            return
+        if valid is False:
+            # Resto de un CONCURRENTLY interrumpido: no sirve ni se mantiene bien
+            op.execute(f"DROP INDEX CONCURRENTLY callbot.{name}")
+    op.execute(ddl)
+
+def _check_duplicate_phones() -> None:
+    if context.is_offline_mode():
+        return
+    dupes = op.get_bind().execute(sa.text(
+        f"SELECT campaign_id, phone, count(*) FROM {_TABLE} "
+        "GROUP BY campaign_id, phone HAVING count(*) > 1 LIMIT 5"
+    )).all()
+    if dupes:
+        sample = ", ".join(f"campaign {c} phone {p} x{n}" for c, p, n in dupes)
+        raise RuntimeError(
+            f"callbot.campaign_contacts has duplicated (campaign_id, phone) rows ({sample}); "
+            "merge or delete them before adding the unique constraint"
+        )
+
+def _has_unique_constraint() -> bool:
+    if context.is_offline_mode():
+        return False
+    return op.get_bind().execute(
+        sa.text("SELECT 1 FROM pg_constraint WHERE conname = :name AND conrelid = CAST(:table AS regclass)"),
+        {"name": _UNIQUE, "table": _TABLE},
+    ).scalar() is not None
+
+def upgrade() -> None:
+    if not _has_unique_constraint():
+        _check_duplicate_phones()
+    with context.get_context().autocommit_block():
+        for name, ddl in _INDEXES.items():
+            _create_concurrently(name, ddl)
+    if not _has_unique_constraint():
+        op.execute(f"ALTER TABLE {_TABLE} ADD CONSTRAINT {_UNIQUE} UNIQUE USING INDEX {_UNIQUE}")
+    with context.get_context().autocommit_block():
+        op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS callbot.{_OLD_INDEX}")
+
+def downgrade() -> None:
+    with context.get_context().autocommit_block():
+        op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {_OLD_INDEX} ON {_TABLE} (campaign_id)")
+    # El índice del constraint se elimina con él
+    op.execute(f"ALTER TABLE {_TABLE} DROP CONSTRAINT IF EXISTS {_UNIQUE}")
+    with context.get_context().autocommit_block():
+        for name in _INDEXES:
+            if name != _UNIQUE:
+                op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS callbot.{name}")
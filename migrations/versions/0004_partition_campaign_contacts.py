@@ -0,0 +1,24 @@
+"""campaign_contacts particionada por campaña: sin cambios de esquema
+
+La conversión no depende del entorno al migrar: se corre de forma explícita, en una
+ventana de mantenimiento, con `python -m app.cli.partition_campaign_contacts [--revert]`
+(ver app.infrastructure.db.partitioning.convert_contacts_table).
+
+La revisión se conserva para las bases que ya están en 0004. Las que la corrieron con
+CONTACTS_PARTITIONING=true quedaron particionadas: para bajar de aquí, antes --revert.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18
+"""
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+def upgrade() -> None:
+    pass
+
+def downgrade() -> None:
+    pass
@@ -0,0 +1,126 @@
+# backend/tests/conftest.py
+"""
+Fixtures de base de datos para los tests de repositorios.
+
+- Corren contra un PostgreSQL real y desechable: TEST_DB_POSTGRESQL_URL se migra a head
+  y se vacía (TRUNCATE de las campañas) al empezar la sesión. Sin esa variable, o si la
+  base no responde, los tests que la usan se saltan.
+- TEST_SEED_CONTACTS fija los contactos de la campaña sembrada (por defecto 20000). Los
+  conteos de sentencias y filas no dependen de ese tamaño: TEST_SEED_CONTACTS=1000000
+  corre los mismos tests a escala de producción.
+- Cada test usa su propia sesión y todo lo que escribe se revierte al terminar.
+"""
+import os
+from dataclasses import dataclass
+from datetime import timedelta
+from pathlib import Path
+
+import pytest
+
+TEST_DB_URL = os.getenv("TEST_DB_POSTGRESQL_URL")
+if TEST_DB_URL:
+    # Antes de importar app.infrastructure.db.session, que crea el engine con esta URL
+    os.environ["DB_POSTGRESQL_URL"] = TEST_DB_URL
+
+ROOT = Path(__file__).resolve().parents[1]
+
+_SEED_CONTACTS = """
+    INSERT INTO callbot.campaign_contacts
+        (campaign_id, phone, attributes, status, attempt_count, created_at, created_by)
+    SELECT :campaign_id, :prefix || lpad(g::text, 8, '0'), '{}', 'Pending', 0, now(), 'tests'
+    FROM generate_series(1, :n) AS g
+"""
+
+_SEED_STATS = """
+    INSERT INTO callbot.campaign_contact_stats (campaign_id, status, shard, contacts)
+    SELECT campaign_id, status, 0, count(*) FROM callbot.campaign_contacts GROUP BY campaign_id, status
+"""
+
+@dataclass(frozen=True)
+class Seed:
+    campaign_id: int        # TEST_SEED_CONTACTS contactos Pending, despachable
+    sibling_id: int         # mismo tipo de campaña, con contactos propios
+    empty_id: int           # sin contactos
+    contacts: int
+    first_contact_id: int
+    phone_prefix: str
+
+    def phone(self, n: int) -> str:
+        """Teléfono del n-ésimo contacto sembrado de campaign_id (1..contacts)."""
+        return f"{self.phone_prefix}{n:08d}"
+
+@pytest.fixture(scope="session")
+def engine():
+    if not TEST_DB_URL:
+        pytest.skip("TEST_DB_POSTGRESQL_URL no está definida")
+    from sqlalchemy import text
+    from sqlalchemy.exc import OperationalError
+    from app.infrastructure.db.session import engine
+
+    try:
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+    except OperationalError as ex:
+        pytest.skip(f"base de tests inaccesible: {ex.orig}")
+
+    from alembic import command
+    from alembic.config import Config
+
+    config = Config(str(ROOT / "alembic.ini"))
+    config.set_main_option("script_location", str(ROOT / "migrations"))
+    command.upgrade(config, "head")
+    return engine
+
+@pytest.fixture(scope="session")
+def seed(engine) -> Seed:
+    from sqlalchemy import text
+    from app.infrastructure.db.models import load_all_models
+    from app.infrastructure.db.session import SessionLocal
+    from app.infrastructure.repositories.campaign_repository_sqlalchemy import CampaignRepositorySQLAlchemy
+    from app.security.auth import now_utc
+
+    load_all_models()
+    contacts = int(os.getenv("TEST_SEED_CONTACTS", "20000"))
+    prefix = "+5939"
+    with engine.begin() as conn:
+        conn.execute(text("TRUNCATE callbot.campaign_types, callbot.campaigns CASCADE"))
+        conn.execute(text("INSERT INTO callbot.campaign_types (campaign_type_id, code, name) VALUES (1, 'out', 'Outbound')"))
+
+    db = SessionLocal()
+    try:
+        # create() también crea la partición con CONTACTS_PARTITIONING
+        repo = CampaignRepositorySQLAlchemy(db)
+        ids = [
+            repo.create({
+                "name": name, "campaign_type_id": 1, "status": "Active",
+                "start_at": now_utc() - timedelta(days=1), "created_by": "tests",
+            }).campaign_id
+            for name in ("seeded", "sibling", "empty")
+        ]
+        db.commit()
+    finally:
+        db.close()
+
+    campaign_id, sibling_id, empty_id = ids
+    with engine.begin() as conn:
+        conn.execute(text(_SEED_CONTACTS), {"campaign_id": campaign_id, "prefix": prefix, "n": contacts})
+        conn.execute(text(_SEED_CONTACTS), {"campaign_id": sibling_id, "prefix": prefix, "n": 1000})
+        conn.execute(text(_SEED_STATS))
+        first = conn.execute(
+            text("SELECT min(campaign_contact_id) FROM callbot.campaign_contacts WHERE campaign_id = :c"),
+            {"c": campaign_id},
+        ).scalar()
+    with engine.connect() as conn:
+        conn.execution_options(isolation_level="AUTOCOMMIT").execute(text("ANALYZE callbot.campaign_contacts"))
+    return Seed(campaign_id, sibling_id, empty_id, contacts, first, prefix)
+
+@pytest.fixture
+def db(seed):
+    from app.infrastructure.db.session import SessionLocal
+
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.rollback()
+        session.close()
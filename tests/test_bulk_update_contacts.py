@@ -0,0 +1,46 @@
+# backend/tests/test_bulk_update_contacts.py
+"""
+BulkUpdateContacts bajo concurrencia: una fila del primer tramo cambia (y deja de cumplir
+el filtro) mientras el UPDATE espera su lock. En READ COMMITTED esa fila queda fuera del
+chunk, pero el recorrido no debe terminar antes de tiempo.
+"""
+import threading
+import time
+
+from sqlalchemy import text
+
+from app.core.use_cases.bulk_update_contacts import BulkUpdateContacts
+from app.infrastructure.repositories.campaign_contact_repository_sqlalchemy import CampaignContactRepositorySQLAlchemy
+
+_SET_STATUS = "UPDATE callbot.campaign_contacts SET status = :status WHERE campaign_id = :c AND phone = :p"
+
+_WAITING = """
+    SELECT count(*) FROM pg_stat_activity
+    WHERE datname = current_database() AND wait_event_type = 'Lock' AND pid <> pg_backend_pid()
+"""
+
+def test_row_changed_while_waiting_for_its_lock_does_not_stop_the_scan(engine, db, seed):
+    phones = [seed.phone(i) for i in range(1, 26)]
+    use_case = BulkUpdateContacts(CampaignContactRepositorySQLAlchemy(db), commit=lambda: None)
+    result = {}
+
+    blocker = engine.connect()
+    try:
+        blocker.execute(text(_SET_STATUS), {"status": "Finished", "c": seed.campaign_id, "p": seed.phone(1)})
+        worker = threading.Thread(target=lambda: result.update(use_case(
+            seed.campaign_id, {"status": ["Pending"], "phones": phones}, {"status": "Excluded"}, chunk_size=10,
+        )))
+        worker.start()
+        deadline = time.monotonic() + 10
+        with engine.connect() as probe:
+            while not probe.execute(text(_WAITING)).scalar() and time.monotonic() < deadline:
+                time.sleep(0.05)
+        blocker.commit()
+        worker.join(10)
+    finally:
+        blocker.execute(text(_SET_STATUS), {"status": "Pending", "c": seed.campaign_id, "p": seed.phone(1)})
+        blocker.commit()
+        blocker.close()
+
+    # Tramos de 10, 10 y 5 recorridos; el primero actualiza 9
+    assert result == {"updated": 24, "chunks": 3}
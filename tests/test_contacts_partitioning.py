@@ -0,0 +1,39 @@
+# backend/tests/test_contacts_partitioning.py
+"""
+Conversión de campaign_contacts (app.cli.partition_campaign_contacts) ida y vuelta sobre
+la base sembrada. El DDL es transaccional: el rollback del fixture db deja la tabla como
+estaba, sea cual sea su estado inicial.
+"""
+from sqlalchemy import text
+
+from app.infrastructure.db.partitioning import contacts_partitioned, convert_contacts_table, partition_name
+
+_INDEXES = """
+    SELECT count(*) FROM pg_indexes
+    WHERE schemaname = 'callbot' AND tablename = 'campaign_contacts'
+"""
+
+def _count(db, campaign_id):
+    return db.scalar(
+        text("SELECT count(*) FROM callbot.campaign_contacts WHERE campaign_id = :c"), {"c": campaign_id}
+    )
+
+def test_convert_round_trip_keeps_rows_and_indexes(db, seed):
+    initial = contacts_partitioned(db)
+    indexes = db.scalar(text(_INDEXES))
+
+    for partitioned in (not initial, initial):
+        convert_contacts_table(db, partitioned)
+        assert contacts_partitioned(db) is partitioned
+        assert _count(db, seed.campaign_id) == seed.contacts
+        assert _count(db, seed.sibling_id) == 1000
+        assert db.scalar(text(_INDEXES)) == indexes
+        if partitioned:
+            # Una partición por campaña con sus filas; la DEFAULT queda vacía
+            partition = f"callbot.{partition_name(seed.campaign_id)}"
+            assert db.scalar(text(f"SELECT count(*) FROM {partition}")) == seed.contacts
+            assert db.scalar(text("SELECT count(*) FROM callbot.campaign_contacts_default")) == 0
+
+    # La secuencia sigue siendo la de la tabla
+    next_id = db.scalar(text("SELECT nextval('callbot.campaign_contacts_campaign_contact_id_seq')"))
+    assert next_id > db.scalar(text("SELECT max(campaign_contact_id) FROM callbot.campaign_contacts"))
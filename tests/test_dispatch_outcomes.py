@@ -0,0 +1,48 @@
+# backend/tests/test_dispatch_outcomes.py
+"""Resultados de llamadas contra el lease vigente del contacto (ReportOutcomes / apply_outcomes)."""
+from datetime import timedelta
+
+from app.core.use_cases.report_outcomes import ReportOutcomes
+from app.infrastructure.repositories.campaign_contact_repository_sqlalchemy import CampaignContactRepositorySQLAlchemy
+from app.infrastructure.repositories.campaign_repository_sqlalchemy import CampaignRepositorySQLAlchemy
+from app.security.auth import now_utc
+
+def _outcome(contact_id, lease_expires_at, **extra):
+    return {"campaign_contact_id": contact_id, "lease_expires_at": lease_expires_at, "final": True, **extra}
+
+def test_stale_report_is_not_applied_to_a_re_leased_contact(db, seed):
+    contacts = CampaignContactRepositorySQLAlchemy(db)
+    report = ReportOutcomes(CampaignRepositorySQLAlchemy(db), contacts)
+    contact_id = seed.first_contact_id
+
+    # Lease A vence sin reporte, el sweeper lo libera y el contacto se vuelve a entregar (lease B)
+    now = now_utc()
+    lease_a = now + timedelta(minutes=5)
+    assert [c.campaign_contact_id for c in contacts.lease_ids(seed.campaign_id, [contact_id], 3, now, lease_a)] == [contact_id]
+    later = lease_a + timedelta(seconds=1)
+    assert contacts.release_expired_leases(later, 100) == {seed.campaign_id: 1}
+    lease_b = later + timedelta(minutes=5)
+    assert [c.campaign_contact_id for c in contacts.lease_ids(seed.campaign_id, [contact_id], 3, later, lease_b)] == [contact_id]
+
+    # El reporte tardío de A no toca la llamada de B
+    result = report(seed.campaign_id, [_outcome(contact_id, lease_a, disposition="late")], later)
+    assert result == {"applied": 0, "statuses": {}, "ignored": [contact_id]}
+    contact = contacts.get(contact_id)
+    assert (contact.status, contact.attempt_count, contact.last_disposition) == ("Dialing", 0, None)
+    assert contact.next_attempt_at == lease_b
+
+    result = report(seed.campaign_id, [_outcome(contact_id, lease_b, disposition="answered")], later)
+    assert result == {"applied": 1, "statuses": {"Finished": 1}, "ignored": []}
+    contact = contacts.get(contact_id)
+    assert (contact.status, contact.attempt_count, contact.last_disposition) == ("Finished", 1, "answered")
+
+def test_duplicate_report_is_ignored(db, seed):
+    contacts = CampaignContactRepositorySQLAlchemy(db)
+    now = now_utc()
+    lease_until = now + timedelta(minutes=5)
+    [leased] = contacts.lease_ids(seed.campaign_id, [seed.first_contact_id], 3, now, lease_until)
+    outcome = _outcome(leased.campaign_contact_id, lease_until, final=False, disposition="no_answer")
+
+    assert contacts.apply_outcomes(seed.campaign_id, [outcome], 3, lease_until, now) == {leased.campaign_contact_id: "Pending"}
+    # Ya no está en Dialing con ese lease
+    assert contacts.apply_outcomes(seed.campaign_id, [outcome], 3, lease_until, now) == {}
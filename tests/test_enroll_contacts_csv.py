@@ -0,0 +1,71 @@
+# backend/tests/test_enroll_contacts_csv.py
+"""
+Validación del CSV en streaming (EnrollContactsCSV.clean_file_chunks), sin base de datos:
+el camino con pool de procesos del worker de importaciones produce lo mismo que el serial.
+"""
+import csv
+import io
+import json
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from app.core.domain.errors import ValidationError
+from app.core.use_cases.enroll_contacts import EnrollContacts
+from app.core.use_cases.enroll_contacts_csv import EnrollContactsCSV
+
+def _csv(rows) -> bytes:
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    writer.writerow(["phone", "name", "attributes"])
+    writer.writerows(rows)
+    return buf.getvalue().encode("utf-8")
+
+ROWS = [
+    ("0991234567", "Línea\nsegunda línea", json.dumps({"nota": "a,b\nc"})),
+    ("+593991234568", "Dos", ""),
+    ("abc", "teléfono inválido", ""),
+    ("+593991234567", "duplicado del primero (otro tramo)", ""),
+    ("", "sin phone", ""),
+    ("+593991234569", "attributes no objeto", "[1, 2]"),
+    ("+593991234570", '"comillas"\n\ny saltos', ""),
+]
+
+def _run(data: bytes, executor=None, chunk_size: int = 2):
+    uc = EnrollContactsCSV(EnrollContacts(None, "EC"))
+    rejected = []
+    chunks = list(uc.clean_file_chunks(
+        io.BytesIO(data), "tests", chunk_size, lambda idx, ex: rejected.append((idx, str(ex))), executor,
+    ))
+    return chunks, rejected
+
+@pytest.fixture(scope="module")
+def pool():
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        yield executor
+
+def test_pool_matches_serial_with_quoted_newlines(pool):
+    data = _csv(ROWS)
+    serial, serial_rejected = _run(data)
+    parallel, parallel_rejected = _run(data, pool)
+
+    items = [item for _, chunk in parallel for item in chunk]
+    assert items == [item for _, chunk in serial for item in chunk]
+    assert parallel_rejected == serial_rejected == [
+        (3, "Item 3: invalid phone format 'abc'"),
+        (6, "Item 6: 'attributes' must be an object"),
+    ]
+    assert [i["phone"] for i in items] == ["+593991234567", "+593991234568", "+593991234570"]
+    assert items[0]["name"] == "Línea\nsegunda línea"
+    assert items[0]["attributes"]["nota"] == "a,b\nc"
+    assert items[2]["name"] == '"comillas"\n\ny saltos'
+    # Un chunk por tramo de chunk_size registros (no líneas); el último informa el total
+    assert [read for read, _ in parallel] == [2, 4, 6, 7]
+
+def test_pool_without_on_reject_raises_first_error(pool):
+    uc = EnrollContactsCSV(EnrollContacts(None, "EC"))
+    with pytest.raises(ValidationError, match="Item 3: invalid phone format"):
+        list(uc.clean_file_chunks(io.BytesIO(_csv(ROWS)), "tests", 2, None, pool))
+
+def test_pool_empty_file_yields_one_empty_chunk(pool):
+    assert _run(_csv([]), pool) == ([(0, [])], [])
@@ -0,0 +1,56 @@
+# backend/tests/test_query_stats.py
+"""Contador de SQL (query_stats): detector de N+1, modo estricto y Server-Timing por request."""
+import pytest
+
+from app.infrastructure.db import query_stats
+from app.infrastructure.db.query_stats import QueryBudgetExceeded
+from app.infrastructure.repositories.campaign_contact_repository_sqlalchemy import CampaignContactRepositorySQLAlchemy
+
+def test_repeated_statement_is_flagged_with_its_caller(db, seed):
+    repo = CampaignContactRepositorySQLAlchemy(db)
+    with query_stats.track(budget=100, n_plus_one_threshold=3) as stats:
+        # Un get por contacto: el mismo SELECT con otro id, el N+1 típico
+        for contact_id in range(seed.first_contact_id, seed.first_contact_id + 3):
+            repo.get(contact_id)
+
+    assert stats.statements == 3
+    [(statement, caller)] = stats.n_plus_one.items()
+    assert caller == "CampaignContactRepositorySQLAlchemy.get"
+    assert stats.by_statement[statement] == 3
+
+def test_below_threshold_is_not_flagged(db, seed):
+    repo = CampaignContactRepositorySQLAlchemy(db)
+    with query_stats.track(budget=100, n_plus_one_threshold=3) as stats:
+        repo.get(seed.first_contact_id)
+        repo.get(seed.first_contact_id + 1)
+    assert stats.n_plus_one == {}
+
+def test_strict_mode_raises_on_the_statement_over_budget(db, seed):
+    repo = CampaignContactRepositorySQLAlchemy(db)
+    with pytest.raises(QueryBudgetExceeded, match="3 > 2"):
+        with query_stats.track(budget=2, strict=True) as stats:
+            for contact_id in range(seed.first_contact_id, seed.first_contact_id + 5):
+                repo.get(contact_id)
+    # Corta en la sentencia que excede, no al cerrar el track
+    assert stats.statements == 3
+
+def test_non_strict_mode_only_reports(db, seed):
+    repo = CampaignContactRepositorySQLAlchemy(db)
+    with query_stats.track(budget=2, strict=False) as stats:
+        for contact_id in range(seed.first_contact_id, seed.first_contact_id + 3):
+            repo.get(contact_id)
+    assert stats.over_budget
+    assert stats.statements == 3
+
+def test_request_gets_server_timing(seed):
+    from fastapi.testclient import TestClient
+    from app.main import app
+    from app.security.auth import create_access_token
+
+    token = create_access_token("tests", ["campaigns:read"])
+    response = TestClient(app).get(
+        f"/campaigns/list/{seed.campaign_id}", headers={"Authorization": f"Bearer {token}"},
+    )
+    assert response.status_code == 200
+    assert response.headers["Server-Timing"].startswith("db;dur=")
+    assert 'desc="1 queries, 1 rows"' in response.headers["Server-Timing"]
@@ -0,0 +1,105 @@
+# backend/tests/test_repository_query_counts.py
+"""
+Sentencias y filas por método de repositorio sobre la base sembrada (ver conftest).
+
+Los números no dependen del tamaño de la campaña: una relación que vuelva a cargarse por
+defecto (contactos de la campaña, campañas del tipo) o una consulta por fila los rompe, y
+con strict=True el error apunta a la sentencia que sobra. Las filas son las que informa
+el driver (devueltas por un SELECT/RETURNING o afectadas por un UPDATE/DELETE).
+"""
+from datetime import timedelta
+from typing import Any, Callable
+
+import pytest
+
+from app.infrastructure.db import query_stats
+from app.infrastructure.repositories.campaign_contact_repository_sqlalchemy import CampaignContactRepositorySQLAlchemy
+from app.infrastructure.repositories.campaign_repository_sqlalchemy import CampaignRepositorySQLAlchemy
+from app.security.auth import now_utc
+
+def _measure(call: Callable[[], Any], statements: int) -> query_stats.QueryStats:
+    with query_stats.track(budget=statements, strict=True) as stats:
+        call()
+    return stats
+
+def _lease_window():
+    now = now_utc()
+    return now, now + timedelta(minutes=5)
+
+# (método, llamada, sentencias, filas)
+CAMPAIGN_CASES = [
+    ("get", lambda r, s: r.get(s.campaign_id), 1, 1),
+    ("list", lambda r, s: r.list(None, 50, 0), 1, 3),
+    # UPDATE + relectura de la fila
+    ("update", lambda r, s: r.update(s.campaign_id, {"retry_minutes": 45}), 2, 2),
+    ("delete_empty", lambda r, s: r.delete(s.empty_id), 2, 2),
+    # ON DELETE CASCADE en la base: la colección de contactos nunca se carga
+    ("delete_with_contacts", lambda r, s: r.delete(s.campaign_id), 2, 2),
+]
+
+CONTACT_CASES = [
+    ("get", lambda r, s: r.get(s.first_contact_id), 1, 1),
+    ("get_by_phone", lambda r, s: r.get_by_phone(s.campaign_id, s.phone(1)), 1, 1),
+    ("existing_phones",
+     lambda r, s: r.existing_phones(s.campaign_id, [s.phone(1), s.phone(2), s.phone(3), "+593000000000"]), 1, 3),
+    ("list", lambda r, s: r.list(s.campaign_id, None, None, 50, 0), 1, 50),
+    ("list_keyset", lambda r, s: r.list(s.campaign_id, None, "Pending", 50, 0, after=s.first_contact_id + 100), 1, 50),
+    # Filas por cursor de servidor: el driver no informa rowcount
+    ("iter_rows", lambda r, s: sum(1 for _ in r.iter_rows(s.campaign_id, None, None, 1000)), 1, 0),
+    # Existe + INSERT + relectura + contador por status
+    ("create", lambda r, s: r.create(s.campaign_id, {"phone": "+593987654321", "created_by": "tests"}), 4, 3),
+    ("upsert_existing", lambda r, s: r.upsert(s.campaign_id, {"phone": s.phone(1), "name": "x"}), 3, 3),
+    # Status previos (5) + INSERT ... ON CONFLICT (10) + contadores (1)
+    ("bulk_upsert",
+     lambda r, s: r.bulk_upsert(
+         s.campaign_id,
+         [{"phone": s.phone(i)} for i in range(1, 6)] + [{"phone": f"+5932200000{i}"} for i in range(5)],
+     ), 3, 16),
+    # UPDATE de 100 filas + contadores Pending/Paused
+    ("bulk_update",
+     lambda r, s: r.bulk_update(s.campaign_id, {"status": ["Pending"]}, {"status": "Paused"}, 0, 100), 2, 102),
+    ("update", lambda r, s: r.update(s.first_contact_id, {"notes": "x"}), 3, 3),
+    ("delete", lambda r, s: r.delete(s.first_contact_id), 3, 3),
+    # UPDATE ... RETURNING de 50 + contadores Pending/Dialing
+    ("lease_due", lambda r, s: r.lease_due(s.campaign_id, 50, 3, *_lease_window()), 2, 52),
+    ("lease_ids",
+     lambda r, s: r.lease_ids(s.campaign_id, list(range(s.first_contact_id, s.first_contact_id + 50)), 3, *_lease_window()),
+     2, 52),
+    ("due_page", lambda r, s: r.due_page(s.campaign_id, 0, 100), 1, 100),
+    ("pending_among",
+     lambda r, s: r.pending_among(s.campaign_id, list(range(s.first_contact_id, s.first_contact_id + 50)), 3), 1, 50),
+    # Marca + cambios (ninguno desde una marca recién tomada)
+    ("changes_since", lambda r, s: r.changes_since(s.campaign_id, 2**62), 2, 1),
+    ("release_expired_leases", lambda r, s: r.release_expired_leases(now_utc(), 100), 1, 0),
+]
+
+@pytest.mark.parametrize(
+    "call, statements, rows", [c[1:] for c in CAMPAIGN_CASES], ids=[c[0] for c in CAMPAIGN_CASES],
+)
+def test_campaign_repository_counts(db, seed, call, statements, rows):
+    repo = CampaignRepositorySQLAlchemy(db)
+    stats = _measure(lambda: call(repo, seed), statements)
+    assert (stats.statements, stats.rows) == (statements, rows)
+    assert not stats.n_plus_one
+
+@pytest.mark.parametrize(
+    "call, statements, rows", [c[1:] for c in CONTACT_CASES], ids=[c[0] for c in CONTACT_CASES],
+)
+def test_contact_repository_counts(db, seed, call, statements, rows):
+    repo = CampaignContactRepositorySQLAlchemy(db)
+    stats = _measure(lambda: call(repo, seed), statements)
+    assert (stats.statements, stats.rows) == (statements, rows)
+    assert not stats.n_plus_one
+
+def test_apply_outcomes_counts(db, seed):
+    repo = CampaignContactRepositorySQLAlchemy(db)
+    now, lease_until = _lease_window()
+    leased = repo.lease_due(seed.campaign_id, 10, 3, now, lease_until)
+    outcomes = [
+        {"campaign_contact_id": c.campaign_contact_id, "lease_expires_at": lease_until,
+         "disposition": "answered", "final": i % 2 == 0}
+        for i, c in enumerate(leased)
+    ]
+    # Un UPDATE para todo el lote (10) + contadores Dialing/Finished/Pending
+    stats = _measure(lambda: repo.apply_outcomes(seed.campaign_id, outcomes, 3, lease_until, now), 2)
+    assert (stats.statements, stats.rows) == (2, 13)